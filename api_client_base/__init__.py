@@ -5,3 +5,9 @@ from api_client_base.implementations.logicmonitor import (
 from api_client_base.implementations.basic_token import (
     BasicTokenClient as api_basic_token,
 )
+from api_client_base.implementations.async_logicmonitor import (
+    AsyncLogicMonitorClient as api_logicmonitor_async,
+)
+from api_client_base.implementations.async_basic_token import (
+    AsyncBasicTokenClient as api_basic_token_async,
+)
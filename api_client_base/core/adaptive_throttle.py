@@ -0,0 +1,225 @@
+import threading
+import time
+from typing import Union
+
+
+class AdaptiveThrottle:
+    """
+    Adaptive throttle driven by the rate limit headers returned by the API.
+
+    The limit, remaining and window headers of every response are tracked per endpoint family
+    (the method and the first path segments, e.g. "GET device/devices"). While plenty of the budget is left
+    requests are sent at full speed; once remaining drops below slow_down_at of the limit, requests are spread
+    evenly over the window so the budget is not exhausted, and speed up again when the window resets.
+
+    Threads sharing a throttle reserve their request under a lock before sleeping: requests sent but not answered
+    yet count against the remaining budget, and every paced request is scheduled an interval after the previous
+    one, so callers waiting at the same time are spaced out instead of firing together.
+    """
+
+    def __init__(
+        self,
+        limit_header: str = "X-Rate-Limit-Limit",
+        remaining_header: str = "X-Rate-Limit-Remaining",
+        window_header: str = "X-Rate-Limit-Window",
+        family_segments: int = 2,
+        slow_down_at: float = 0.5,
+        max_delay: Union[float, None] = None,
+    ):
+        """
+        Initializes the AdaptiveThrottle.
+
+        Args:
+            limit_header (str, optional): The header holding the request limit per window. Defaults to "X-Rate-Limit-Limit".
+            remaining_header (str, optional): The header holding the requests left in the window.
+                Defaults to "X-Rate-Limit-Remaining".
+            window_header (str, optional): The header holding the window length in seconds. Defaults to "X-Rate-Limit-Window".
+            family_segments (int, optional): The number of path segments identifying an endpoint family. Defaults to 2.
+            slow_down_at (float, optional): The fraction of the limit left at which pacing starts. Defaults to 0.5.
+            max_delay (Union[float, None], optional): The maximum delay before a request in seconds.
+                Defaults to None (at most one window).
+        """
+        self.limit_header = limit_header
+        self.remaining_header = remaining_header
+        self.window_header = window_header
+        self.family_segments = family_segments
+        self.slow_down_at = slow_down_at
+        self.max_delay = max_delay
+        self._budgets = {}
+        self._in_flight = {}  # endpoint family: requests reserved and not answered yet
+        self._lock = threading.Lock()
+
+    def get_family(self, method: str, path: str) -> str:
+        """
+        Builds the endpoint family for a request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+
+        Returns:
+            str: The endpoint family, e.g. "GET device/devices".
+        """
+        segments = path.split("?")[0].strip("/").split("/")
+        return f"{method.upper()} {'/'.join(segments[: self.family_segments])}"
+
+    def observe(self, method: str, path: str, headers) -> None:
+        """
+        Records the rate limit headers of a response.
+        Responses without the headers are ignored.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+            headers: The response headers.
+        """
+        # the response answers one of the requests reserved
+        self.release(method, path)
+        family = self.get_family(method, path)
+        try:
+            limit = int(headers[self.limit_header])
+            remaining = int(headers[self.remaining_header])
+            window = float(headers[self.window_header])
+        except (KeyError, TypeError, ValueError):
+            return
+        with self._lock:
+            previous = self._budgets.get(family)
+            self._budgets[family] = {
+                "limit": limit,
+                "remaining": remaining,
+                "window": window,
+                "updated": time.monotonic(),
+                "next_send_at": previous["next_send_at"] if previous else 0.0,
+            }
+
+    def release(self, method: str, path: str) -> None:
+        """
+        Gives back a request reserved, once it was answered or failed without a response (e.g. a connection error).
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+        """
+        family = self.get_family(method, path)
+        with self._lock:
+            self._in_flight[family] = max(self._in_flight.get(family, 0) - 1, 0)
+
+    def in_flight(self, method: str, path: str) -> int:
+        """
+        Counts the requests of a family reserved and not answered yet.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+
+        Returns:
+            int: The number of requests in flight.
+        """
+        family = self.get_family(method, path)
+        with self._lock:
+            return self._in_flight.get(family, 0)
+
+    def _get_delay(self, budget: dict, in_flight: int, now: float) -> float:
+        """
+        Calculates the pacing interval of the next request of a family, see get_delay.
+        """
+        if budget is None or budget["limit"] <= 0:
+            return 0.0
+
+        elapsed = now - budget["updated"]
+        if elapsed >= budget["window"]:
+            # the window the budget was measured in is over
+            return 0.0
+        remaining = budget["remaining"] - in_flight
+        if remaining >= budget["limit"] * self.slow_down_at:
+            return 0.0
+
+        time_left = budget["window"] - elapsed
+        if remaining <= 0:
+            return time_left
+        return time_left / remaining
+
+    def get_delay(self, method: str, path: str) -> float:
+        """
+        Calculates how long a request would wait if it was sent now by a single caller, without reserving it.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+
+        Returns:
+            float: The delay in seconds, 0 while plenty of the budget is left.
+        """
+        family = self.get_family(method, path)
+        with self._lock:
+            budget = self._budgets.get(family)
+            delay = self._get_delay(
+                budget, self._in_flight.get(family, 0), time.monotonic()
+            )
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        return delay
+
+    def reserve(self, method: str, path: str) -> float:
+        """
+        Reserves a request of the budget and schedules it after the requests already reserved.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+
+        Returns:
+            float: The delay in seconds before the request is sent, 0 while plenty of the budget is left.
+        """
+        family = self.get_family(method, path)
+        with self._lock:
+            budget = self._budgets.get(family)
+            in_flight = self._in_flight.get(family, 0)
+            now = time.monotonic()
+            if budget is not None and now - budget["updated"] >= budget["window"]:
+                # a new window, requests whose answer was never seen no longer count
+                in_flight = 0
+            self._in_flight[family] = in_flight + 1
+            interval = self._get_delay(budget, in_flight, now)
+            if interval <= 0:
+                return 0.0
+            if budget["remaining"] - in_flight <= 0:
+                # over the budget, wait for the window to reset
+                send_at = max(now + interval, budget["next_send_at"])
+            else:
+                send_at = max(now, budget["next_send_at"]) + interval
+            if self.max_delay is not None:
+                send_at = min(send_at, now + self.max_delay)
+            budget["next_send_at"] = send_at
+        return send_at - now
+
+    def wait(self, method: str, path: str) -> None:
+        """
+        Reserves a request and sleeps for its delay, see reserve.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+        """
+        delay = self.reserve(method, path)
+        if delay > 0:
+            time.sleep(delay)
+
+    def budget(self) -> dict:
+        """
+        Returns the last known budget of every endpoint family, so schedulers can plan bulk jobs.
+
+        Returns:
+            dict: The limit, remaining and window per endpoint family, plus the seconds since it was measured.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                family: {
+                    "limit": budget["limit"],
+                    "remaining": budget["remaining"],
+                    "window": budget["window"],
+                    "age": now - budget["updated"],
+                }
+                for family, budget in self._budgets.items()
+            }
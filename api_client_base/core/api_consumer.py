@@ -1,12 +1,34 @@
 from abc import ABC, abstractmethod
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+from datetime import timedelta
+from typing import Union
 import requests
+from requests.adapters import HTTPAdapter
 from api_client_base.models.base_url import BaseURL
+from api_client_base.models.pool_config import PoolConfig
+from api_client_base.core.response_cache import ResponseCache
+from api_client_base.core.validator_store import ValidatorStore
+from api_client_base.core.retry import RetryPolicy
+from api_client_base.core.rate_limiter import RateLimiter
+from api_client_base.core.adaptive_throttle import AdaptiveThrottle
+from api_client_base.core.codec import JsonCodec
+from api_client_base.core.stream_decoder import StreamedPage
+from api_client_base.core.hooks import RequestHooks, RequestEvent
+from api_client_base.core.request_stats import RequestStats
+from api_client_base.core.single_flight import SingleFlight
+from api_client_base.core.compression import Compression
+from api_client_base.core.circuit_breaker import CircuitBreaker, CircuitStateChange
 from api_client_base.core.exceptions import (
+    APIException,
     HTTPError,
     ConnectionError,
     TimeoutError,
     RequestError,
     UnexcpectedError,
+    RateLimitError,
+    CircuitOpenError,
 )
 
 
@@ -17,15 +39,72 @@ class ApiConsumer(ABC):
     This class provides a structure for making HTTP requests to an API with a base URL and common headers.
     Subclasses should implement the specific methods for different HTTP methods (GET, POST, PUT, PATCH, DELETE).
     Additional headers & individual logic such as authentication can be implemented in the subclass.
+
+    Requests are sent through a pooled keep-alive session owned by the consumer.
+    Call close() (or use the consumer as a context manager) to release the pooled connections.
     """
 
-    def __init__(self, base_url: str, headers: dict = None):
+    codec = JsonCodec()  # Codec used to encode and decode JSON bodies
+    cache = None  # Optional ResponseCache for GET responses
+    validators = None  # Optional ValidatorStore for conditional GET requests
+    retry_policy = None  # Optional RetryPolicy for failed requests
+    rate_limiter = None  # Optional RateLimiter pacing every attempt
+    throttle = None  # Optional AdaptiveThrottle driven by rate limit response headers
+    hooks = None  # Optional RequestHooks called for every request attempt
+    request_stats = None  # Optional RequestStats fed by the hooks
+    single_flight = (
+        None  # Optional SingleFlight coalescing identical concurrent GET requests
+    )
+    circuit_breaker = None  # Optional CircuitBreaker failing requests fast while an endpoint group is down
+    compression = None  # Optional Compression of responses and large request bodies
+    _last_response = (
+        threading.local()
+    )  # The size and service time of the last response decoded, per thread
+    mutating_methods = ("POST", "PUT", "PATCH", "DELETE")
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict = None,
+        pool_config: PoolConfig = None,
+        cache: ResponseCache = None,
+        validators: ValidatorStore = None,
+        retry_policy: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+        throttle: AdaptiveThrottle = None,
+        codec: JsonCodec = None,
+        hooks: RequestHooks = None,
+        stats: RequestStats = None,
+        single_flight: SingleFlight = None,
+        circuit_breaker: CircuitBreaker = None,
+        compression: Compression = None,
+    ):
         """
         Initializes the ApiConsumer with a base URL and optional headers.
 
         Args:
             base_url (str): The base URL for the API.
             headers (dict, optional): Additional headers to include in all requests. Defaults to common headers.
+            pool_config (PoolConfig, optional): The connection pool configuration. Defaults to PoolConfig().
+            cache (ResponseCache, optional): A cache for GET responses. Defaults to None (no caching).
+            validators (ValidatorStore, optional): A store of ETag / Last-Modified validators used to revalidate
+                GET responses with conditional requests. Defaults to None (no conditional requests).
+            retry_policy (RetryPolicy, optional): The policy used to retry failed requests. Defaults to None (no retries).
+            rate_limiter (RateLimiter, optional): A rate limiter, which may be shared with other consumers.
+                Defaults to None (no limit).
+            throttle (AdaptiveThrottle, optional): A throttle pacing requests from the rate limit headers of the API.
+                Defaults to None (no throttling).
+            codec (JsonCodec, optional): The codec used for JSON bodies, e.g. OrjsonCodec(). Defaults to JsonCodec().
+            hooks (RequestHooks, optional): The instrumentation callbacks, which may be shared with other consumers.
+                Defaults to a new RequestHooks without subscribers.
+            stats (RequestStats, optional): Statistics to record every request in, which may be shared with other consumers.
+                Defaults to None (no statistics).
+            single_flight (SingleFlight, optional): Coalesces identical GET requests made concurrently, so only one of
+                them is sent and the others share its response. Defaults to None (every request is sent).
+            circuit_breaker (CircuitBreaker, optional): Fails requests immediately while their endpoint group keeps failing,
+                which may be shared with other consumers of the same host. Defaults to None (every request is sent).
+            compression (Compression, optional): Advertises every response encoding the session can decode and optionally
+                compresses large request bodies. Defaults to None (the session defaults, request bodies sent as is).
         """
         base_url = BaseURL(url=base_url)
         self.base_url = base_url.url
@@ -35,10 +114,106 @@ class ApiConsumer(ABC):
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
+        if compression is not None:
+            self.headers["Accept-Encoding"] = compression.accept_encoding
 
         if headers:
             self.headers.update(headers)
 
+        self.pool_config = pool_config or PoolConfig()
+        self.cache = cache
+        self.validators = validators
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.throttle = throttle
+        if codec is not None:
+            self.codec = codec
+        self.hooks = hooks if hooks is not None else RequestHooks()
+        self.request_stats = stats
+        if stats is not None:
+            stats.attach(self.hooks)
+        self.single_flight = single_flight
+        self.circuit_breaker = circuit_breaker
+        self.compression = compression
+        self.session = self._build_session()
+        self._last_used = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the session and all pooled connections.
+        """
+        self.session.close()
+
+    def stats(self) -> dict:
+        """
+        Returns the request statistics of every endpoint seen so far.
+
+        Returns:
+            dict: The RequestStats snapshot, empty when no statistics are kept.
+        """
+        return self.request_stats.snapshot() if self.request_stats is not None else {}
+
+    def last_response_bytes(self) -> Union[int, None]:
+        """
+        Returns the size of the last response body decoded on the calling thread, e.g. to size the next page.
+
+        Returns:
+            Union[int, None]: The size in bytes, None if no response was decoded on this thread yet.
+        """
+        return getattr(self._last_response, "bytes", None)
+
+    def last_response_elapsed(self, since: float = None) -> Union[float, None]:
+        """
+        Returns the seconds the last response on the calling thread took to send, download and decode, e.g. to size
+        the next page. Waiting for the throttle or rate limiter and the backoff between retries are not included.
+
+        Args:
+            since (float, optional): A time.perf_counter(), responses completed before it are ignored.
+                Defaults to None.
+
+        Returns:
+            Union[float, None]: The seconds, None if no response was decoded on this thread (since then).
+        """
+        finished = getattr(self._last_response, "finished", None)
+        if finished is None or (since is not None and finished < since):
+            return None
+        return self._last_response.elapsed
+
+    def _build_session(self) -> requests.Session:
+        """
+        Builds the session used for all requests, mounting a pooled adapter for http and https.
+
+        Returns:
+            requests.Session: The configured session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_config.pool_connections,
+            pool_maxsize=self.pool_config.pool_maxsize,
+            pool_block=self.pool_config.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _evict_idle_connections(self) -> None:
+        """
+        Drops the kept-alive connections if the pool has been idle for longer than the configured idle_timeout.
+        The adapters stay mounted and open new connections on the next request.
+        """
+        now = time.monotonic()
+        idle_timeout = self.pool_config.idle_timeout
+        if idle_timeout is not None and now - self._last_used > idle_timeout:
+            for adapter in self.session.adapters.values():
+                adapter.close()
+        self._last_used = now
+
     @abstractmethod
     def get(self, path: str, **kwargs):
         """
@@ -112,22 +287,411 @@ class ApiConsumer(ABC):
             method (str): The HTTP method (GET, POST, PUT, PATCH, DELETE).
             path (str): The API endpoint path.
             kwargs: Additional arguments for the request.
+                use_cache (bool): Set to False to skip the cache lookup for this call. Defaults to True.
+                timings (dict): Timings measured before the request (e.g. sign), added to the hook events.
 
         Returns:
             dict: The JSON response from the API.
 
+        Raises:
+            HTTPError: If the HTTP request returns an unsuccessful status code.
+            RateLimitError: If the rate limiter is non-blocking (or timed out) and has no token for the request.
+            CircuitOpenError: If the circuit breaker is open for the endpoint group of the request.
+        """
+        # Ensure headers are included in the request, per request headers are overlaid on a copy of the instance headers
+        headers = {**self.headers, **kwargs.pop("headers", {})}
+        use_cache = kwargs.pop("use_cache", True)
+        event = self._start_event(method, path, kwargs)
+        # set by _send_with_retries on this thread, unless the response is shared by another one
+        self._last_response.send = None
+
+        cache_key = None
+        if self.cache is not None and method == "GET":
+            cache_key = self.cache.make_key(method, path, kwargs.get("params"), headers)
+            content = self.cache.get(cache_key) if use_cache else None
+            if content is not None:
+                return self.codec.decode(content)
+
+        validator_key = validator_entry = None
+        if self.validators is not None and method == "GET":
+            validator_key = self.validators.make_key(path, kwargs.get("params"))
+            validator_entry = self.validators.get(validator_key)
+            if validator_entry is not None:
+                headers = {
+                    **headers,
+                    **self.validators.conditional_headers(validator_entry),
+                }
+
+        if self.single_flight is not None and method == "GET":
+            key = self.single_flight.make_key(
+                method, path, kwargs.get("params"), headers
+            )
+            (response, event), shared = self.single_flight.do(
+                key,
+                lambda: self._send_with_retries(
+                    method, path, headers, event=event, **kwargs
+                ),
+            )
+            if shared:
+                # the response is shared, its hook events belong to the caller which sent it
+                event = None
+        else:
+            response, event = self._send_with_retries(
+                method, path, headers, event=event, **kwargs
+            )
+
+        if response.status_code == 304:
+            if validator_entry is None:
+                err = HTTPError(
+                    304, f"Not Modified, but no body is stored for {method} {path}"
+                )
+                if event is not None:
+                    self._emit_error(event, err, False)
+                raise err
+            # not modified, decode the stored body again rather than download it, every caller gets its own copy
+            self.validators.revalidate()
+            if event is not None:
+                self._emit_response(event, response, len(response.content))
+            return self.codec.decode(validator_entry[2])
+
+        decoding = time.perf_counter()
+        body = self.codec.decode(response.content)
+        decoded = time.perf_counter()
+        if event is not None:
+            event.timings["decode"] = decoded - decoding
+            self._emit_response(event, response, len(response.content))
+        self._last_response.bytes = len(response.content)
+        if self._last_response.send is not None:
+            self._last_response.elapsed = self._last_response.send + decoded - decoding
+            self._last_response.finished = decoded
+        if validator_key is not None:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.validators.set(
+                    validator_key, etag, last_modified, response.content
+                )
+
+        if cache_key is not None:
+            self.cache.set(cache_key, response.content)
+        elif self.cache is not None and method in self.mutating_methods:
+            self.cache.invalidate(path)
+        return body
+
+    def _stream_request(
+        self,
+        method: str,
+        path: str,
+        items_key: Union[str, None] = "items",
+        chunk_size: int = 65536,
+        **kwargs,
+    ) -> StreamedPage:
+        """
+        Internal method for making an HTTP request whose items are decoded while the body downloads.
+        The cache and conditional requests are not used, retries and rate limiting are.
+
+        Args:
+            method (str): The HTTP method (GET, POST, PUT, PATCH, DELETE).
+            path (str): The API endpoint path.
+            items_key (Union[str, None], optional): The key of the items array in the response. Defaults to "items".
+            chunk_size (int, optional): The number of bytes read from the body at a time. Defaults to 65536.
+            kwargs: Additional arguments for the request.
+
+        Returns:
+            StreamedPage: The page, iterate it to read the items. Its fields are complete once it is exhausted.
+
+        Raises:
+            HTTPError: If the HTTP request returns an unsuccessful status code.
+            RateLimitError: If the rate limiter is non-blocking (or timed out) and has no token for the request.
+            CircuitOpenError: If the circuit breaker is open for the endpoint group of the request.
+        """
+        headers = {**self.headers, **kwargs.pop("headers", {})}
+        kwargs.pop("use_cache", None)
+        event = self._start_event(method, path, kwargs)
+        response, event = self._send_with_retries(
+            method, path, headers, event=event, stream=True, **kwargs
+        )
+        if event is not None:
+            # the body is decoded as it is read, so only the size announced by the API is known
+            length = response.headers.get("Content-Length")
+            try:
+                self._emit_response(event, response, int(length) if length else None)
+            except BaseException:
+                response.close()
+                raise
+        return StreamedPage(
+            self._iter_content(response, chunk_size),
+            items_key=items_key,
+            close=response.close,
+        )
+
+    def _iter_content(self, response, chunk_size: int):
+        """
+        Internal generator reading the body of a streamed response in chunks.
+
+        Args:
+            response (requests.Response): The streamed response.
+            chunk_size (int): The number of bytes read at a time.
+
+        Yields:
+            bytes: The chunks of the body.
+
+        Raises:
+            ConnectionError: If the connection fails while the body is read.
+        """
+        try:
+            yield from response.iter_content(chunk_size)
+        except requests.exceptions.RequestException as err:
+            raise ConnectionError(
+                f"Connection error occurred while reading {response.url}: {err}"
+            )
+
+    def _send_with_retries(
+        self,
+        method: str,
+        path: str,
+        headers: dict,
+        event: RequestEvent = None,
+        **kwargs,
+    ) -> tuple:
+        """
+        Internal method for sending an HTTP request, pacing every attempt and retrying it under the retry policy.
+
+        Args:
+            method (str): The HTTP method (GET, POST, PUT, PATCH, DELETE).
+            path (str): The API endpoint path.
+            headers (dict): The headers for the request.
+            event (RequestEvent, optional): The hook event of the first attempt, None when nothing is subscribed.
+            kwargs: Additional arguments for the request.
+
+        Returns:
+            tuple: The requests.Response and the hook event of the successful attempt (or None).
+
+        Raises:
+            HTTPError: If the HTTP request returns an unsuccessful status code.
+            RateLimitError: If the rate limiter is non-blocking (or timed out) and has no token for the request.
+            CircuitOpenError: If the circuit breaker is open for the endpoint group of the request.
+        """
+        attempt = 1
+        breaker = self.circuit_breaker
+        # compressed once for every attempt, the uncompressed kwargs are kept for re-signing retried attempts
+        send_kwargs = kwargs
+        if self.compression is not None and method in self.mutating_methods:
+            headers, send_kwargs = self._compress_body(headers, kwargs)
+        # whether the probe slot taken by breaker.allow still waits for the outcome of the attempt
+        held = False
+        # whether the attempt reserved by throttle.wait was neither handed to _send nor given back
+        reserved = False
+        try:
+            while True:
+                if breaker is not None:
+                    # checked first, so requests to a failing endpoint group do not wait for the throttle or a token
+                    try:
+                        change = breaker.allow(path)
+                    except CircuitOpenError as err:
+                        if event is not None:
+                            self._emit_error(event, err, False)
+                        raise
+                    held = True
+                    self._emit_circuit_change(change)
+                if event is not None:
+                    queued = time.perf_counter()
+                if self.throttle is not None:
+                    reserved = True
+                    self.throttle.wait(method, path)
+                if self.rate_limiter is not None and not self.rate_limiter.acquire(
+                    method, path
+                ):
+                    err = RateLimitError(
+                        f"No token available for {method} {self.base_url}/{path}"
+                    )
+                    if event is not None:
+                        self._emit_error(event, err, False)
+                    raise err
+                if event is not None:
+                    event.timings["queue"] = time.perf_counter() - queued
+                    self.hooks.emit("before_send", event)
+                sent = time.perf_counter()
+                # _send gives the reservation back once the attempt is answered or failed
+                reserved = False
+                try:
+                    response = self._send(method, path, headers, **send_kwargs)
+                except APIException as err:
+                    if breaker is not None:
+                        held = False
+                        self._emit_circuit_change(breaker.record(path, err))
+                    policy = self.retry_policy
+                    retrying = policy is not None and policy.should_retry(
+                        method, err, attempt
+                    )
+                    if event is not None:
+                        event.timings["send"] = time.perf_counter() - sent
+                        self._emit_error(event, err, retrying)
+                    if not retrying:
+                        raise
+                    backoff = policy.get_backoff(
+                        attempt, getattr(err, "retry_after", None)
+                    )
+                    time.sleep(backoff)
+                    attempt += 1
+                    if event is not None:
+                        event = event.next_attempt()
+                        event.timings["backoff"] = backoff
+                        signing = time.perf_counter()
+                    # give the subclass the chance to refresh time based auth (e.g. signatures) for the new attempt
+                    headers = {**headers, **self._sign_request(method, path, **kwargs)}
+                    if event is not None:
+                        event.timings["sign"] = time.perf_counter() - signing
+                else:
+                    # the service time of the response, without waiting for the throttle, a token or a retry
+                    self._last_response.send = time.perf_counter() - sent
+                    if event is not None:
+                        event.timings["send"] = self._last_response.send
+                    if breaker is not None:
+                        held = False
+                        self._emit_circuit_change(breaker.record(path))
+                    return response, event
+        finally:
+            if held:
+                # the attempt ended without being sent or recorded (e.g. a hook raised), give its slot back
+                breaker.release(path)
+            if reserved:
+                # the attempt was never sent (e.g. no rate limiter token), so it does not count against the budget
+                self.throttle.release(method, path)
+
+    def _compress_body(self, headers: dict, kwargs: dict) -> tuple:
+        """
+        Compresses the body of a request if it is large enough, encoding a json payload with the codec first.
+        Bodies which are neither bytes, str nor json, or already carry a Content-Encoding, are sent as is.
+
+        Args:
+            headers (dict): The headers for the request.
+            kwargs (dict): The arguments for the request.
+
+        Returns:
+            tuple: The headers and arguments to send the request with.
+        """
+        if "Content-Encoding" in headers:
+            return headers, kwargs
+        body = kwargs.get("data")
+        if body is None and kwargs.get("json") is not None:
+            body = self.codec.encode(kwargs["json"])
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if not isinstance(body, bytes) or not self.compression.should_compress(body):
+            return headers, kwargs
+        send_kwargs = {key: value for key, value in kwargs.items() if key != "json"}
+        send_kwargs["data"] = self.compression.compress(body)
+        headers = {
+            **headers,
+            "Content-Encoding": self.compression.request_encoding,
+        }
+        return headers, send_kwargs
+
+    def _start_event(self, method: str, path: str, kwargs: dict):
+        """
+        Builds the hook event for the first attempt of a request, popping any timings passed with the request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+            kwargs (dict): The arguments for the request, updated in place.
+
+        Returns:
+            Union[RequestEvent, None]: The event, or None when nothing is subscribed to the hooks.
+        """
+        timings = kwargs.pop("timings", None)
+        if not self.hooks:
+            return None
+        body = kwargs.get("data")
+        return RequestEvent(
+            method,
+            path,
+            request_bytes=len(body) if isinstance(body, (bytes, str)) else None,
+            timings=dict(timings) if timings else None,
+        )
+
+    def _emit_response(
+        self, event: RequestEvent, response, response_bytes: Union[int, None]
+    ) -> None:
+        """
+        Completes the event of the successful attempt and calls the after_receive hooks.
+
+        Args:
+            event (RequestEvent): The event of the attempt.
+            response (requests.Response): The response.
+            response_bytes (Union[int, None]): The size of the response body, if known.
+        """
+        event.status = response.status_code
+        event.response_bytes = response_bytes
+        elapsed = getattr(response, "elapsed", None)
+        if isinstance(elapsed, timedelta):
+            # requests measures until the headers are parsed, the rest of the send is the body download
+            event.timings["first_byte"] = elapsed.total_seconds()
+            event.timings["download"] = max(
+                event.timings["send"] - event.timings["first_byte"], 0.0
+            )
+        event.timings["total"] = time.perf_counter() - event.started
+        self.hooks.emit("after_receive", event)
+
+    def _emit_error(self, event: RequestEvent, error: APIException, retrying: bool):
+        """
+        Completes the event of a failed attempt and calls the on_error hooks.
+
+        Args:
+            event (RequestEvent): The event of the attempt.
+            error (APIException): The error raised by the attempt.
+            retrying (bool): Whether the request is retried.
+        """
+        event.error = error
+        event.status = getattr(error, "status_code", None)
+        event.retrying = retrying
+        event.timings["total"] = time.perf_counter() - event.started
+        self.hooks.emit("on_error", event)
+
+    def _emit_circuit_change(self, change: Union[CircuitStateChange, None]) -> None:
+        """
+        Calls the circuit_state_change hooks if the circuit breaker changed state.
+
+        Args:
+            change (Union[CircuitStateChange, None]): The state change returned by the circuit breaker, if any.
+        """
+        if change is not None and self.hooks:
+            self.hooks.emit("circuit_state_change", change)
+
+    def _send(self, method: str, path: str, headers: dict, **kwargs):
+        """
+        Internal method for sending a single attempt of an HTTP request through the pooled session.
+
+        Args:
+            method (str): The HTTP method (GET, POST, PUT, PATCH, DELETE).
+            path (str): The API endpoint path.
+            headers (dict): The headers for the request.
+            kwargs: Additional arguments for the request.
+
+        Returns:
+            requests.Response: The response.
+
         Raises:
             HTTPError: If the HTTP request returns an unsuccessful status code.
         """
         url = f"{self.base_url}/{path}"
-        # Ensure headers are included in the request
-        headers = kwargs.pop("headers", {})
-        headers.update(self.headers)
+        observed = False
         try:
-            response = requests.request(method, url, headers=headers, **kwargs)
+            self._evict_idle_connections()
+            response = self.session.request(method, url, headers=headers, **kwargs)
+            if self.throttle is not None:
+                observed = True
+                self.throttle.observe(method, path, response.headers)
             response.raise_for_status()
         except requests.exceptions.HTTPError as http_err:
-            raise HTTPError(response.status_code, str(http_err))
+            # release the connection, a streamed error response would otherwise hold it until garbage collected
+            response.close()
+            raise HTTPError(
+                response.status_code,
+                str(http_err),
+                retry_after=response.headers.get("Retry-After"),
+            )
         except requests.exceptions.ConnectionError:
             raise ConnectionError(
                 f"Connection error occurred when trying to reach {url}"
@@ -138,7 +702,26 @@ class ApiConsumer(ABC):
             raise RequestError(f"Request error occurred: {str(req_err)}")
         except Exception as err:
             raise UnexcpectedError(f"An unexpected error occurred: {str(err)}")
-        return response.json()
+        finally:
+            if self.throttle is not None and not observed:
+                # no response (e.g. a connection error or timeout), the reserved request is not in flight anymore
+                self.throttle.release(method, path)
+        return response
+
+    def _sign_request(self, method: str, path: str, **kwargs) -> dict:
+        """
+        Hook for subclasses whose authentication must be regenerated for every attempt (e.g. time based signatures).
+        Called before a request is retried, the returned headers are added to the retried request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+            kwargs: The arguments for the request.
+
+        Returns:
+            dict: The headers to add. The base implementation adds none.
+        """
+        return {}
 
     @abstractmethod
     def update_headers(self, headers: dict):
@@ -216,3 +799,47 @@ class ApiConsumer(ABC):
             dict: The JSON response from the API.
         """
         return self._make_request("DELETE", path, **kwargs)
+
+    def batch(
+        self, calls: list, concurrency: int = 10, fail_fast: bool = False
+    ) -> list:
+        """
+        Runs many requests with bounded parallelism over the shared connection pool.
+        Every request goes through the public method of its HTTP method (e.g. patch), so subclass logic such as
+        authentication applies to each of them.
+
+        Args:
+            calls (list): (method, path) or (method, path, kwargs) entries, e.g. ("PATCH", "device/devices/1",
+                {"json": {...}}).
+            concurrency (int, optional): The maximum number of requests in flight. Defaults to 10.
+            fail_fast (bool, optional): Raise the first APIException and cancel the requests not yet started,
+                instead of collecting every result. Defaults to False.
+
+        Returns:
+            list: The result of each request in input order, either its response or the APIException it raised.
+
+        Raises:
+            APIException: With fail_fast, the first error raised by a request.
+        """
+
+        def run(entry):
+            method, path, kwargs = (*entry, {})[:3]
+            try:
+                return getattr(self, method.lower())(path, **kwargs)
+            except APIException as err:
+                if fail_fast:
+                    raise
+                return err
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            futures = [executor.submit(run, entry) for entry in calls]
+            if fail_fast:
+                # surface the first failure as soon as it happens rather than in input order
+                done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    if future.exception() is not None:
+                        raise future.exception()
+            return [future.result() for future in futures]
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -1,6 +1,26 @@
 from abc import ABC, abstractmethod
 import urllib.parse
+from typing import Union
 from api_client_base.core.api_consumer import ApiConsumer
+from api_client_base.core.checkpoint import Checkpoint
+from api_client_base.core.jsonl_sink import JsonlSink
+from api_client_base.core.prefetch import Prefetcher, batched
+
+
+class _PageEnd:
+    """
+    Marks the end of a page among streamed items, carrying the params of the next page.
+    """
+
+    __slots__ = ("next_params",)
+
+    def __init__(self, next_params: Union[dict, None]):
+        self.next_params = next_params
+
+
+def _unbatch(batches):
+    for batch in batches:
+        yield from batch
 
 
 class ApiPaginator(ABC):
@@ -10,6 +30,8 @@ class ApiPaginator(ABC):
     Subclasses should implement the logic for different pagination schemes (e.g., page number, offset-based).
     """
 
+    items_key = None  # The key in the response that contains the items
+
     def __init__(self, size_param: str = "size", size_value: int = 10):
         self.size_param = size_param
         self.size_value = size_value
@@ -44,21 +66,131 @@ class ApiPaginator(ABC):
         """
         pass  # pragma: no cover
 
-    def paginate(self, consumer: "ApiConsumer", method: str, path: str, **kwargs):
+    def paginate(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        prefetch: int = 0,
+        checkpoint: Union[Checkpoint, None] = None,
+        resume: bool = False,
+        **kwargs,
+    ):
         """
         Generator to paginate through API results.
 
+        With prefetch set, a background thread fetches up to prefetch pages ahead while the caller processes the
+        current one, so the network time and the processing time overlap instead of adding up.
+        With a checkpoint, every page is recorded once the caller asks for the next one, and resume continues from
+        the page after the last one recorded (nothing is yielded if the export had completed).
+
         Args:
             consumer (ApiConsumer): The API consumer instance.
             method (str): The HTTP method (GET, POST, etc.).
             path (str): The API endpoint path.
+            prefetch (int, optional): The maximum number of pages fetched ahead. Defaults to 0 (no read-ahead).
+            checkpoint (Union[Checkpoint, None], optional): Records the progress of the export. Defaults to None.
+            resume (bool, optional): Continue from the checkpoint rather than start over. Defaults to False.
             kwargs: Additional arguments for the request, including initial URL params.
 
         Yields:
             The data from each page until there are no more pages.
         """
-        params = kwargs.pop("params", {})
-        params[self.size_param] = self.size_value
+        start_params = None
+        if checkpoint is not None:
+            start_params = checkpoint.start(method, path, kwargs.get("params"), resume)
+            if checkpoint.complete:
+                return
+
+        pages = self._iter_pages(
+            consumer, method, path, start_params=start_params, **kwargs
+        )
+        if prefetch:
+            pages = Prefetcher(pages, prefetch)
+        for page, next_params in pages:
+            yield page
+            if checkpoint is not None:
+                checkpoint.advance(next_params, page.get(self.items_key, page))
+
+    def export(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        sink: JsonlSink,
+        prefetch: int = 0,
+        checkpoint: Union[Checkpoint, None] = None,
+        resume: bool = False,
+        **kwargs,
+    ) -> dict:
+        """
+        Writes the items of every page to a JsonlSink rather than collecting them in memory, closing it at the end.
+
+        With a checkpoint the sink is flushed after every page, before the checkpoint records it, and on resume
+        whatever the sink wrote after the last page recorded is truncated, so the files hold every item once.
+        Use the sink's "flush" fsync policy for the files to be on disk before the checkpoint.
+
+        Args:
+            consumer (ApiConsumer): The API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            sink (JsonlSink): The sink the items are written to.
+            prefetch (int, optional): The maximum number of pages fetched ahead. Defaults to 0 (no read-ahead).
+            checkpoint (Union[Checkpoint, None], optional): Records the progress of the export. Defaults to None.
+            resume (bool, optional): Continue from the checkpoint and the sink's files rather than start over.
+                Defaults to False.
+            kwargs: Additional arguments for the request, including initial URL params.
+
+        Returns:
+            dict: The manifest of the sink, see JsonlSink.manifest.
+        """
+        if checkpoint is not None and resume:
+            checkpoint.start(method, path, kwargs.get("params"), resume)
+            sink.resume(checkpoint.state["items"])
+
+        try:
+            for page in self.paginate(
+                consumer,
+                method,
+                path,
+                prefetch=prefetch,
+                checkpoint=checkpoint,
+                resume=resume,
+                **kwargs,
+            ):
+                sink.write_many(page.get(self.items_key, page))
+                if checkpoint is not None:
+                    # the page must be written before the checkpoint records it
+                    sink.flush()
+        finally:
+            manifest = sink.close()
+        return manifest
+
+    def _iter_pages(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        start_params: Union[dict, None] = None,
+        **kwargs,
+    ):
+        """
+        Generator requesting every page in turn, see paginate.
+
+        Args:
+            consumer (ApiConsumer): The API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            start_params (Union[dict, None], optional): The params of the page to resume from. Defaults to None.
+            kwargs: Additional arguments for the request, including initial URL params.
+
+        Yields:
+            tuple: The data from each page and the params of the next one (None after the last page).
+        """
+        # a copy, the caller's params identify the request (see Checkpoint) and must not change
+        params = {**kwargs.pop("params", {}), self.size_param: self.size_value}
+        if start_params is not None:
+            params = dict(start_params)
 
         while params:
             # Merge the base URL with the parameters
@@ -66,6 +198,137 @@ class ApiPaginator(ABC):
             full_path = f"{path}?{query_string}"
 
             response = consumer._make_request(method, full_path, **kwargs)
-            yield response
+            # on a copy, the params yielded must not change while the next page is fetched
+            params = self.get_next_params(response, dict(params))
+            yield response, params
+
+    def iter_items(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        stream: bool = False,
+        prefetch: int = 0,
+        checkpoint: Union[Checkpoint, None] = None,
+        resume: bool = False,
+        **kwargs,
+    ):
+        """
+        Generator to iterate through the items of every page one at a time.
+        If items_key is set, it will be used to extract the items from each page.
+        Otherwise, the entire page will be used as the items.
+
+        Each page is released once its items have been consumed, so at most one or two pages are held in memory
+        no matter how many items there are in total.
+        With stream set, each page is decoded while it downloads and its items are yielded as soon as they are parsed,
+        so not even a single page is held in memory.
+        With prefetch set, up to prefetch pages are fetched ahead on a background thread while the items are processed
+        (for streamed pages, up to prefetch pages worth of items are read ahead).
+        With a checkpoint, every page is recorded once its last item has been consumed, see paginate.
+
+        Args:
+            consumer (ApiConsumer): The API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            stream (bool, optional): Decode the items of each page while it downloads. Defaults to False.
+            prefetch (int, optional): The maximum number of pages fetched ahead. Defaults to 0 (no read-ahead).
+            checkpoint (Union[Checkpoint, None], optional): Records the progress of the export. Defaults to None.
+            resume (bool, optional): Continue from the checkpoint rather than start over. Defaults to False.
+            kwargs: Additional arguments for the request, including initial URL params.
+
+        Yields:
+            Each item from each page, in order.
+        """
+        if stream:
+            yield from self._iter_streamed(
+                consumer, method, path, prefetch, checkpoint, resume, **kwargs
+            )
+            return
+
+        for page in self.paginate(
+            consumer,
+            method,
+            path,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            resume=resume,
+            **kwargs,
+        ):
+            items = page.get(self.items_key, page)
+            # drop the page so only the items still to be yielded are referenced
+            del page
+            yield from items
+            del items
+
+    def _iter_streamed(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        prefetch: int,
+        checkpoint: Union[Checkpoint, None],
+        resume: bool,
+        **kwargs,
+    ):
+        """
+        Generator yielding the streamed items of every page, see iter_items.
+        """
+        start_params = None
+        if checkpoint is not None:
+            start_params = checkpoint.start(method, path, kwargs.get("params"), resume)
+            if checkpoint.complete:
+                return
+
+        values = self._iter_streamed_items(
+            consumer, method, path, start_params=start_params, **kwargs
+        )
+        if prefetch:
+            # read ahead in batches of a page, rather than handing every item over on its own
+            values = _unbatch(Prefetcher(batched(values, self.size_value), prefetch))
+        for value in values:
+            if type(value) is _PageEnd:
+                if checkpoint is not None:
+                    checkpoint.advance(value.next_params)
+                continue
+            if checkpoint is not None:
+                checkpoint.add(value)
+            yield value
+
+    def _iter_streamed_items(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        start_params: Union[dict, None] = None,
+        **kwargs,
+    ):
+        """
+        Generator to iterate through the items of every page, decoding each page while it downloads.
+        The next page is requested from the other members of the page (e.g. total) once its items are exhausted.
+
+        Args:
+            consumer (ApiConsumer): The API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            start_params (Union[dict, None], optional): The params of the page to resume from. Defaults to None.
+            kwargs: Additional arguments for the request, including initial URL params.
+
+        Yields:
+            Each item from each page, in order, followed by a _PageEnd with the params of the next page.
+        """
+        # a copy, the caller's params identify the request (see Checkpoint) and must not change
+        params = {**kwargs.pop("params", {}), self.size_param: self.size_value}
+        if start_params is not None:
+            params = dict(start_params)
+
+        while params:
+            query_string = urllib.parse.urlencode(params)
+            full_path = f"{path}?{query_string}"
+
+            page = consumer._stream_request(
+                method, full_path, items_key=self.items_key, **kwargs
+            )
+            yield from page
 
-            params = self.get_next_params(response, params)
+            params = self.get_next_params(page.fields, dict(params))
+            yield _PageEnd(params)
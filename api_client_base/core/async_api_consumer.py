@@ -0,0 +1,351 @@
+import asyncio
+from abc import ABC, abstractmethod
+from api_client_base.models.base_url import BaseURL
+from api_client_base.models.pool_config import PoolConfig
+from api_client_base.core.codec import JsonCodec
+from api_client_base.core.single_flight import AsyncSingleFlight
+from api_client_base.core.exceptions import (
+    APIException,
+    HTTPError,
+    ConnectionError,
+    TimeoutError,
+    RequestError,
+    UnexcpectedError,
+)
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class AsyncApiConsumer(ABC):
+    """
+    Abstract base class for asyncio API consumers.
+
+    Mirrors ApiConsumer, but every request method is a coroutine and requests are sent through a single
+    pooled httpx.AsyncClient, so many requests can be in flight on one event loop.
+    Requires the optional httpx dependency (pip install api_client_base[async]).
+    """
+
+    codec = JsonCodec()  # Codec used to encode and decode JSON bodies
+    single_flight = (
+        None  # Optional AsyncSingleFlight coalescing identical concurrent GET requests
+    )
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict = None,
+        pool_config: PoolConfig = None,
+        codec: JsonCodec = None,
+        single_flight: AsyncSingleFlight = None,
+    ):
+        """
+        Initializes the AsyncApiConsumer with a base URL and optional headers.
+
+        Args:
+            base_url (str): The base URL for the API.
+            headers (dict, optional): Additional headers to include in all requests. Defaults to common headers.
+            pool_config (PoolConfig, optional): The connection pool configuration. Defaults to PoolConfig().
+            codec (JsonCodec, optional): The codec used for JSON bodies, e.g. OrjsonCodec(). Defaults to JsonCodec().
+            single_flight (AsyncSingleFlight, optional): Coalesces identical GET requests made concurrently, so only one
+                of them is sent and the others share its response. Defaults to None (every request is sent).
+
+        Raises:
+            ImportError: If httpx is not installed.
+        """
+        if httpx is None:  # pragma: no cover
+            raise ImportError(
+                "AsyncApiConsumer requires httpx, install it with 'pip install api_client_base[async]'"
+            )
+
+        base_url = BaseURL(url=base_url)
+        self.base_url = base_url.url
+
+        # Common headers for all requests
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+        if headers:
+            self.headers.update(headers)
+
+        self.pool_config = pool_config or PoolConfig()
+        if codec is not None:
+            self.codec = codec
+        self.single_flight = single_flight
+        self.client = self._build_client()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the client and all pooled connections.
+        """
+        await self.client.aclose()
+
+    def _build_client(self) -> "httpx.AsyncClient":
+        """
+        Builds the client used for all requests.
+        pool_maxsize bounds the kept-alive connections, and the total connections when pool_block is set.
+
+        Returns:
+            httpx.AsyncClient: The configured client.
+        """
+        limits = httpx.Limits(
+            max_connections=(
+                self.pool_config.pool_maxsize if self.pool_config.pool_block else None
+            ),
+            max_keepalive_connections=self.pool_config.pool_maxsize,
+            keepalive_expiry=self.pool_config.idle_timeout,
+        )
+        return httpx.AsyncClient(limits=limits, timeout=None)
+
+    @abstractmethod
+    async def get(self, path: str, **kwargs):
+        """
+        Abstract method for handling GET requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the GET request.
+
+        This method must be implemented by subclasses.
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def post(self, path: str, **kwargs):
+        """
+        Abstract method for handling POST requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the POST request.
+
+        This method must be implemented by subclasses.
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def put(self, path: str, **kwargs):
+        """
+        Abstract method for handling PUT requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the PUT request.
+
+        This method must be implemented by subclasses.
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def patch(self, path: str, **kwargs):
+        """
+        Abstract method for handling PATCH requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the PATCH request.
+
+        This method must be implemented by subclasses.
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def delete(self, path: str, **kwargs):
+        """
+        Abstract method for handling DELETE requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the DELETE request.
+
+        This method must be implemented by subclasses.
+        """
+        pass  # pragma: no cover
+
+    async def _make_request(self, method: str, path: str, **kwargs):
+        """
+        Internal method for making an HTTP request.
+
+        Args:
+            method (str): The HTTP method (GET, POST, PUT, PATCH, DELETE).
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the request.
+
+        Returns:
+            dict: The JSON response from the API.
+
+        Raises:
+            HTTPError: If the HTTP request returns an unsuccessful status code.
+        """
+        # Ensure headers are included in the request, per request headers are overlaid on a copy of the instance headers
+        headers = {**self.headers, **kwargs.pop("headers", {})}
+        if self.single_flight is not None and method == "GET":
+            key = self.single_flight.make_key(
+                method, path, kwargs.get("params"), headers
+            )
+            response, _ = await self.single_flight.do(
+                key, lambda: self._send(method, path, headers, **kwargs)
+            )
+        else:
+            response = await self._send(method, path, headers, **kwargs)
+        return self.codec.decode(response.content)
+
+    async def _send(self, method: str, path: str, headers: dict, **kwargs):
+        """
+        Internal method for sending an HTTP request through the pooled client.
+
+        Args:
+            method (str): The HTTP method (GET, POST, PUT, PATCH, DELETE).
+            path (str): The API endpoint path.
+            headers (dict): The headers for the request.
+            kwargs: Additional arguments for the request.
+
+        Returns:
+            httpx.Response: The response.
+
+        Raises:
+            HTTPError: If the HTTP request returns an unsuccessful status code.
+        """
+        url = f"{self.base_url}/{path}"
+        try:
+            response = await self.client.request(method, url, headers=headers, **kwargs)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as http_err:
+            raise HTTPError(http_err.response.status_code, str(http_err))
+        except httpx.TimeoutException:
+            raise TimeoutError(f"Request to {url} timed out")
+        except httpx.NetworkError:
+            raise ConnectionError(
+                f"Connection error occurred when trying to reach {url}"
+            )
+        except httpx.HTTPError as req_err:
+            raise RequestError(f"Request error occurred: {str(req_err)}")
+        except Exception as err:
+            raise UnexcpectedError(f"An unexpected error occurred: {str(err)}")
+        return response
+
+    @abstractmethod
+    def update_headers(self, headers: dict):
+        """
+        Abstract method for updating headers.
+
+        Args:
+            headers (dict): A dictionary of headers to update.
+
+        This method must be implemented by subclasses.
+        """
+        self.headers.update(headers)
+
+    async def common_get(self, path: str, **kwargs):
+        """
+        Wrapper method for making a GET request.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the GET request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self._make_request("GET", path, **kwargs)
+
+    async def common_post(self, path: str, **kwargs):
+        """
+        Wrapper method for making a POST request.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the POST request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self._make_request("POST", path, **kwargs)
+
+    async def common_put(self, path: str, **kwargs):
+        """
+        Wrapper method for making a PUT request.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the PUT request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self._make_request("PUT", path, **kwargs)
+
+    async def common_patch(self, path: str, **kwargs):
+        """
+        Wrapper method for making a PATCH request.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the PATCH request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self._make_request("PATCH", path, **kwargs)
+
+    async def common_delete(self, path: str, **kwargs):
+        """
+        Wrapper method for making a DELETE request.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the DELETE request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self._make_request("DELETE", path, **kwargs)
+
+    async def batch(
+        self, calls: list, concurrency: int = 10, fail_fast: bool = False
+    ) -> list:
+        """
+        Runs many requests concurrently on the event loop, with at most concurrency in flight.
+        Every request goes through the public coroutine of its HTTP method (e.g. patch), so subclass logic such as
+        authentication applies to each of them.
+
+        Args:
+            calls (list): (method, path) or (method, path, kwargs) entries.
+            concurrency (int, optional): The maximum number of requests in flight. Defaults to 10.
+            fail_fast (bool, optional): Raise the first APIException and cancel the other requests,
+                instead of collecting every result. Defaults to False.
+
+        Returns:
+            list: The result of each request in input order, either its response or the APIException it raised.
+
+        Raises:
+            APIException: With fail_fast, the first error raised by a request.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(entry):
+            method, path, kwargs = (*entry, {})[:3]
+            async with semaphore:
+                try:
+                    return await getattr(self, method.lower())(path, **kwargs)
+                except APIException as err:
+                    if fail_fast:
+                        raise
+                    return err
+
+        tasks = [asyncio.ensure_future(run(entry)) for entry in calls]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,283 @@
+import asyncio
+from typing import Union
+from api_client_base.core.paginator_offset import OffsetPaginator
+from api_client_base.core.async_api_consumer import AsyncApiConsumer
+from api_client_base.core.checkpoint import Checkpoint
+from api_client_base.core.jsonl_sink import JsonlSink
+
+# arguments of the OffsetPaginator which need a background thread or a streamed requests.Response
+_UNSUPPORTED = ("prefetch", "stream")
+
+
+def _reject_unsupported(kwargs: dict) -> None:
+    """
+    Removes the OffsetPaginator only arguments from kwargs, raising if any of them is actually used.
+
+    Raises:
+        TypeError: If prefetch or stream is set.
+    """
+    for name in _UNSUPPORTED:
+        if kwargs.pop(name, None):
+            raise TypeError(f"AsyncOffsetPaginator does not support {name}")
+
+
+class AsyncOffsetPaginator(OffsetPaginator):
+    """
+    An asyncio version of the OffsetPaginator for use with an AsyncApiConsumer.
+    e.g. ?offset=0&size=10
+
+    all and export are coroutines, paginate and iter_items are async generators (use async for).
+    Checkpoints and sinks are supported, prefetch and stream are not (the event loop already overlaps requests)
+    and pages are always size_value items, the page_size_tuner is not used.
+    """
+
+    async def all(
+        self,
+        consumer: "AsyncApiConsumer",
+        method: str,
+        path: str,
+        max_workers: int = 1,
+        checkpoint: Union[Checkpoint, None] = None,
+        resume: bool = False,
+        sink: Union[JsonlSink, None] = None,
+        **kwargs,
+    ) -> Union[list, dict]:
+        """
+        Fetches all pages of results and combines them into a single list.
+        If items_key is provided, it will be used to extract the items from the response.
+        Otherwise, the entire response will be used as the items.
+
+        When max_workers is greater than 1 the remaining offsets are fetched concurrently after the first page,
+        with at most max_workers requests in flight. Items are still returned in offset order.
+        If any page fails, the other page requests are cancelled and the error is raised.
+        With a checkpoint or a sink, pages are fetched one at a time, see OffsetPaginator.all.
+
+        Args:
+            consumer (AsyncApiConsumer): The async API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            max_workers (int, optional): The maximum number of pages fetched at once. Defaults to 1 (sequential).
+            checkpoint (Union[Checkpoint, None], optional): Records the progress of the export. Defaults to None.
+            resume (bool, optional): Continue from the checkpoint rather than start over. Defaults to False.
+            sink (Union[JsonlSink, None], optional): Writes the items to disk rather than returning them.
+                Defaults to None.
+            kwargs: Additional arguments for the request, including initial URL params.
+
+        Returns:
+            Union[list, dict]: The combined data from all pages, or the manifest of the sink.
+
+        Raises:
+            ValueError: If a checkpoint or a sink is combined with max_workers greater than 1.
+            TypeError: If prefetch or stream is set.
+        """
+        _reject_unsupported(kwargs)
+        all_results = []
+        if checkpoint is not None or sink is not None:
+            if max_workers > 1:
+                raise ValueError(
+                    "A checkpoint or sink requires pages fetched in order, max_workers must be 1"
+                )
+            if sink is not None:
+                return await self.export(
+                    consumer,
+                    method,
+                    path,
+                    sink,
+                    checkpoint=checkpoint,
+                    resume=resume,
+                    **kwargs,
+                )
+            async for page in self.paginate(
+                consumer, method, path, checkpoint=checkpoint, resume=resume, **kwargs
+            ):
+                all_results.extend(page.get(self.items_key, page))
+            return all_results
+
+        if max_workers <= 1:
+            async for response, _ in self._iter_pages(consumer, method, path, **kwargs):
+                # try to get the items from the response, or use the response itself if no items key is provided or found
+                all_results.extend(response.get(self.items_key, response))
+            return all_results
+
+        current_params = {**kwargs.pop("params", {}), self.size_param: self.size_value}
+        response = await consumer._make_request(
+            method, path, params=current_params, **kwargs
+        )
+        all_results.extend(response.get(self.items_key, response))
+        remaining = self.get_remaining_params(response, current_params)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(params: dict):
+            async with semaphore:
+                page = await consumer._make_request(
+                    method, path, params=params, **kwargs
+                )
+            return page.get(self.items_key, page)
+
+        tasks = [asyncio.ensure_future(fetch(params)) for params in remaining]
+        try:
+            for items in await asyncio.gather(*tasks):
+                all_results.extend(items)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return all_results
+
+    async def paginate(
+        self,
+        consumer: "AsyncApiConsumer",
+        method: str,
+        path: str,
+        checkpoint: Union[Checkpoint, None] = None,
+        resume: bool = False,
+        **kwargs,
+    ):
+        """
+        Async generator to paginate through API results.
+        With a checkpoint, every page is recorded once the caller asks for the next one, see OffsetPaginator.paginate.
+
+        Args:
+            consumer (AsyncApiConsumer): The async API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            checkpoint (Union[Checkpoint, None], optional): Records the progress of the export. Defaults to None.
+            resume (bool, optional): Continue from the checkpoint rather than start over. Defaults to False.
+            kwargs: Additional arguments for the request, including initial URL params.
+
+        Yields:
+            The data from each page until there are no more pages.
+
+        Raises:
+            TypeError: If prefetch or stream is set.
+        """
+        _reject_unsupported(kwargs)
+        start_params = None
+        if checkpoint is not None:
+            start_params = checkpoint.start(method, path, kwargs.get("params"), resume)
+            if checkpoint.complete:
+                return
+
+        async for page, next_params in self._iter_pages(
+            consumer, method, path, start_params=start_params, **kwargs
+        ):
+            yield page
+            if checkpoint is not None:
+                checkpoint.advance(next_params, page.get(self.items_key, page))
+
+    async def iter_items(
+        self,
+        consumer: "AsyncApiConsumer",
+        method: str,
+        path: str,
+        checkpoint: Union[Checkpoint, None] = None,
+        resume: bool = False,
+        **kwargs,
+    ):
+        """
+        Async generator to iterate through the items of every page one at a time.
+        Each page is released once its items have been consumed, see OffsetPaginator.iter_items.
+
+        Args:
+            consumer (AsyncApiConsumer): The async API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            checkpoint (Union[Checkpoint, None], optional): Records the progress of the export. Defaults to None.
+            resume (bool, optional): Continue from the checkpoint rather than start over. Defaults to False.
+            kwargs: Additional arguments for the request, including initial URL params.
+
+        Yields:
+            Each item from each page, in order.
+
+        Raises:
+            TypeError: If prefetch or stream is set.
+        """
+        async for page in self.paginate(
+            consumer, method, path, checkpoint=checkpoint, resume=resume, **kwargs
+        ):
+            items = page.get(self.items_key, page)
+            # drop the page so only the items still to be yielded are referenced
+            del page
+            for item in items:
+                yield item
+            del items
+
+    async def export(
+        self,
+        consumer: "AsyncApiConsumer",
+        method: str,
+        path: str,
+        sink: JsonlSink,
+        checkpoint: Union[Checkpoint, None] = None,
+        resume: bool = False,
+        **kwargs,
+    ) -> dict:
+        """
+        Writes the items of every page to a JsonlSink rather than collecting them in memory, closing it at the end.
+        With a checkpoint the sink is flushed after every page, see OffsetPaginator.export.
+
+        Args:
+            consumer (AsyncApiConsumer): The async API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            sink (JsonlSink): The sink the items are written to.
+            checkpoint (Union[Checkpoint, None], optional): Records the progress of the export. Defaults to None.
+            resume (bool, optional): Continue from the checkpoint and the sink's files rather than start over.
+                Defaults to False.
+            kwargs: Additional arguments for the request, including initial URL params.
+
+        Returns:
+            dict: The manifest of the sink, see JsonlSink.manifest.
+
+        Raises:
+            TypeError: If prefetch or stream is set.
+        """
+        _reject_unsupported(kwargs)
+        if checkpoint is not None and resume:
+            checkpoint.start(method, path, kwargs.get("params"), resume)
+            sink.resume(checkpoint.state["items"])
+
+        try:
+            async for page in self.paginate(
+                consumer, method, path, checkpoint=checkpoint, resume=resume, **kwargs
+            ):
+                sink.write_many(page.get(self.items_key, page))
+                if checkpoint is not None:
+                    # the page must be written before the checkpoint records it
+                    sink.flush()
+        finally:
+            manifest = sink.close()
+        return manifest
+
+    async def _iter_pages(
+        self,
+        consumer: "AsyncApiConsumer",
+        method: str,
+        path: str,
+        start_params: Union[dict, None] = None,
+        **kwargs,
+    ):
+        """
+        Async generator requesting every page in turn, see paginate.
+
+        Args:
+            consumer (AsyncApiConsumer): The async API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            start_params (Union[dict, None], optional): The params of the page to resume from. Defaults to None.
+            kwargs: Additional arguments for the request, including initial URL params.
+
+        Yields:
+            tuple: The data from each page and the params of the next one (None after the last page).
+        """
+        # a copy, the caller's params identify the request (see Checkpoint) and must not change
+        params = {**kwargs.pop("params", {}), self.size_param: self.size_value}
+        if start_params is not None:
+            params = dict(start_params)
+
+        while params:
+            response = await consumer._make_request(
+                method, path, params=params, **kwargs
+            )
+            # on a copy, the params yielded must not change while the next page is fetched
+            params = self.get_next_params(response, dict(params))
+            yield response, params
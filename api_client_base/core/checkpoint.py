@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import time
+from typing import Union
+
+_VERSION = 1
+
+
+class Checkpoint:
+    """
+    Checkpoint of a paginated export, kept in a local JSON file so an interrupted export can be resumed.
+
+    After every page the caller has finished with, the checkpoint records the params of the next page (the offset
+    or keyset cursor), the number of pages and items delivered and a fingerprint of the items. The fingerprint is
+    chained from page to page, so a resumed export ends with the fingerprint of an uninterrupted one.
+    Resuming continues from the page after the last one completed, so the pages already delivered are neither
+    requested nor delivered again. Items of a page the caller was part way through are delivered again.
+
+    The file also identifies the request (method, path and params) and is only resumed by the same request.
+    It is replaced atomically, so a crash while it is written leaves the previous checkpoint.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        every: int = 1,
+        fingerprint_key: Union[str, None] = "id",
+        fsync: bool = True,
+    ):
+        """
+        Initializes the Checkpoint.
+
+        Args:
+            path (str): The checkpoint file.
+            every (int, optional): The number of pages between writes, the last page is always written.
+                Defaults to 1 (after every page).
+            fingerprint_key (Union[str, None], optional): The item key the fingerprint is built from, cheaper than the
+                whole item. Defaults to "id", None to fingerprint the whole items.
+            fsync (bool, optional): Flush the file to disk on every write, so the checkpoint survives a power loss.
+                Defaults to True.
+        """
+        self.path = path
+        self.every = every
+        self.fingerprint_key = fingerprint_key
+        self.fsync = fsync
+        self.state = None
+        self._digest = None
+        self._pending = 0
+
+    @property
+    def complete(self) -> bool:
+        """
+        Whether the export ran to its last page.
+        """
+        return bool(self.state and self.state["complete"])
+
+    @staticmethod
+    def get_request_id(method: str, path: str, params: Union[dict, None]) -> str:
+        """
+        Builds the identifier of a request, a checkpoint is only resumed by the request it was made for.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+            params (Union[dict, None]): The initial URL params.
+
+        Returns:
+            str: The identifier.
+        """
+        request = json.dumps(
+            [method.upper(), path, params or {}], sort_keys=True, default=str
+        )
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def start(
+        self, method: str, path: str, params: Union[dict, None], resume: bool = False
+    ) -> Union[dict, None]:
+        """
+        Starts an export, or resumes it from the checkpoint file.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+            params (Union[dict, None]): The initial URL params.
+            resume (bool, optional): Continue from the checkpoint file if it exists. Defaults to False (start over).
+
+        Returns:
+            Union[dict, None]: The params of the page to continue from, None to start from the first page
+                (or when the export is already complete).
+
+        Raises:
+            ValueError: If the checkpoint file was made for a different request.
+        """
+        request_id = self.get_request_id(method, path, params)
+        if resume and os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("version") != _VERSION or state.get("request") != request_id:
+                raise ValueError(
+                    f"Checkpoint {self.path} was made for {state.get('method')} {state.get('path')} "
+                    f"with other params, cannot resume {method} {path}"
+                )
+            self.state = state
+            self._digest = hashlib.sha256()
+            self._pending = 0
+            return state["next_params"]
+
+        self.state = {
+            "version": _VERSION,
+            "request": request_id,
+            "method": method.upper(),
+            "path": path,
+            "params": dict(params or {}),
+            "next_params": None,
+            "pages": 0,
+            "items": 0,
+            "fingerprint": hashlib.sha256().hexdigest(),
+            "complete": False,
+            "updated": None,
+        }
+        self._digest = hashlib.sha256()
+        self._pending = 0
+        return None
+
+    def add(self, item) -> None:
+        """
+        Adds a delivered item to the page in progress.
+
+        Args:
+            item: The item.
+        """
+        key = self.fingerprint_key
+        if key is not None and isinstance(item, dict) and key in item:
+            value = str(item[key])
+        else:
+            value = json.dumps(item, sort_keys=True, default=str)
+        self._digest.update(value.encode("utf-8"))
+        self._digest.update(b"\n")
+        self._pending += 1
+
+    def advance(self, next_params: Union[dict, None], items=()) -> None:
+        """
+        Completes a page the caller has finished with, writing the checkpoint every few pages.
+
+        Args:
+            next_params (Union[dict, None]): The params of the next page, None after the last page.
+            items (optional): The items of the page, if they were not added one at a time.
+        """
+        for item in items:
+            self.add(item)
+        state = self.state
+        state["next_params"] = dict(next_params) if next_params else None
+        state["pages"] += 1
+        state["items"] += self._pending
+        chained = state["fingerprint"] + self._digest.hexdigest()
+        state["fingerprint"] = hashlib.sha256(chained.encode("ascii")).hexdigest()
+        state["complete"] = not next_params
+        self._digest = hashlib.sha256()
+        self._pending = 0
+        if state["complete"] or state["pages"] % self.every == 0:
+            self.save()
+
+    def save(self) -> None:
+        """
+        Writes the checkpoint file, replacing it atomically.
+        """
+        self.state["updated"] = time.time()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2, default=str)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
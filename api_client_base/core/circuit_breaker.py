@@ -0,0 +1,264 @@
+import threading
+import time
+from collections import deque
+from typing import Union
+from api_client_base.core.exceptions import (
+    APIException,
+    HTTPError,
+    ConnectionError,
+    TimeoutError,
+    CircuitOpenError,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitStateChange:
+    """
+    Describes a state change of the circuit of an endpoint group, passed to the circuit_state_change hooks.
+    """
+
+    __slots__ = ("group", "previous", "state", "reason")
+
+    def __init__(self, group: str, previous: str, state: str, reason: str):
+        """
+        Initializes the CircuitStateChange.
+
+        Args:
+            group (str): The endpoint group, e.g. "device/devices".
+            previous (str): The state left, one of closed, open or half_open.
+            state (str): The state entered, one of closed, open or half_open.
+            reason (str): Why the state changed.
+        """
+        self.group = group
+        self.previous = previous
+        self.state = state
+        self.reason = reason
+
+    def __repr__(self):
+        return f"CircuitStateChange({self.group} {self.previous} -> {self.state}: {self.reason})"
+
+
+class _Circuit:
+    __slots__ = ("state", "outcomes", "consecutive", "opened", "probes", "successes")
+
+    def __init__(self, window_size: int):
+        self.state = CLOSED
+        self.outcomes = deque(maxlen=window_size)  # True for every failure
+        self.consecutive = 0
+        self.opened = 0.0
+        self.probes = 0
+        self.successes = 0
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker failing requests fast while an endpoint group of the API is down.
+
+    Every endpoint group (the first path segments, e.g. "device/devices") has its own circuit:
+        closed: requests are sent, the circuit opens after failure_threshold consecutive failures or once
+            error_rate of the last window_size requests failed
+        open: requests fail immediately with a CircuitOpenError, until reset_timeout has passed
+        half_open: up to half_open_probes probe requests are sent, the circuit closes once they all succeeded
+            and opens again on the first failure
+
+    Only server side failures count (5xx responses, connection errors and timeouts), other errors show the
+    API is answering. One breaker may be shared by several consumers of the same host.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        error_rate: float = 0.5,
+        window_size: int = 20,
+        min_requests: int = 10,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        group_segments: int = 2,
+        failure_statuses: tuple = (500, 502, 503, 504),
+        failure_exceptions: tuple = (ConnectionError, TimeoutError),
+    ):
+        """
+        Initializes the CircuitBreaker.
+
+        Args:
+            failure_threshold (int, optional): The number of consecutive failures opening the circuit. Defaults to 5.
+            error_rate (float, optional): The fraction of failed requests in the window opening the circuit. Defaults to 0.5.
+            window_size (int, optional): The number of latest requests the error rate is measured over. Defaults to 20.
+            min_requests (int, optional): The number of requests in the window before the error rate applies. Defaults to 10.
+            reset_timeout (float, optional): The seconds an open circuit waits before probing. Defaults to 30.
+            half_open_probes (int, optional): The number of probes sent at once, which must all succeed to close the circuit.
+                Defaults to 1.
+            group_segments (int, optional): The number of path segments identifying an endpoint group. Defaults to 2.
+            failure_statuses (tuple, optional): HTTP status codes counted as failures. Defaults to (500, 502, 503, 504).
+            failure_exceptions (tuple, optional): Exceptions counted as failures. Defaults to (ConnectionError, TimeoutError).
+        """
+        self.failure_threshold = failure_threshold
+        self.error_rate = error_rate
+        self.window_size = window_size
+        self.min_requests = min_requests
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.group_segments = group_segments
+        self.failure_statuses = failure_statuses
+        self.failure_exceptions = failure_exceptions
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def get_group(self, path: str) -> str:
+        """
+        Builds the endpoint group of a request path.
+
+        Args:
+            path (str): The API endpoint path.
+
+        Returns:
+            str: The endpoint group, e.g. "device/devices".
+        """
+        segments = path.split("?")[0].strip("/").split("/")
+        return "/".join(segments[: self.group_segments])
+
+    def is_failure(self, error: APIException) -> bool:
+        """
+        Decides whether an error counts against the circuit.
+
+        Args:
+            error (APIException): The error raised by the attempt.
+
+        Returns:
+            bool: True if the error shows the API failing.
+        """
+        if isinstance(error, HTTPError):
+            return error.status_code in self.failure_statuses
+        return isinstance(error, self.failure_exceptions)
+
+    def _circuit(self, group: str) -> _Circuit:
+        circuit = self._circuits.get(group)
+        if circuit is None:
+            circuit = self._circuits[group] = _Circuit(self.window_size)
+        return circuit
+
+    def _change(self, group: str, circuit: _Circuit, state: str, reason: str):
+        change = CircuitStateChange(group, circuit.state, state, reason)
+        circuit.state = state
+        circuit.outcomes.clear()
+        circuit.consecutive = circuit.probes = circuit.successes = 0
+        if state == OPEN:
+            circuit.opened = time.monotonic()
+        return change
+
+    def allow(self, path: str) -> Union[CircuitStateChange, None]:
+        """
+        Checks whether a request may be sent, letting a probe through once an open circuit has waited long enough.
+
+        Args:
+            path (str): The API endpoint path.
+
+        Returns:
+            Union[CircuitStateChange, None]: The state change, if the request moved the circuit to half_open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half_open with all probes in flight.
+        """
+        group = self.get_group(path)
+        with self._lock:
+            circuit = self._circuit(group)
+            change = None
+            if circuit.state == OPEN:
+                remaining = self.reset_timeout - (time.monotonic() - circuit.opened)
+                if remaining > 0:
+                    raise CircuitOpenError(group, remaining)
+                change = self._change(group, circuit, HALF_OPEN, "reset timeout passed")
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.half_open_probes:
+                    raise CircuitOpenError(group, 0.0)
+                circuit.probes += 1
+            return change
+
+    def release(self, path: str) -> None:
+        """
+        Gives back the probe slot of a request allowed but never sent.
+
+        Args:
+            path (str): The API endpoint path.
+        """
+        with self._lock:
+            circuit = self._circuit(self.get_group(path))
+            if circuit.state == HALF_OPEN and circuit.probes > 0:
+                circuit.probes -= 1
+
+    def record(
+        self, path: str, error: Union[APIException, None] = None
+    ) -> Union[CircuitStateChange, None]:
+        """
+        Records the outcome of a request sent.
+
+        Args:
+            path (str): The API endpoint path.
+            error (Union[APIException, None], optional): The error raised by the request. Defaults to None (success).
+
+        Returns:
+            Union[CircuitStateChange, None]: The state change, if the outcome opened or closed the circuit.
+        """
+        failed = error is not None and self.is_failure(error)
+        group = self.get_group(path)
+        with self._lock:
+            circuit = self._circuit(group)
+            if circuit.state == OPEN:
+                # a request sent before the circuit opened, the circuit waits for its probe
+                return None
+
+            if circuit.state == HALF_OPEN:
+                if failed:
+                    return self._change(group, circuit, OPEN, f"probe failed: {error}")
+                circuit.probes = max(circuit.probes - 1, 0)
+                circuit.successes += 1
+                if circuit.successes >= self.half_open_probes:
+                    return self._change(group, circuit, CLOSED, "probe succeeded")
+                return None
+
+            circuit.outcomes.append(failed)
+            circuit.consecutive = circuit.consecutive + 1 if failed else 0
+            if circuit.consecutive >= self.failure_threshold:
+                reason = f"{circuit.consecutive} consecutive failures"
+                return self._change(group, circuit, OPEN, reason)
+            count = len(circuit.outcomes)
+            if failed and count >= self.min_requests:
+                rate = sum(circuit.outcomes) / count
+                if rate >= self.error_rate:
+                    reason = f"error rate {rate:.0%} over the last {count} requests"
+                    return self._change(group, circuit, OPEN, reason)
+            return None
+
+    def state(self, path: str) -> str:
+        """
+        Returns the state of the circuit of a request path.
+
+        Args:
+            path (str): The API endpoint path.
+
+        Returns:
+            str: One of closed, open or half_open.
+        """
+        with self._lock:
+            circuit = self._circuits.get(self.get_group(path))
+            return circuit.state if circuit is not None else CLOSED
+
+    def states(self) -> dict:
+        """
+        Returns the state of every endpoint group seen so far.
+
+        Returns:
+            dict: The state per endpoint group.
+        """
+        with self._lock:
+            return {group: circuit.state for group, circuit in self._circuits.items()}
+
+    def reset(self) -> None:
+        """
+        Closes every circuit.
+        """
+        with self._lock:
+            self._circuits.clear()
@@ -0,0 +1,97 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class JsonCodec:
+    """
+    JSON codec using the standard library json module.
+    Encodes objects to bytes and decodes bytes to objects, used for request and response bodies.
+    """
+
+    name = "json"
+
+    def encode(self, obj) -> bytes:
+        """
+        Encode an object to JSON bytes.
+
+        Args:
+            obj: The JSON serializable object.
+
+        Returns:
+            bytes: The encoded body.
+        """
+        return json.dumps(obj).encode("utf-8")
+
+    def decode(self, data: bytes):
+        """
+        Decode JSON bytes to an object.
+
+        Args:
+            data (bytes): The encoded body.
+
+        Returns:
+            The decoded object.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    JSON codec using orjson, several times faster than the standard library for large documents.
+    Requires the optional orjson dependency (pip install api_client_base[fast]).
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:  # pragma: no cover
+            raise ImportError(
+                "OrjsonCodec requires orjson, install it with 'pip install api_client_base[fast]'"
+            )
+
+    def encode(self, obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def decode(self, data: bytes):
+        return orjson.loads(data)
+
+
+def available_codecs() -> dict:
+    """
+    Returns the codecs whose backends are installed.
+
+    Returns:
+        dict: The codec classes keyed by name, fastest last.
+    """
+    codecs = {JsonCodec.name: JsonCodec}
+    if orjson is not None:
+        codecs[OrjsonCodec.name] = OrjsonCodec
+    return codecs
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """
+    Creates a codec by name.
+
+    Args:
+        name (str, optional): The codec name ("json", "orjson"), or "auto" for the fastest installed backend.
+            Defaults to "auto".
+
+    Returns:
+        JsonCodec: The codec instance.
+
+    Raises:
+        ValueError: If the named codec is unknown or its backend is not installed.
+    """
+    codecs = available_codecs()
+    if name == "auto":
+        return list(codecs.values())[-1]()
+    if name not in codecs:
+        raise ValueError(
+            f"Unknown or unavailable codec '{name}', available: {', '.join(codecs)}"
+        )
+    return codecs[name]()
@@ -0,0 +1,136 @@
+import gzip
+import zlib
+from typing import Union
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+def _compress_gzip(data: bytes, level: int) -> bytes:
+    # a fixed mtime keeps the compressed body of identical payloads identical
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def _compress_deflate(data: bytes, level: int) -> bytes:
+    return zlib.compress(data, level)
+
+
+def _compress_br(data: bytes, level: int) -> bytes:
+    return brotli.compress(data, quality=level)
+
+
+def _compress_zstd(data: bytes, level: int) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+# encoding: (compress function, default level)
+_COMPRESSORS = {
+    "gzip": (_compress_gzip, 6),
+    "deflate": (_compress_deflate, 6),
+    "br": (_compress_br, 5),
+    "zstd": (_compress_zstd, 3),
+}
+
+
+def available_encodings() -> tuple:
+    """
+    Returns the encodings request bodies can be compressed with, the optional backends only when installed.
+
+    Returns:
+        tuple: The encoding names, e.g. ("gzip", "deflate", "br", "zstd").
+    """
+    encodings = ["gzip", "deflate"]
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    return tuple(encodings)
+
+
+def accepted_encodings() -> str:
+    """
+    Returns the response encodings the session can decode, as an Accept-Encoding header value.
+    urllib3 decodes gzip and deflate, plus br and zstd when their optional backends are installed.
+
+    Returns:
+        str: The header value, e.g. "gzip, deflate, br".
+    """
+    return ", ".join(encoding.strip() for encoding in ACCEPT_ENCODING.split(","))
+
+
+class Compression:
+    """
+    Compression settings of an ApiConsumer.
+
+    Responses: every encoding the session can decode is advertised with the Accept-Encoding header. Compressed
+    responses are decoded as they are read, so streamed pages are decompressed chunk by chunk.
+    Requests: bodies of at least min_size bytes are compressed with request_encoding and sent with a
+    Content-Encoding header. Off by default, as only some APIs accept compressed request bodies.
+    """
+
+    def __init__(
+        self,
+        request_encoding: Union[str, None] = None,
+        min_size: int = 1024,
+        level: Union[int, None] = None,
+        accept_encoding: Union[str, None] = None,
+    ):
+        """
+        Initializes the Compression.
+
+        Args:
+            request_encoding (Union[str, None], optional): The encoding of compressed request bodies, one of
+                available_encodings(). Defaults to None (request bodies are not compressed).
+            min_size (int, optional): The size in bytes from which request bodies are compressed. Defaults to 1024.
+            level (Union[int, None], optional): The compression level. Defaults to None (6 for gzip and deflate,
+                5 for br, 3 for zstd).
+            accept_encoding (Union[str, None], optional): The Accept-Encoding header sent with every request.
+                Defaults to None (every encoding the session can decode).
+
+        Raises:
+            ValueError: If the request encoding is unknown or its backend is not installed.
+        """
+        if (
+            request_encoding is not None
+            and request_encoding not in available_encodings()
+        ):
+            raise ValueError(
+                f"Unsupported request encoding {request_encoding!r}, expected one of {available_encodings()}"
+            )
+        self.request_encoding = request_encoding
+        self.min_size = min_size
+        self.level = level
+        self.accept_encoding = accept_encoding or accepted_encodings()
+
+    def should_compress(self, body: bytes) -> bool:
+        """
+        Decides whether a request body is compressed.
+
+        Args:
+            body (bytes): The encoded request body.
+
+        Returns:
+            bool: True if the body is large enough and request compression is enabled.
+        """
+        return self.request_encoding is not None and len(body) >= self.min_size
+
+    def compress(self, body: bytes) -> bytes:
+        """
+        Compresses a request body with the request encoding.
+
+        Args:
+            body (bytes): The encoded request body.
+
+        Returns:
+            bytes: The compressed body.
+        """
+        compress, default_level = _COMPRESSORS[self.request_encoding]
+        return compress(body, default_level if self.level is None else self.level)
@@ -7,10 +7,11 @@ class APIException(Exception):
 class HTTPError(APIException):
     """Exception raised for HTTP errors."""
 
-    def __init__(self, status_code: int, message: str):
+    def __init__(self, status_code: int, message: str, retry_after: str = None):
         super().__init__(message)
         self.status_code = status_code
         self.message = message
+        self.retry_after = retry_after
 
     def __str__(self):
         return f"Request Error: Request to URL failed with HTTP code {self.status_code}: {self.message}"
@@ -58,3 +59,27 @@ class UnexcpectedError(APIException):
 
     def __str__(self):
         return f"Unexcpected error: {self.message}"
+
+
+class RateLimitError(APIException):
+    """Exception raised when the client side rate limiter has no token for a request."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return f"Rate limit exceeded: {self.message}"
+
+
+class CircuitOpenError(APIException):
+    """Exception raised when the circuit breaker of an endpoint group is open and the request is not sent."""
+
+    def __init__(self, group: str, retry_after: float):
+        super().__init__(group)
+        self.group = group
+        self.retry_after = retry_after
+        self.message = f"Circuit open for {group}, retry in {retry_after:.1f}s"
+
+    def __str__(self):
+        return f"Circuit open: {self.message}"
@@ -0,0 +1,172 @@
+import re
+import time
+import threading
+from typing import Callable, Union
+
+_ID_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+def path_template(path: str) -> str:
+    """
+    Builds the template of a request path, without the query string and with numeric ids replaced by {id}.
+    e.g. device/devices/42/properties?size=10 -> device/devices/{id}/properties
+
+    Args:
+        path (str): The API endpoint path.
+
+    Returns:
+        str: The path template.
+    """
+    return _ID_SEGMENT.sub("{id}", "/" + path.split("?")[0].strip("/"))[1:]
+
+
+class RequestEvent:
+    """
+    Describes one attempt of a request, passed to the RequestHooks callbacks.
+
+    Timings are in seconds, only the phases the attempt went through are present:
+        sign: signing the request (e.g. the LogicMonitor LMv1 signature)
+        backoff: sleeping before a retried attempt
+        queue: waiting for the throttle and rate limiter
+        send: sending the request and receiving the response
+        first_byte: from sending the request until the response headers arrived (includes connecting)
+        download: reading the response body after the headers
+        decode: decoding the JSON body
+        total: the whole request, from the first attempt until the body was decoded
+    """
+
+    __slots__ = (
+        "method",
+        "path",
+        "endpoint",
+        "status",
+        "request_bytes",
+        "response_bytes",
+        "retries",
+        "retrying",
+        "error",
+        "timings",
+        "started",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        request_bytes: Union[int, None] = None,
+        retries: int = 0,
+        timings: dict = None,
+        started: float = None,
+    ):
+        """
+        Initializes the RequestEvent.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path, including any query string.
+            request_bytes (Union[int, None], optional): The size of the request body, if known.
+            retries (int, optional): The number of attempts made before this one. Defaults to 0.
+            timings (dict, optional): Timings already measured for this attempt. Defaults to none.
+            started (float, optional): The time.perf_counter() the request started at. Defaults to now.
+        """
+        self.method = method
+        self.path = path
+        self.endpoint = path_template(path)
+        self.status = None
+        self.request_bytes = request_bytes
+        self.response_bytes = None
+        self.retries = retries
+        self.retrying = False
+        self.error = None
+        self.timings = timings or {}
+        self.started = time.perf_counter() if started is None else started
+
+    def __repr__(self):
+        return (
+            f"RequestEvent({self.method} {self.endpoint} status={self.status} "
+            f"retries={self.retries} timings={self.timings})"
+        )
+
+    def next_attempt(self) -> "RequestEvent":
+        """
+        Builds the event of the next attempt of the same request.
+
+        Returns:
+            RequestEvent: The new event.
+        """
+        return RequestEvent(
+            self.method,
+            self.path,
+            self.request_bytes,
+            retries=self.retries + 1,
+            started=self.started,
+        )
+
+
+class RequestHooks:
+    """
+    Callbacks fired by the ApiConsumer for every request attempt.
+
+    Events:
+        before_send: the attempt is about to be sent
+        after_receive: a successful response was received and decoded
+        on_error: the attempt failed, event.error holds the APIException and event.retrying whether it is retried
+        circuit_state_change: the circuit breaker of an endpoint group changed state, called with a
+            CircuitStateChange instead of a RequestEvent
+
+    A consumer without subscribers does no timing at all, so instrumentation costs nothing unless it is used.
+    Callbacks are called on the thread making the request, exceptions they raise are not caught.
+    """
+
+    events = ("before_send", "after_receive", "on_error", "circuit_state_change")
+
+    def __init__(self):
+        """
+        Initializes the RequestHooks without any subscribers.
+        """
+        self._callbacks = {event: () for event in self.events}
+        self._lock = threading.Lock()
+
+    def __bool__(self):
+        return any(self._callbacks.values())
+
+    def subscribe(self, event: str, callback: Callable[[RequestEvent], None]) -> None:
+        """
+        Adds a callback for an event.
+
+        Args:
+            event (str): The event name, one of before_send, after_receive, on_error or circuit_state_change.
+            callback (Callable[[RequestEvent], None]): Called with the RequestEvent (or CircuitStateChange).
+
+        Raises:
+            ValueError: If the event name is unknown.
+        """
+        if event not in self._callbacks:
+            raise ValueError(f"Unknown event {event!r}, expected one of {self.events}")
+        with self._lock:
+            # replace rather than append, so emit can iterate without holding the lock
+            self._callbacks[event] = (*self._callbacks[event], callback)
+
+    def unsubscribe(self, event: str, callback: Callable[[RequestEvent], None]) -> None:
+        """
+        Removes a callback from an event.
+
+        Args:
+            event (str): The event name.
+            callback (Callable[[RequestEvent], None]): The callback to remove.
+        """
+        with self._lock:
+            self._callbacks[event] = tuple(
+                cb for cb in self._callbacks.get(event, ()) if cb is not callback
+            )
+
+    def emit(self, event: str, request_event: RequestEvent) -> None:
+        """
+        Calls every callback of an event.
+
+        Args:
+            event (str): The event name.
+            request_event (RequestEvent): The event passed to the callbacks.
+        """
+        for callback in self._callbacks[event]:
+            callback(request_event)
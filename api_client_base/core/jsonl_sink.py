@@ -0,0 +1,344 @@
+import bisect
+import glob
+import json
+import mmap
+import os
+import zlib
+from typing import Iterable, Union
+from api_client_base.core.codec import JsonCodec
+
+FSYNC_POLICIES = ("never", "close", "flush")
+
+
+class JsonlSink:
+    """
+    Writes items to newline delimited JSON files, so collections larger than memory can be exported to disk.
+
+    Items are encoded into a buffer and written a block at a time, once buffer_size bytes are waiting (or on flush).
+    Files are named after the path prefix, e.g. devices-00000.jsonl, devices-00001.jsonl, a new one is started
+    once a file reaches rotate_bytes. With compress, every block is written as a gzip member of its own, so a file
+    is still a valid .gz file and reading can start at any block.
+
+    The manifest (e.g. devices.manifest.json) lists the files with their number of items, their size and the byte
+    offset and first item of every block. It is written on flush and close, and read back by iter_jsonl, which
+    memory maps the files and decodes the items lazily from any item on.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        rotate_bytes: Union[int, None] = None,
+        compress: bool = False,
+        buffer_size: int = 1 << 20,
+        fsync: str = "close",
+        codec: JsonCodec = None,
+        level: int = 6,
+    ):
+        """
+        Initializes the JsonlSink, nothing is written until the first block.
+
+        Args:
+            path (str): The path prefix of the files, e.g. "exports/devices".
+            rotate_bytes (Union[int, None], optional): The size after which a new file is started, files end on a
+                block so they may be up to a block larger. Defaults to None (a single file).
+            compress (bool, optional): Write gzip compressed files (.jsonl.gz). Defaults to False.
+            buffer_size (int, optional): The bytes of encoded items buffered before a block is written.
+                Defaults to 1 MiB.
+            fsync (str, optional): When the files are flushed to disk, "never", "close" (when a file is rotated or
+                the sink closed) or "flush" (on every flush as well, e.g. before a checkpoint records a page).
+                Defaults to "close".
+            codec (JsonCodec, optional): The codec encoding the items, e.g. OrjsonCodec(). Defaults to JsonCodec().
+            level (int, optional): The gzip compression level. Defaults to 6.
+
+        Raises:
+            ValueError: If fsync is not one of the policies.
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(
+                f"Unknown fsync policy {fsync!r}, expected one of {', '.join(FSYNC_POLICIES)}"
+            )
+        self.path = path
+        self.rotate_bytes = rotate_bytes
+        self.compress = compress
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+        self.codec = codec or JsonCodec()
+        self.level = level
+        self.items = 0
+        self._files = []
+        self._file = None
+        self._buffer = bytearray()
+        self._buffer_items = 0
+        self._closed = False
+
+    @property
+    def manifest_path(self) -> str:
+        """
+        The path of the manifest, e.g. exports/devices.manifest.json.
+        """
+        return f"{self.path}.manifest.json"
+
+    def _get_file_path(self, index: int) -> str:
+        suffix = ".jsonl.gz" if self.compress else ".jsonl"
+        return f"{self.path}-{index:05d}{suffix}"
+
+    def manifest(self) -> dict:
+        """
+        Returns the manifest of the items written to disk.
+
+        Returns:
+            dict: The compression, the total number of items and every file with its items, bytes and blocks
+                ([first item, byte offset] pairs, relative to the file).
+        """
+        return {
+            "version": 1,
+            "compression": "gzip" if self.compress else None,
+            "items": sum(entry["items"] for entry in self._files),
+            "files": [
+                {**entry, "blocks": [list(block) for block in entry["blocks"]]}
+                for entry in self._files
+            ],
+        }
+
+    def write(self, item) -> None:
+        """
+        Adds an item, writing a block once the buffer is full.
+
+        Args:
+            item: The JSON serializable item.
+        """
+        self._buffer += self.codec.encode(item)
+        self._buffer += b"\n"
+        self._buffer_items += 1
+        self.items += 1
+        if len(self._buffer) >= self.buffer_size:
+            self._write_block()
+
+    def write_many(self, items: Iterable) -> None:
+        """
+        Adds items, see write.
+
+        Args:
+            items (Iterable): The JSON serializable items.
+        """
+        for item in items:
+            self.write(item)
+
+    def _write_block(self) -> None:
+        if not self._buffer_items:
+            return
+        if self._file is None:
+            self._files.append(
+                {
+                    "path": os.path.basename(self._get_file_path(len(self._files))),
+                    "items": 0,
+                    "bytes": 0,
+                    "blocks": [],
+                }
+            )
+            self._file = open(self._get_file_path(len(self._files) - 1), "wb")
+        entry = self._files[-1]
+
+        data = bytes(self._buffer)
+        if self.compress:
+            # a gzip member per block, so reading can start at any block
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+            data = compressor.compress(data) + compressor.flush()
+        self._file.write(data)
+        entry["blocks"].append([entry["items"], entry["bytes"]])
+        entry["items"] += self._buffer_items
+        entry["bytes"] += len(data)
+        self._buffer = bytearray()
+        self._buffer_items = 0
+
+        if self.rotate_bytes is not None and entry["bytes"] >= self.rotate_bytes:
+            self._close_file()
+
+    def _close_file(self) -> None:
+        if self._file is None:
+            return
+        self._file.flush()
+        if self.fsync != "never":
+            os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+
+    def _save_manifest(self) -> None:
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest(), f)
+            if self.fsync != "never":
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_path)
+
+    def flush(self) -> None:
+        """
+        Writes the buffered items as a block and saves the manifest, syncing the file with the "flush" policy.
+        """
+        self._write_block()
+        if self._file is not None:
+            self._file.flush()
+            if self.fsync == "flush":
+                os.fsync(self._file.fileno())
+        self._save_manifest()
+
+    def close(self) -> dict:
+        """
+        Writes the buffered items, closes the current file and saves the manifest. Does nothing once closed.
+
+        Returns:
+            dict: The manifest.
+        """
+        if not self._closed:
+            self._write_block()
+            self._close_file()
+            self._save_manifest()
+            self._closed = True
+        return self.manifest()
+
+    def resume(self, items: int) -> None:
+        """
+        Continues the files of a previous run after its first items, e.g. the items a Checkpoint recorded.
+        Whatever was written after them is truncated, and files after them are removed.
+
+        Args:
+            items (int): The number of items to keep, which must end on a block (as when flushed after every page).
+
+        Raises:
+            ValueError: If the manifest has fewer items, or they do not end on a block.
+        """
+        files = []
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                files = json.load(f)["files"]
+
+        kept, count = [], 0
+        for entry in files:
+            if count == items:
+                break
+            if count + entry["items"] <= items:
+                kept.append(entry)
+                count += entry["items"]
+                continue
+            offsets = {first: offset for first, offset in entry["blocks"]}
+            cut = items - count
+            if cut not in offsets:
+                raise ValueError(
+                    f"Cannot resume {self.path} after {items} items, item {cut} of {entry['path']} does not start a block"
+                )
+            entry["blocks"] = [block for block in entry["blocks"] if block[0] < cut]
+            entry["items"], entry["bytes"] = cut, offsets[cut]
+            kept.append(entry)
+            count = items
+        if count != items:
+            raise ValueError(
+                f"Cannot resume {self.path} after {items} items, the manifest has {count}"
+            )
+
+        # the files may hold blocks written after the manifest was saved
+        directory = os.path.dirname(self.path)
+        kept_paths = set()
+        for entry in kept:
+            file_path = os.path.join(directory, entry["path"])
+            kept_paths.add(os.path.abspath(file_path))
+            with open(file_path, "r+b") as f:
+                f.truncate(entry["bytes"])
+        for file_path in glob.glob(f"{glob.escape(self.path)}-[0-9]*.jsonl*"):
+            if os.path.abspath(file_path) not in kept_paths:
+                os.remove(file_path)
+
+        self._files = kept
+        self.items = items
+        last = kept[-1] if kept else None
+        if last is not None and (
+            self.rotate_bytes is None or last["bytes"] < self.rotate_bytes
+        ):
+            self._file = open(os.path.join(directory, last["path"]), "ab")
+        self._save_manifest()
+
+    def read(self, start: int = 0):
+        """
+        Iterates the items written, see iter_jsonl.
+
+        Args:
+            start (int, optional): The index of the first item. Defaults to 0.
+
+        Yields:
+            Each item from start on, in order.
+        """
+        return iter_jsonl(self.manifest_path, start=start, codec=self.codec)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def iter_jsonl(manifest_path: str, start: int = 0, codec: JsonCodec = None):
+    """
+    Iterates the items of the files of a JsonlSink lazily, memory mapping one file at a time.
+    The blocks of the manifest locate the item to start from without reading the files before it.
+
+    Args:
+        manifest_path (str): The manifest of the files.
+        start (int, optional): The index of the first item. Defaults to 0.
+        codec (JsonCodec, optional): The codec decoding the items. Defaults to JsonCodec().
+
+    Yields:
+        Each item from start on, in order.
+
+    Raises:
+        ValueError: If a file is shorter than its manifest says, e.g. truncated after it was written.
+    """
+    codec = codec or JsonCodec()
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    directory = os.path.dirname(manifest_path)
+    compressed = manifest["compression"] == "gzip"
+
+    first = 0
+    for entry in manifest["files"]:
+        if start >= first + entry["items"]:
+            first += entry["items"]
+            continue
+        skip = max(0, start - first)
+        blocks = entry["blocks"]
+        index = bisect.bisect_right([block[0] for block in blocks], skip) - 1
+        skip -= blocks[index][0]
+
+        with open(os.path.join(directory, entry["path"]), "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                if len(view) < entry["bytes"]:
+                    raise ValueError(
+                        f"{entry['path']} has {len(view)} bytes, its manifest records {entry['bytes']}"
+                    )
+                for line in _iter_lines(
+                    view, blocks, index, entry["bytes"], compressed
+                ):
+                    if skip:
+                        skip -= 1
+                        continue
+                    yield codec.decode(line)
+        first += entry["items"]
+
+
+def _iter_lines(view: mmap.mmap, blocks: list, index: int, size: int, compressed: bool):
+    if compressed:
+        for i in range(index, len(blocks)):
+            begin = blocks[i][1]
+            end = blocks[i + 1][1] if i + 1 < len(blocks) else size
+            # every block ends with a newline
+            yield from zlib.decompress(view[begin:end], 31).split(b"\n")[:-1]
+        return
+
+    position = blocks[index][1]
+    while position < size:
+        end = view.find(b"\n", position, size)
+        if end == -1:
+            raise ValueError(
+                "The last line has no newline, the file and its manifest disagree"
+            )
+        yield view[position:end]
+        position = end + 1
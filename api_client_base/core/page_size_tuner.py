@@ -0,0 +1,179 @@
+import json
+import os
+import threading
+from typing import Union
+from api_client_base.core.hooks import path_template
+
+
+class PageSizeTuner:
+    """
+    Adaptive page size for paginated fetches, tuned per endpoint (e.g. "GET device/devices").
+
+    Starting from the seed size, every full page measured adjusts the size of the next one:
+        - slower than target_latency: the size shrinks in proportion, towards a page taking target_latency
+        - faster: the size grows by growth, as long as the items per second keep improving
+        - once a larger page brought fewer items per second, the size settles on the best one measured
+        - after recover_after pages in a row held back by a slow page or a settled size, the cap is lifted and
+          the best size measured again, so a passing slow spell does not cap the endpoint for good
+    Sizes stay within min_size and max_size, and response bytes beyond max_bytes shrink the page too.
+
+    The size reached for every endpoint is kept in state_file (if given), so the next run starts from it.
+    """
+
+    def __init__(
+        self,
+        seed: int = 100,
+        min_size: int = 10,
+        max_size: int = 1000,
+        target_latency: float = 2.0,
+        growth: float = 2.0,
+        tolerance: float = 0.1,
+        recover_after: int = 10,
+        max_bytes: Union[int, None] = None,
+        state_file: Union[str, None] = None,
+    ):
+        """
+        Initializes the PageSizeTuner, loading the sizes of a previous run from state_file if it exists.
+
+        Args:
+            seed (int, optional): The size of the first page of an endpoint not seen before. Defaults to 100.
+            min_size (int, optional): The smallest page size. Defaults to 10.
+            max_size (int, optional): The largest page size. Defaults to 1000.
+            target_latency (float, optional): The seconds a page should take at most. Defaults to 2.
+            growth (float, optional): The factor the size grows by while pages are fast. Defaults to 2.
+            tolerance (float, optional): The fraction of items per second a larger page may lose before the size
+                settles on the best one. Defaults to 0.1.
+            recover_after (int, optional): The number of fast pages in a row held back by the cap after which
+                larger pages are tried again. Defaults to 10.
+            max_bytes (Union[int, None], optional): The largest response body of a page in bytes. Defaults to None.
+            state_file (Union[str, None], optional): The JSON file the sizes are kept in. Defaults to None.
+        """
+        self.seed = seed
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.growth = growth
+        self.tolerance = tolerance
+        self.recover_after = recover_after
+        self.max_bytes = max_bytes
+        self.state_file = state_file
+        self._sizes = {}
+        self._best = {}  # endpoint: (items per second, size)
+        self._ceilings = {}
+        self._capped = {}  # endpoint: fast pages in a row held back by the ceiling
+        self._lock = threading.Lock()
+        if state_file is not None and os.path.exists(state_file):
+            with open(state_file, encoding="utf-8") as f:
+                self._sizes = {key: int(size) for key, size in json.load(f).items()}
+
+    @staticmethod
+    def get_key(method: str, path: str) -> str:
+        """
+        Builds the endpoint a page size is tuned for.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+
+        Returns:
+            str: The endpoint, e.g. "GET device/devices".
+        """
+        return f"{method.upper()} {path_template(path)}"
+
+    def _clamp(self, size: float, limit: Union[int, None] = None) -> int:
+        upper = self.max_size if limit is None else min(self.max_size, limit)
+        return max(self.min_size, min(int(size), upper))
+
+    def get_size(self, key: str, limit: Union[int, None] = None) -> int:
+        """
+        Returns the page size to use for an endpoint.
+
+        Args:
+            key (str): The endpoint, see get_key.
+            limit (Union[int, None], optional): The API's maximum page size. Defaults to None.
+
+        Returns:
+            int: The page size.
+        """
+        with self._lock:
+            return self._clamp(self._sizes.get(key, self.seed), limit)
+
+    def observe(
+        self,
+        key: str,
+        size: int,
+        items: int,
+        elapsed: float,
+        response_bytes: Union[int, None] = None,
+        limit: Union[int, None] = None,
+    ) -> int:
+        """
+        Records a page and calculates the size of the next one.
+        Pages with fewer items than requested (the last page) say nothing about the size and are ignored.
+
+        Args:
+            key (str): The endpoint, see get_key.
+            size (int): The page size requested.
+            items (int): The number of items received.
+            elapsed (float): The seconds the page took.
+            response_bytes (Union[int, None], optional): The size of the response body, if known.
+            limit (Union[int, None], optional): The API's maximum page size. Defaults to None.
+
+        Returns:
+            int: The size of the next page.
+        """
+        with self._lock:
+            if items < size or elapsed <= 0:
+                return self._clamp(self._sizes.get(key, size), limit)
+
+            rate = items / elapsed
+            best_rate, best_size = self._best.get(key, (0.0, size))
+            ceiling = self._ceilings.get(key, self.max_size)
+            capped = 0
+            if elapsed > self.target_latency:
+                next_size = size * self.target_latency / elapsed
+                ceiling = min(ceiling, next_size)
+            elif size > best_size and rate < best_rate * (1 - self.tolerance):
+                # the larger page did not pay off, settle on the best size measured
+                next_size = ceiling = best_size
+            elif size * self.growth > ceiling:
+                capped = self._capped.get(key, 0) + 1
+                next_size = ceiling
+                if capped >= self.recover_after:
+                    # fast for a while at the cap, the slow spell may be over: lift it and measure the best again
+                    capped = 0
+                    next_size = size * self.growth
+                    ceiling = self.max_size
+                    best_rate = 0.0
+            else:
+                next_size = size * self.growth
+            self._capped[key] = capped
+            if rate > best_rate:
+                self._best[key] = (rate, size)
+            if response_bytes and self.max_bytes:
+                next_size = min(next_size, self.max_bytes * size / response_bytes)
+
+            self._ceilings[key] = ceiling
+            self._sizes[key] = next_size = self._clamp(next_size, limit)
+            return next_size
+
+    def sizes(self) -> dict:
+        """
+        Returns the page size reached for every endpoint.
+
+        Returns:
+            dict: The page size per endpoint.
+        """
+        with self._lock:
+            return dict(self._sizes)
+
+    def save(self) -> None:
+        """
+        Writes the page sizes to state_file, replacing it atomically. Does nothing without a state_file.
+        """
+        if self.state_file is None:
+            return
+        tmp_path = f"{self.state_file}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.sizes(), f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_file)
@@ -0,0 +1,209 @@
+from api_client_base.core.api_paginator import ApiPaginator, _PageEnd
+from api_client_base.core.api_consumer import ApiConsumer
+from api_client_base.core.jsonl_sink import JsonlSink
+from typing import Union
+
+
+class KeysetPaginator(ApiPaginator):
+    """
+    A Paginator implementation for keyset (cursor by key) pagination.
+    e.g. ?sort=id&size=1000 then ?sort=id&size=1000&filter=id>1999
+
+    Items are sorted by a unique, monotonic key and every next page is filtered to the keys after the last one seen,
+    instead of skipping an ever larger offset. The server can seek straight to the next page, so the cost of a page
+    stays flat however deep the scan goes, and items changing during the scan are neither skipped nor repeated.
+    The API must support sorting and filtering on the key.
+
+    Args:
+        key (str): The item key the pages are sorted and filtered by. Defaults to "id".
+        size_param (str): The URL parameter name for the page size. Defaults to "size".
+        size_value (int): The default page size. Defaults to 10.
+        items_key (str): The key in the response object that contains the items. Defaults to None.
+        sort_param (str): The URL parameter name for the sort order. Defaults to "sort".
+        filter_param (str): The URL parameter name for the filter. Defaults to "filter".
+    """
+
+    def __init__(
+        self,
+        key: str = "id",
+        size_param: str = "size",
+        size_value: int = 10,
+        items_key: Union[str, None] = None,
+        sort_param: str = "sort",
+        filter_param: str = "filter",
+        filter_format: str = "{key}>{value}",
+        filter_separator: str = ",",
+    ):
+        """
+        Initializes the KeysetPaginator with the required parameters.
+
+        Args:
+            key (str): The item key the pages are sorted and filtered by, unique and increasing.
+            size_param (str): The URL parameter name for the page size.
+            size_value (int): The default page size.
+            items_key (Union[str, None]): The key in the response object that contains the items. Defaults to None.
+            sort_param (str): The URL parameter name for the sort order, set to the key (ascending).
+            filter_param (str): The URL parameter name for the filter.
+            filter_format (str): The filter selecting the items after the last key seen. Defaults to "{key}>{value}".
+            filter_separator (str): Joins the keyset filter to a filter passed in the params (AND). Defaults to ",".
+        """
+        super().__init__(size_param, size_value)
+        self.key = key
+        self.items_key = items_key
+        self.sort_param = sort_param
+        self.filter_param = filter_param
+        self.filter_format = filter_format
+        self.filter_separator = filter_separator
+
+    def get_first_params(self, params: dict) -> dict:
+        """
+        Builds the parameters of the first page, sorted by the key.
+
+        Args:
+            params (dict): The URL parameters passed with the request.
+
+        Returns:
+            dict: The parameters for the first page.
+        """
+        return {**params, self.size_param: self.size_value, self.sort_param: self.key}
+
+    def get_next_params(self, response, current_params: dict) -> dict:
+        """
+        Builds the parameters for the page after the last item of the response.
+        The keyset filter replaces the one of the previous page, so current_params are the params of the first page.
+
+        Args:
+            response: The response object from the current page request.
+            current_params (dict): The parameters of the first page.
+
+        Returns:
+            dict: The parameters for the next page, or None if there are no more pages.
+        """
+        items = response.get(self.items_key, response)
+        return self._get_params_after(
+            items[-1] if items else None, len(items), current_params
+        )
+
+    def _get_params_after(self, last_item, count: int, first_params: dict) -> dict:
+        """
+        Builds the parameters for the page after an item.
+
+        Args:
+            last_item: The last item of the current page, None if it was empty.
+            count (int): The number of items in the current page.
+            first_params (dict): The parameters of the first page.
+
+        Returns:
+            dict: The parameters for the next page, or None if the current page was the last one.
+        """
+        # a page smaller than the page size is the last one
+        if last_item is None or count < first_params[self.size_param]:
+            return None
+
+        condition = self.filter_format.format(key=self.key, value=last_item[self.key])
+        base_filter = first_params.get(self.filter_param)
+        if base_filter:
+            condition = f"{base_filter}{self.filter_separator}{condition}"
+        return {**first_params, self.filter_param: condition}
+
+    def _iter_pages(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        start_params: Union[dict, None] = None,
+        **kwargs,
+    ):
+        """
+        Generator requesting every page in turn, see paginate.
+
+        Args:
+            consumer (ApiConsumer): The API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            start_params (Union[dict, None], optional): The params of the page to resume from. Defaults to None.
+            kwargs: Additional arguments for the request, including initial URL params.
+
+        Yields:
+            tuple: The data from each page and the params of the next one (None after the last page).
+        """
+        first_params = params = self.get_first_params(kwargs.pop("params", {}))
+        if start_params is not None:
+            params = start_params
+
+        while params:
+            response = consumer._make_request(method, path, params=params, **kwargs)
+            params = self.get_next_params(response, first_params)
+            yield response, params
+
+    def all(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        sink: Union[JsonlSink, None] = None,
+        **kwargs,
+    ) -> Union[list, dict]:
+        """
+        Fetches all pages of results and combines them into a single list.
+        If items_key is provided, it will be used to extract the items from the response.
+        Otherwise, the entire response will be used as the items.
+
+        Every page depends on the last key of the previous one, so pages are always fetched one at a time.
+        With a sink, the items are written to disk instead (see export) and the manifest is returned.
+
+        Args:
+            consumer (ApiConsumer): The API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            sink (Union[JsonlSink, None], optional): Writes the items to disk rather than returning them.
+                Defaults to None.
+            kwargs: Additional arguments for the request, including initial URL params, checkpoint and resume.
+
+        Returns:
+            Union[list, dict]: The combined data from all pages, or the manifest of the sink.
+        """
+        if sink is not None:
+            return self.export(consumer, method, path, sink, **kwargs)
+        all_results = []
+        for page in self.paginate(consumer, method, path, **kwargs):
+            all_results.extend(page.get(self.items_key, page))
+        return all_results
+
+    def _iter_streamed_items(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        start_params: Union[dict, None] = None,
+        **kwargs,
+    ):
+        """
+        Generator to iterate through the items of every page, decoding each page while it downloads.
+        The next page is requested after the last item streamed from the current one.
+
+        Args:
+            consumer (ApiConsumer): The API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            start_params (Union[dict, None], optional): The params of the page to resume from. Defaults to None.
+            kwargs: Additional arguments for the request, including initial URL params.
+
+        Yields:
+            Each item from each page, in order, followed by a _PageEnd with the params of the next page.
+        """
+        first_params = params = self.get_first_params(kwargs.pop("params", {}))
+        if start_params is not None:
+            params = start_params
+
+        while params:
+            page = consumer._stream_request(
+                method, path, items_key=self.items_key, params=params, **kwargs
+            )
+            item, count = None, 0
+            for item in page:
+                count += 1
+                yield item
+
+            params = self._get_params_after(item, count, first_params)
+            yield _PageEnd(params)
@@ -1,5 +1,10 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
 from api_client_base.core.api_paginator import ApiPaginator
 from api_client_base.core.api_consumer import ApiConsumer
+from api_client_base.core.checkpoint import Checkpoint
+from api_client_base.core.jsonl_sink import JsonlSink
+from api_client_base.core.page_size_tuner import PageSizeTuner
 from typing import Union
 
 
@@ -13,8 +18,13 @@ class OffsetPaginator(ApiPaginator):
         size_param (str): The URL parameter name for the page size. Defaults to "size".
         size_value (int): The default page size. Defaults to 10.
         total_key (str): The key in the response object that contains the total number of items. Defaults to "total".
+        page_size_tuner (PageSizeTuner): Adapts the page size to the measured latency. Defaults to None (fixed size).
+        max_size_value (int): The API's maximum page size. Defaults to None.
     """
 
+    page_size_tuner = None  # Optional PageSizeTuner adapting the page size per endpoint
+    max_size_value = None  # The API's maximum page size, if any
+
     def __init__(
         self,
         offset_param: str = "offset",
@@ -22,6 +32,8 @@ class OffsetPaginator(ApiPaginator):
         size_value: int = 10,
         total_key: str = "total",
         items_key: Union[str, None] = None,
+        page_size_tuner: PageSizeTuner = None,
+        max_size_value: Union[int, None] = None,
     ):
         """
         Initializes the OffsetPaginator with the required parameters.
@@ -32,15 +44,21 @@ class OffsetPaginator(ApiPaginator):
             size_value (int): The default page size.
             total_key (str): The key in the response object that contains the total number of items.
             items_key (Union[str, None]): The key in the response object that contains the items. Defaults to None.
+            page_size_tuner (PageSizeTuner): Adapts the size of every next page to the measured latency and response
+                bytes, remembering the size per endpoint. Defaults to None (every page is size_value items).
+            max_size_value (Union[int, None]): The API's maximum page size, which tuned sizes never exceed.
+                Defaults to None.
         """
         super().__init__(size_param, size_value)
         self.offset_param = offset_param
         self.total_key = total_key
         self.items_key = items_key
+        self.page_size_tuner = page_size_tuner
+        self.max_size_value = max_size_value
 
     def get_next_params(self, response, current_params: dict) -> dict:
         """
-        Updates the offset parameter for the next page.
+        Updates the offset parameter for the next page, after the size of the current one.
 
         Args:
             response: The response object from the current page request.
@@ -50,35 +68,129 @@ class OffsetPaginator(ApiPaginator):
             dict: The parameters for the next page, or None if there are no more pages.
         """
         current_offset = current_params.get(self.offset_param, 0)
+        size = current_params.get(self.size_param, self.size_value)
         total_items = response.get(self.total_key, 0)
 
         # Check if there are more items to fetch
-        if current_offset + self.size_value >= total_items:
+        if current_offset + size >= total_items:
             return None
 
         # Update the offset for the next page
-        next_offset = current_offset + self.size_value
+        next_offset = current_offset + size
         current_params[self.offset_param] = next_offset
         return current_params
 
-    def all(self, consumer: "ApiConsumer", method: str, path: str, **kwargs) -> list:
+    def get_remaining_params(self, response, current_params: dict) -> list:
+        """
+        Builds the parameters for every page after the current one.
+        The total in the first response means every later offset is known up front.
+
+        Args:
+            response: The response object from the current page request.
+            current_params (dict): The current URL parameters.
+
+        Returns:
+            list: A list of parameter dicts, one per remaining page, in offset order.
+        """
+        current_offset = current_params.get(self.offset_param, 0)
+        size = current_params.get(self.size_param, self.size_value)
+        total_items = response.get(self.total_key, 0)
+
+        return [
+            {**current_params, self.offset_param: offset}
+            for offset in range(current_offset + size, total_items, size)
+        ]
+
+    def all(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        max_workers: int = 1,
+        checkpoint: Union[Checkpoint, None] = None,
+        resume: bool = False,
+        sink: Union[JsonlSink, None] = None,
+        **kwargs,
+    ) -> Union[list, dict]:
         """
         Fetches all pages of results and combines them into a single list.
         If items_key is provided, it will be used to extract the items from the response.
         Otherwise, the entire response will be used as the items.
 
+        When max_workers is greater than 1 the first page is fetched on its own, then the remaining offsets
+        are fetched in parallel by up to max_workers threads sharing the consumer's connection pool.
+        Items are still returned in offset order. If any page fails, pages not yet started are cancelled
+        and the error is raised.
+        With a page_size_tuner, sequential fetches adapt the size of every page, parallel fetches use the size
+        remembered for the endpoint.
+        With a checkpoint, pages are fetched one at a time and recorded as they are added. On resume only the items
+        after the last page recorded are returned.
+        With a sink, the items are written to disk instead (see export) and the manifest is returned.
+
         Args:
             consumer (ApiConsumer): The API consumer instance.
             method (str): The HTTP method (GET, POST, etc.).
             path (str): The API endpoint path.
+            max_workers (int, optional): The maximum number of pages fetched at once. Defaults to 1 (sequential).
+            checkpoint (Union[Checkpoint, None], optional): Records the progress of the export. Defaults to None.
+            resume (bool, optional): Continue from the checkpoint rather than start over. Defaults to False.
+            sink (Union[JsonlSink, None], optional): Writes the items to disk rather than returning them.
+                Defaults to None.
             kwargs: Additional arguments for the request, including initial URL params.
 
         Returns:
-            list: The combined data from all pages.
+            Union[list, dict]: The combined data from all pages, or the manifest of the sink.
+
+        Raises:
+            ValueError: If a checkpoint or a sink is combined with max_workers greater than 1.
         """
         all_results = []
-        current_params = kwargs.pop("params", {})
-        current_params[self.size_param] = self.size_value
+        if checkpoint is not None or sink is not None:
+            if max_workers > 1:
+                raise ValueError(
+                    "A checkpoint or sink requires pages fetched in order, max_workers must be 1"
+                )
+            if sink is not None:
+                return self.export(
+                    consumer,
+                    method,
+                    path,
+                    sink,
+                    checkpoint=checkpoint,
+                    resume=resume,
+                    **kwargs,
+                )
+            for page in self.paginate(
+                consumer, method, path, checkpoint=checkpoint, resume=resume, **kwargs
+            ):
+                all_results.extend(page.get(self.items_key, page))
+            return all_results
+
+        current_params = {**kwargs.pop("params", {}), self.size_param: self.size_value}
+        tuner = self.page_size_tuner
+
+        if tuner is not None and max_workers <= 1:
+            for response, _ in self._iter_tuned_pages(
+                consumer, method, path, current_params, **kwargs
+            ):
+                all_results.extend(response.get(self.items_key, response))
+            return all_results
+
+        if tuner is not None:
+            key = tuner.get_key(method, path)
+            current_params[self.size_param] = tuner.get_size(key, self.max_size_value)
+
+        if max_workers > 1:
+            response = consumer._make_request(
+                method, path, params=current_params, **kwargs
+            )
+            all_results.extend(response.get(self.items_key, response))
+            remaining = self.get_remaining_params(response, current_params)
+            for items in self._fetch_pages(
+                consumer, method, path, remaining, max_workers, **kwargs
+            ):
+                all_results.extend(items)
+            return all_results
 
         while current_params:
             response = consumer._make_request(
@@ -90,3 +202,164 @@ class OffsetPaginator(ApiPaginator):
             current_params = self.get_next_params(response, current_params)
 
         return all_results
+
+    def _iter_pages(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        start_params: Union[dict, None] = None,
+        **kwargs,
+    ):
+        """
+        Generator requesting every page in turn, see paginate. Adapts the page sizes with a page_size_tuner.
+
+        Args:
+            consumer (ApiConsumer): The API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            start_params (Union[dict, None], optional): The params of the page to resume from. Defaults to None.
+            kwargs: Additional arguments for the request, including initial URL params.
+
+        Yields:
+            tuple: The data from each page and the params of the next one (None after the last page).
+        """
+        if self.page_size_tuner is None:
+            yield from super()._iter_pages(
+                consumer, method, path, start_params=start_params, **kwargs
+            )
+            return
+        params = kwargs.pop("params", {})
+        yield from self._iter_tuned_pages(
+            consumer, method, path, params, start_params=start_params, **kwargs
+        )
+
+    def _iter_streamed_items(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        start_params: Union[dict, None] = None,
+        **kwargs,
+    ):
+        """
+        Generator to iterate through the items of every page, decoding each page while it downloads.
+        With a page_size_tuner, the pages use the size remembered for the endpoint without tuning it: the time of a
+        streamed page includes processing its items, which says nothing about the API.
+
+        Args:
+            consumer (ApiConsumer): The API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            start_params (Union[dict, None], optional): The params of the page to resume from. Defaults to None.
+            kwargs: Additional arguments for the request, including initial URL params.
+
+        Yields:
+            Each item from each page, in order, followed by a _PageEnd with the params of the next page.
+        """
+        tuner = self.page_size_tuner
+        if tuner is not None and start_params is None:
+            size = tuner.get_size(tuner.get_key(method, path), self.max_size_value)
+            start_params = {**kwargs.pop("params", {}), self.size_param: size}
+        yield from super()._iter_streamed_items(
+            consumer, method, path, start_params=start_params, **kwargs
+        )
+
+    def _iter_tuned_pages(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        params: dict,
+        start_params: Union[dict, None] = None,
+        **kwargs,
+    ):
+        """
+        Generator requesting every page in turn, sizing every page from the latency and response bytes of the
+        previous one. The latency is the time to send, download and decode the page (see
+        ApiConsumer.last_response_elapsed), so waiting for the throttle or a rate limit token does not shrink pages.
+        The sizes reached are saved by the tuner once the pages are exhausted (or the caller stops).
+
+        Args:
+            consumer (ApiConsumer): The API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            params (dict): The initial URL params.
+            start_params (Union[dict, None], optional): The params of the page to resume from. Defaults to None.
+            kwargs: Additional arguments for the request.
+
+        Yields:
+            tuple: The data from each page and the params of the next one (None after the last page).
+        """
+        tuner = self.page_size_tuner
+        key = tuner.get_key(method, path)
+        params = {**params, self.size_param: tuner.get_size(key, self.max_size_value)}
+        if start_params is not None:
+            params = dict(start_params)
+        try:
+            while params:
+                size = params[self.size_param]
+                started = time.perf_counter()
+                response = consumer._make_request(method, path, params=params, **kwargs)
+                # the service time of the page, throttle and rate limiter waits or retries do not make it slower
+                elapsed = consumer.last_response_elapsed(since=started)
+                if elapsed is None:
+                    elapsed = time.perf_counter() - started
+                next_size = tuner.observe(
+                    key,
+                    size,
+                    len(response.get(self.items_key, response)),
+                    elapsed,
+                    consumer.last_response_bytes(),
+                    self.max_size_value,
+                )
+                params = self.get_next_params(response, dict(params))
+                if params:
+                    params[self.size_param] = next_size
+                yield response, params
+        finally:
+            tuner.save()
+
+    def _fetch_pages(
+        self,
+        consumer: "ApiConsumer",
+        method: str,
+        path: str,
+        pages: list,
+        max_workers: int,
+        **kwargs,
+    ) -> list:
+        """
+        Fetches the given pages in parallel with bounded concurrency.
+
+        Args:
+            consumer (ApiConsumer): The API consumer instance.
+            method (str): The HTTP method (GET, POST, etc.).
+            path (str): The API endpoint path.
+            pages (list): The parameters for each page to fetch.
+            max_workers (int): The maximum number of pages fetched at once.
+            kwargs: Additional arguments for the request.
+
+        Returns:
+            list: The items of each page, in the same order as pages.
+
+        Raises:
+            APIException: The first error raised by a page, as soon as it happens.
+        """
+
+        def fetch(params: dict):
+            response = consumer._make_request(method, path, params=params, **kwargs)
+            return response.get(self.items_key, response)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [executor.submit(fetch, params) for params in pages]
+            # surface the first failure as soon as it happens rather than after every page before it
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in done:
+                if future.exception() is not None:
+                    raise future.exception()
+            return [future.result() for future in futures]
+        finally:
+            # on failure, drop the pages that have not started and do not wait for the ones in flight
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,101 @@
+import queue
+import threading
+from typing import Iterator
+
+_DONE = object()
+
+
+def batched(iterator: Iterator, size: int):
+    """
+    Groups the values of an iterator into lists of up to size values.
+
+    Args:
+        iterator (Iterator): The values.
+        size (int): The maximum number of values per list.
+
+    Yields:
+        list: The next values, the last list may be shorter.
+    """
+    batch = []
+    for value in iterator:
+        batch.append(value)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class Prefetcher:
+    """
+    Iterates an iterator on a background thread, reading up to depth values ahead of the caller.
+
+    The values are handed over through a bounded queue: once depth values are waiting the worker blocks until the
+    caller takes one, so a slow caller never makes it read further ahead. An exception raised by the iterator is
+    raised to the caller after the values before it. If the caller stops early (or the iteration is closed), the
+    worker stops after the value it is reading and closes the iterator, so nothing more is requested.
+    Nothing is read until the first value is requested.
+    """
+
+    def __init__(self, iterator: Iterator, depth: int = 2):
+        """
+        Initializes the Prefetcher.
+
+        Args:
+            iterator (Iterator): The iterator to read ahead, e.g. the pages of a paginator.
+            depth (int, optional): The maximum number of values read ahead. Defaults to 2.
+
+        Raises:
+            ValueError: If depth is lower than 1.
+        """
+        if depth < 1:
+            raise ValueError(f"Prefetch depth must be at least 1, got {depth}")
+        self.depth = depth
+        self._iterator = iterator
+        self._queue = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _put(self, entry: tuple) -> bool:
+        # wake up regularly while the queue is full, to notice the caller stopped
+        while not self._stop.is_set():
+            try:
+                self._queue.put(entry, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self) -> None:
+        try:
+            for value in self._iterator:
+                if not self._put((value, None)):
+                    return
+            self._put((_DONE, None))
+        except BaseException as err:
+            self._put((_DONE, err))
+        finally:
+            close = getattr(self._iterator, "close", None)
+            if close is not None:
+                close()
+
+    def __iter__(self):
+        self._thread.start()
+        try:
+            while True:
+                value, error = self._queue.get()
+                if value is _DONE:
+                    if error is not None:
+                        raise error
+                    return
+                yield value
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stops the worker, waiting for the value it is reading.
+        """
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
@@ -0,0 +1,138 @@
+import threading
+import time
+from typing import Union
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens are added at rate per second up to capacity. Every request takes one token, so bursts of up to
+    capacity requests are allowed while the sustained throughput stays at rate.
+    """
+
+    def __init__(self, rate: float, capacity: Union[float, None] = None):
+        """
+        Initializes the TokenBucket full.
+
+        Args:
+            rate (float): The number of tokens added per second.
+            capacity (Union[float, None], optional): The maximum number of tokens. Defaults to rate (a one second burst).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def acquire(
+        self,
+        tokens: float = 1,
+        blocking: bool = True,
+        timeout: Union[float, None] = None,
+    ) -> bool:
+        """
+        Takes tokens from the bucket, waiting for them to be added if needed.
+
+        Args:
+            tokens (float, optional): The number of tokens to take. Defaults to 1.
+            blocking (bool, optional): Wait until the tokens are available. Defaults to True.
+            timeout (Union[float, None], optional): The maximum number of seconds to wait. Defaults to None (no limit).
+
+        Returns:
+            bool: True if the tokens were taken, False if not blocking or the timeout expired.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return True
+                wait = (tokens - self.tokens) / self.rate
+            if not blocking:
+                return False
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """
+    Client side rate limiter made of token buckets, which can be shared by several consumers and threads.
+
+    The bucket used for a request is the one with the longest matching path prefix, then the bucket for its
+    method, then the default bucket. Requests matching no bucket are not limited.
+    """
+
+    def __init__(
+        self,
+        default: Union[TokenBucket, None] = None,
+        per_method: Union[dict, None] = None,
+        per_path_prefix: Union[dict, None] = None,
+        blocking: bool = True,
+        timeout: Union[float, None] = None,
+    ):
+        """
+        Initializes the RateLimiter.
+
+        Args:
+            default (Union[TokenBucket, None], optional): The bucket used when no other bucket matches.
+            per_method (Union[dict, None], optional): Buckets keyed by HTTP method, e.g. {"GET": TokenBucket(10)}.
+            per_path_prefix (Union[dict, None], optional): Buckets keyed by path prefix,
+                e.g. {"device/devices": TokenBucket(5)}.
+            blocking (bool, optional): Wait for a token instead of failing straight away. Defaults to True.
+            timeout (Union[float, None], optional): The maximum number of seconds to wait for a token. Defaults to None.
+        """
+        self.default = default
+        self.per_method = {k.upper(): v for k, v in (per_method or {}).items()}
+        self.per_path_prefix = {
+            k.strip("/"): v for k, v in (per_path_prefix or {}).items()
+        }
+        self.blocking = blocking
+        self.timeout = timeout
+
+    def get_bucket(self, method: str, path: str) -> Union[TokenBucket, None]:
+        """
+        Finds the bucket for a request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+
+        Returns:
+            Union[TokenBucket, None]: The bucket, or None if the request is not limited.
+        """
+        path = path.split("?")[0].strip("/")
+        prefixes = [p for p in self.per_path_prefix if path.startswith(p)]
+        if prefixes:
+            return self.per_path_prefix[max(prefixes, key=len)]
+        return self.per_method.get(method.upper(), self.default)
+
+    def acquire(self, method: str, path: str) -> bool:
+        """
+        Takes a token for a request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+
+        Returns:
+            bool: True if the request may be sent.
+        """
+        bucket = self.get_bucket(method, path)
+        if bucket is None:
+            return True
+        return bucket.acquire(blocking=self.blocking, timeout=self.timeout)
@@ -0,0 +1,376 @@
+import os
+import bisect
+import threading
+import time
+from collections import deque
+from api_client_base.core.hooks import RequestHooks, RequestEvent
+
+# Latency bucket upper bounds in seconds, from 5ms to 60s
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class LatencyHistogram:
+    """
+    Fixed bucket latency histogram. Quantiles are estimated by interpolating within the bucket they fall in.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: tuple = DEFAULT_BUCKETS):
+        """
+        Initializes an empty LatencyHistogram.
+
+        Args:
+            bounds (tuple, optional): The sorted bucket upper bounds in seconds. Defaults to DEFAULT_BUCKETS.
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # the last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Records a latency.
+
+        Args:
+            value (float): The latency in seconds.
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Adds the observations of another histogram with the same bounds.
+
+        Args:
+            other (LatencyHistogram): The histogram to add.
+        """
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.sum += other.sum
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates a quantile.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float: The estimated latency in seconds, 0.0 when empty. Values above the last bound report the last bound.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if i == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[i - 1] if i else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.bounds[-1]  # pragma: no cover
+
+
+class EndpointStats:
+    """
+    Cumulative counters of one endpoint.
+    """
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "retries",
+        "request_bytes",
+        "response_bytes",
+        "latency",
+    )
+
+    def __init__(self, bounds: tuple):
+        self.requests = 0
+        self.errors = {}
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.latency = LatencyHistogram(bounds)
+
+    def copy(self) -> "EndpointStats":
+        """
+        Returns a copy of the counters.
+
+        Returns:
+            EndpointStats: The copy.
+        """
+        copy = EndpointStats(self.latency.bounds)
+        copy.requests = self.requests
+        copy.errors = dict(self.errors)
+        copy.retries = self.retries
+        copy.request_bytes = self.request_bytes
+        copy.response_bytes = self.response_bytes
+        copy.latency.merge(self.latency)
+        return copy
+
+
+class RequestStats:
+    """
+    Low overhead request statistics per endpoint, fed by the RequestHooks of one or more consumers.
+
+    Endpoints are keyed by method and path template (e.g. "GET device/devices/{id}").
+    Counters and latency histograms are cumulative, as expected by Prometheus; the p50 / p95 / p99 latencies of
+    snapshot() are taken over a rolling window, so they follow the current behaviour of the API.
+    A request is counted once it completes: retried attempts only increase the retry count.
+    """
+
+    quantiles = (0.5, 0.95, 0.99)
+
+    def __init__(
+        self,
+        window: float = 300,
+        slots: int = 10,
+        bounds: tuple = DEFAULT_BUCKETS,
+        namespace: str = "api_client",
+    ):
+        """
+        Initializes the RequestStats.
+
+        Args:
+            window (float, optional): The rolling window of the latency quantiles in seconds. Defaults to 300.
+            slots (int, optional): The number of slots the window is split in, the window moves one slot at a time.
+                Defaults to 10.
+            bounds (tuple, optional): The latency bucket upper bounds in seconds. Defaults to DEFAULT_BUCKETS.
+            namespace (str, optional): The prefix of the Prometheus metric names. Defaults to "api_client".
+        """
+        self.window = window
+        self.slot_width = window / slots
+        self.bounds = tuple(bounds)
+        self.namespace = namespace
+        self._endpoints = {}
+        self._slots = deque()  # (slot number, {endpoint: LatencyHistogram})
+        self._lock = threading.Lock()
+
+    def attach(self, hooks: RequestHooks) -> None:
+        """
+        Subscribes to the after_receive and on_error events of a consumer's hooks.
+
+        Args:
+            hooks (RequestHooks): The hooks of the consumer.
+        """
+        hooks.subscribe("after_receive", self.record)
+        hooks.subscribe("on_error", self.record)
+
+    def detach(self, hooks: RequestHooks) -> None:
+        """
+        Unsubscribes from a consumer's hooks.
+
+        Args:
+            hooks (RequestHooks): The hooks of the consumer.
+        """
+        hooks.unsubscribe("after_receive", self.record)
+        hooks.unsubscribe("on_error", self.record)
+
+    def record(self, event: RequestEvent) -> None:
+        """
+        Records a RequestEvent, used as the hooks callback.
+
+        Args:
+            event (RequestEvent): The event of an attempt.
+        """
+        key = (event.method, event.endpoint)
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = EndpointStats(self.bounds)
+            if event.retrying:
+                stats.retries += 1
+                return
+
+            total = event.timings.get("total", 0.0)
+            stats.requests += 1
+            stats.request_bytes += event.request_bytes or 0
+            stats.response_bytes += event.response_bytes or 0
+            stats.latency.observe(total)
+            if event.error is not None:
+                status = str(event.status or type(event.error).__name__)
+                stats.errors[status] = stats.errors.get(status, 0) + 1
+            self._rolling(time.monotonic(), key).observe(total)
+
+    def _rolling(self, now: float, key: tuple) -> LatencyHistogram:
+        """
+        Returns the histogram of the current slot of the rolling window, dropping the slots which left the window.
+        Must be called with the lock held.
+
+        Args:
+            now (float): The time.monotonic() now.
+            key (tuple): The endpoint key.
+
+        Returns:
+            LatencyHistogram: The histogram to record the latency in.
+        """
+        slot = int(now // self.slot_width)
+        if not self._slots or self._slots[-1][0] != slot:
+            self._slots.append((slot, {}))
+        self._expire(slot)
+        histograms = self._slots[-1][1]
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = LatencyHistogram(self.bounds)
+        return histogram
+
+    def _expire(self, slot: int) -> None:
+        """
+        Drops the slots older than the window. Must be called with the lock held.
+
+        Args:
+            slot (int): The current slot number.
+        """
+        oldest = slot - int(round(self.window / self.slot_width)) + 1
+        while self._slots and self._slots[0][0] < oldest:
+            self._slots.popleft()
+
+    def reset(self) -> None:
+        """
+        Clears all statistics.
+        """
+        with self._lock:
+            self._endpoints.clear()
+            self._slots.clear()
+
+    def snapshot(self) -> dict:
+        """
+        Returns the statistics of every endpoint seen so far.
+
+        Returns:
+            dict: Per endpoint (e.g. "GET device/devices"), the requests, errors by status, retries, bytes and the
+                latency count, sum and p50 / p95 / p99 over the rolling window, in seconds.
+        """
+        with self._lock:
+            self._expire(int(time.monotonic() // self.slot_width))
+            rolling = {}
+            for _, histograms in self._slots:
+                for key, histogram in histograms.items():
+                    if key not in rolling:
+                        rolling[key] = LatencyHistogram(self.bounds)
+                    rolling[key].merge(histogram)
+
+            snapshot = {}
+            for key, stats in self._endpoints.items():
+                window = rolling.get(key, LatencyHistogram(self.bounds))
+                latency = {"count": window.count, "sum": window.sum}
+                for q in self.quantiles:
+                    latency[f"p{int(q * 100)}"] = window.quantile(q)
+                snapshot[" ".join(key)] = {
+                    "requests": stats.requests,
+                    "errors": dict(stats.errors),
+                    "retries": stats.retries,
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                    "latency": latency,
+                }
+            return snapshot
+
+    def render_prometheus(self) -> str:
+        """
+        Renders the statistics in the Prometheus text exposition format.
+        Can be served by a scrape callback as is, or written to a file for a textfile collector.
+
+        Returns:
+            str: The metrics.
+        """
+        ns = self.namespace
+        lines = []
+
+        def family(name: str, kind: str, help: str):
+            lines.append(f"# HELP {ns}_{name} {help}")
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+
+        with self._lock:
+            # copy so every endpoint is rendered consistently outside of the lock
+            endpoints = [
+                (self._labels(method, endpoint), stats.copy())
+                for (method, endpoint), stats in sorted(self._endpoints.items())
+            ]
+
+        family("requests_total", "counter", "Completed requests.")
+        for labels, stats in endpoints:
+            lines.append(f"{ns}_requests_total{{{labels}}} {stats.requests}")
+        family("errors_total", "counter", "Failed requests by status or error type.")
+        for labels, stats in endpoints:
+            for status, count in sorted(stats.errors.items()):
+                status = self._escape(status)
+                lines.append(f'{ns}_errors_total{{{labels},status="{status}"}} {count}')
+        family("retries_total", "counter", "Retried request attempts.")
+        for labels, stats in endpoints:
+            lines.append(f"{ns}_retries_total{{{labels}}} {stats.retries}")
+        family("request_bytes_total", "counter", "Request body bytes sent.")
+        for labels, stats in endpoints:
+            lines.append(f"{ns}_request_bytes_total{{{labels}}} {stats.request_bytes}")
+        family("response_bytes_total", "counter", "Response body bytes received.")
+        for labels, stats in endpoints:
+            lines.append(
+                f"{ns}_response_bytes_total{{{labels}}} {stats.response_bytes}"
+            )
+        family("request_duration_seconds", "histogram", "Request latency.")
+        for labels, stats in endpoints:
+            cumulative = 0
+            for bound, count in zip(self.bounds + ("+Inf",), stats.latency.counts):
+                cumulative += count
+                lines.append(
+                    f'{ns}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f"{ns}_request_duration_seconds_sum{{{labels}}} {stats.latency.sum}"
+            )
+            lines.append(
+                f"{ns}_request_duration_seconds_count{{{labels}}} {stats.latency.count}"
+            )
+
+        family(
+            "request_duration_quantile_seconds",
+            "gauge",
+            f"Request latency quantiles over the last {self.window:g} seconds.",
+        )
+        for key, stats in sorted(self.snapshot().items()):
+            method, endpoint = key.split(" ", 1)
+            labels = self._labels(method, endpoint)
+            for q in self.quantiles:
+                value = stats["latency"][f"p{int(q * 100)}"]
+                lines.append(
+                    f'{ns}_request_duration_quantile_seconds{{{labels},quantile="{q}"}} {value}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """
+        Writes the Prometheus metrics to a file, replacing it atomically so a scraper never reads a partial file.
+
+        Args:
+            path (str): The file path, e.g. a node_exporter textfile collector .prom file.
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+
+    def _labels(self, method: str, endpoint: str) -> str:
+        return f'method="{self._escape(method)}",endpoint="{self._escape(endpoint)}"'
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
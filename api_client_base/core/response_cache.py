@@ -0,0 +1,163 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Union
+
+
+class ResponseCache:
+    """
+    In-memory TTL / LRU cache for idempotent (GET) responses.
+
+    Entries are keyed on method, path, normalized params and the values of the vary_headers.
+    Entries expire after ttl seconds and the least recently used entries are evicted once max_entries
+    or max_bytes is exceeded. The raw response bodies are stored, so every hit returns a fresh object.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        max_entries: int = 1024,
+        max_bytes: Union[int, None] = None,
+        vary_headers: tuple = ("Accept", "X-Version"),
+    ):
+        """
+        Initializes the ResponseCache.
+
+        Args:
+            ttl (float, optional): Seconds an entry stays valid. Defaults to 60.
+            max_entries (int, optional): The maximum number of entries. Defaults to 1024.
+            max_bytes (Union[int, None], optional): The maximum total size of the stored bodies. Defaults to None (unbounded).
+            vary_headers (tuple, optional): The request headers whose values are part of the key.
+                Defaults to ("Accept", "X-Version").
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.vary_headers = vary_headers
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def make_key(
+        self, method: str, path: str, params=None, headers: dict = None
+    ) -> tuple:
+        """
+        Builds the cache key for a request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The API endpoint path.
+            params (dict or list, optional): The URL params, in any order.
+            headers (dict, optional): The request headers.
+
+        Returns:
+            tuple: The cache key.
+        """
+        items = params.items() if isinstance(params, dict) else params or ()
+        normalized_params = tuple(sorted((str(k), str(v)) for k, v in items))
+        headers = headers or {}
+        vary = tuple(headers.get(name) for name in self.vary_headers)
+        return (method.upper(), path, normalized_params, vary)
+
+    def get(self, key: tuple) -> Union[bytes, None]:
+        """
+        Looks up a stored response body, counting the hit or miss.
+
+        Args:
+            key (tuple): The cache key from make_key.
+
+        Returns:
+            Union[bytes, None]: The stored body, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: tuple, content: bytes) -> None:
+        """
+        Stores a response body, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (tuple): The cache key from make_key.
+            content (bytes): The raw response body.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, content)
+            self.size += len(content)
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.size > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, path: str) -> int:
+        """
+        Removes every entry for the path, its sub-resources and its parent collections.
+        e.g. invalidating device/devices/1 removes device/devices/1, device/devices/1/properties and device/devices.
+
+        Args:
+            path (str): The API endpoint path that was modified.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        path = path.split("?")[0].strip("/")
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if self._related(key[1].split("?")[0].strip("/"), path)
+            ]
+            for key in stale:
+                self._remove(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters, useful for sizing the cache.
+
+        Returns:
+            dict: The hits, misses, evictions, entry count and stored bytes.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.size,
+        }
+
+    def _remove(self, key: tuple) -> None:
+        _, content = self._entries.pop(key)
+        self.size -= len(content)
+
+    @staticmethod
+    def _related(cached_path: str, path: str) -> bool:
+        return (
+            cached_path == path
+            or cached_path.startswith(path + "/")
+            or path.startswith(cached_path + "/")
+        )
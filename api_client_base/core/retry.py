@@ -0,0 +1,116 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Union
+from api_client_base.core.exceptions import (
+    APIException,
+    HTTPError,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+class RetryPolicy:
+    """
+    Retry policy for failed requests.
+
+    Retries failed attempts with exponential backoff and full jitter, honouring the Retry-After header.
+    A Retry-After longer than max_backoff is not waited for, the error is raised instead of blocking the caller.
+    Only idempotent methods are retried by default so a POST or PATCH is never sent twice unless allowed.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        status_forcelist: tuple = (429, 500, 502, 503, 504),
+        retry_exceptions: tuple = (ConnectionError, TimeoutError),
+        allowed_methods: tuple = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE"),
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        respect_retry_after: bool = True,
+    ):
+        """
+        Initializes the RetryPolicy.
+
+        Args:
+            max_attempts (int, optional): The maximum number of attempts, including the first. Defaults to 3.
+            status_forcelist (tuple, optional): HTTP status codes that are retried. Defaults to (429, 500, 502, 503, 504).
+            retry_exceptions (tuple, optional): Exceptions that are retried. Defaults to (ConnectionError, TimeoutError).
+            allowed_methods (tuple, optional): HTTP methods that may be retried.
+                Defaults to the idempotent methods ("GET", "HEAD", "OPTIONS", "PUT", "DELETE").
+            backoff_factor (float, optional): The base delay in seconds, doubled on every attempt. Defaults to 0.5.
+            max_backoff (float, optional): The maximum backoff delay in seconds, Retry-After included. Defaults to 30.
+            respect_retry_after (bool, optional): Wait for the Retry-After header when present. Defaults to True.
+        """
+        self.max_attempts = max_attempts
+        self.status_forcelist = status_forcelist
+        self.retry_exceptions = retry_exceptions
+        self.allowed_methods = allowed_methods
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.respect_retry_after = respect_retry_after
+
+    def should_retry(self, method: str, error: APIException, attempt: int) -> bool:
+        """
+        Decides whether a failed attempt should be retried.
+
+        Args:
+            method (str): The HTTP method.
+            error (APIException): The error raised by the attempt.
+            attempt (int): The number of the failed attempt, starting at 1.
+
+        Returns:
+            bool: True if the request should be sent again.
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.allowed_methods:
+            return False
+        if isinstance(error, HTTPError):
+            retry_after = getattr(error, "retry_after", None)
+            if self.respect_retry_after and retry_after:
+                delay = self.parse_retry_after(retry_after)
+                if delay is not None and delay > self.max_backoff:
+                    # the server asks for a longer wait than the policy allows, give up rather than block
+                    return False
+            return error.status_code in self.status_forcelist
+        return isinstance(error, self.retry_exceptions)
+
+    def get_backoff(self, attempt: int, retry_after: Union[str, None] = None) -> float:
+        """
+        Calculates the delay before the next attempt, at most max_backoff.
+        Uses the Retry-After header if present, otherwise exponential backoff with full jitter.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting at 1.
+            retry_after (Union[str, None], optional): The Retry-After header of the failed response.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        if self.respect_retry_after and retry_after:
+            delay = self.parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_backoff)
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, backoff)
+
+    @staticmethod
+    def parse_retry_after(retry_after: str) -> Union[float, None]:
+        """
+        Parses a Retry-After header given in seconds or as an HTTP date.
+
+        Args:
+            retry_after (str): The Retry-After header.
+
+        Returns:
+            Union[float, None]: The delay in seconds, or None if the header cannot be parsed.
+        """
+        try:
+            return max(0.0, float(retry_after))
+        except (TypeError, ValueError):
+            pass
+        try:
+            return max(
+                0.0, parsedate_to_datetime(retry_after).timestamp() - time.time()
+            )
+        except (TypeError, ValueError):
+            return None
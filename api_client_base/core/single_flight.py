@@ -0,0 +1,189 @@
+import asyncio
+import threading
+from typing import Callable
+
+
+def make_key(
+    method: str,
+    path: str,
+    params=None,
+    headers: dict = None,
+    ignore_headers: tuple = ("Authorization",),
+) -> tuple:
+    """
+    Builds the key identifying identical requests.
+    Headers which differ between otherwise identical requests (e.g. a per request signature) are ignored.
+
+    Args:
+        method (str): The HTTP method.
+        path (str): The API endpoint path.
+        params (dict or list, optional): The URL params, in any order.
+        headers (dict, optional): The request headers.
+        ignore_headers (tuple, optional): The headers left out of the key. Defaults to ("Authorization",).
+
+    Returns:
+        tuple: The key.
+    """
+    items = params.items() if isinstance(params, dict) else params or ()
+    headers = headers or {}
+    return (
+        method.upper(),
+        path,
+        tuple(sorted((str(k), str(v)) for k, v in items)),
+        tuple(
+            sorted(
+                (k.lower(), str(v))
+                for k, v in headers.items()
+                if k not in ignore_headers
+            )
+        ),
+    )
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls across threads.
+
+    While a call for a key is in flight, other callers with the same key wait for its result (or its exception)
+    instead of making the call again. Nothing is cached: once the call completes, the next caller makes a new one.
+    """
+
+    def __init__(self, ignore_headers: tuple = ("Authorization",)):
+        """
+        Initializes the SingleFlight.
+
+        Args:
+            ignore_headers (tuple, optional): The request headers left out of the key. Defaults to ("Authorization",).
+        """
+        self.ignore_headers = ignore_headers
+        self.calls = 0
+        self.deduplicated = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def make_key(self, method: str, path: str, params=None, headers: dict = None):
+        """
+        Builds the key of a request, see make_key.
+        """
+        return make_key(method, path, params, headers, self.ignore_headers)
+
+    def do(self, key, func: Callable) -> tuple:
+        """
+        Calls func, unless a call with the same key is in flight, in which case its outcome is shared.
+
+        Args:
+            key: The key of the call.
+            func (Callable): Called without arguments to make the call.
+
+        Returns:
+            tuple: The result and whether it was shared from another caller's call.
+
+        Raises:
+            Exception: The exception raised by the call.
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.deduplicated += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self) -> dict:
+        """
+        Returns the coalescing metrics.
+
+        Returns:
+            dict: The number of calls, of calls deduplicated and of calls in flight.
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "deduplicated": self.deduplicated,
+                "in_flight": len(self._calls),
+            }
+
+
+class AsyncSingleFlight(SingleFlight):
+    """
+    Coalesces identical concurrent calls on one event loop.
+    Same as SingleFlight, for coroutines: callers with the same key await the call in flight.
+    """
+
+    async def do(self, key, func: Callable) -> tuple:
+        """
+        Awaits func(), unless a call with the same key is in flight, in which case its outcome is shared.
+
+        Args:
+            key: The key of the call.
+            func (Callable): Called without arguments, returning the awaitable making the call.
+
+        Returns:
+            tuple: The result and whether it was shared from another caller's call.
+
+        Raises:
+            Exception: The exception raised by the call.
+        """
+        self.calls += 1
+        future = self._calls.get(key)
+        if future is not None:
+            self.deduplicated += 1
+            # shield so a cancelled follower does not cancel the call of the others
+            return await asyncio.shield(future), True
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        # retrieve the outcome so an error nobody else awaited is not reported as never retrieved
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._calls[key]
+        return result, False
+
+    def stats(self) -> dict:
+        """
+        Returns the coalescing metrics.
+
+        Returns:
+            dict: The number of calls, of calls deduplicated and of calls in flight.
+        """
+        return {
+            "calls": self.calls,
+            "deduplicated": self.deduplicated,
+            "in_flight": len(self._calls),
+        }
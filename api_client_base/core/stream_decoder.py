@@ -0,0 +1,243 @@
+import re
+import json
+import codecs
+from typing import Union
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_VALUE_END = re.compile(r"[ \t\n\r,:\]}]")
+
+
+class StreamingItemsDecoder:
+    """
+    Incremental decoder for paged JSON responses, fed the response body in chunks.
+
+    The elements of the items array are returned one by one as soon as they are complete, so a page never has to be
+    held in memory as a whole. Every other member of the top level object (e.g. total, searchId) is decoded as is
+    and kept in fields. A response which is a plain JSON array is treated as the items array itself.
+
+    Items are decoded with the standard library decoder, whichever codec the consumer uses.
+    """
+
+    def __init__(self, items_key: Union[str, None] = "items"):
+        """
+        Initializes the StreamingItemsDecoder.
+
+        Args:
+            items_key (Union[str, None], optional): The key of the items array in the top level object.
+                Defaults to "items".
+        """
+        self.items_key = items_key
+        self.fields = {}
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._key = None
+        self._top_level_array = False
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether the end of the top level value has been reached.
+        """
+        return self._state == "done"
+
+    def feed(self, chunk: bytes) -> list:
+        """
+        Feeds the next chunk of the response body.
+
+        Args:
+            chunk (bytes): The next chunk of the body.
+
+        Returns:
+            list: The items completed by this chunk, in order.
+
+        Raises:
+            json.JSONDecodeError: If the body is not valid JSON.
+        """
+        pos = self._pos
+        self._buffer = self._buffer[pos:] + self._text.decode(chunk)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> list:
+        """
+        Signals the end of the response body.
+
+        Returns:
+            list: Any items still pending, in order.
+
+        Raises:
+            json.JSONDecodeError: If the body is truncated or not valid JSON.
+        """
+        pos = self._pos
+        self._buffer = self._buffer[pos:] + self._text.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        if self._state != "done":
+            raise json.JSONDecodeError(
+                "Unexpected end of response body", self._buffer, len(self._buffer)
+            )
+        return items
+
+    def _parse(self, final: bool) -> list:
+        """
+        Advances through the buffer as far as it can.
+        Stops when the next value is incomplete, which is only an error once the body has ended.
+
+        Args:
+            final (bool): Whether the whole body has been fed.
+
+        Returns:
+            list: The items completed.
+        """
+        items = []
+        buffer = self._buffer
+        while True:
+            pos = _WHITESPACE.match(buffer, self._pos).end()
+            if pos == len(buffer):
+                self._pos = pos
+                return items
+            char = buffer[pos]
+            state = self._state
+
+            if state == "start":
+                if char == "[":
+                    self._top_level_array = True
+                    self._state = "items"
+                elif char == "{":
+                    self._state = "key"
+                else:
+                    raise json.JSONDecodeError("Expecting '{' or '['", buffer, pos)
+                self._pos = pos + 1
+                continue
+
+            if state == "done":
+                raise json.JSONDecodeError("Extra data", buffer, pos)
+
+            if state == "key":
+                if char == ",":
+                    self._pos = pos + 1
+                elif char == "}":
+                    self._state = "done"
+                    self._pos = pos + 1
+                elif char == '"':
+                    key, end = self._decode(buffer, pos, final)
+                    if end is None:
+                        return items
+                    self._key = key
+                    self._state = "colon"
+                    self._pos = end
+                else:
+                    raise json.JSONDecodeError(
+                        "Expecting property name enclosed in double quotes", buffer, pos
+                    )
+                continue
+
+            if state == "colon":
+                if char != ":":
+                    raise json.JSONDecodeError("Expecting ':' delimiter", buffer, pos)
+                self._state = "value"
+                self._pos = pos + 1
+                continue
+
+            if state == "value":
+                if char == "[" and self._key == self.items_key:
+                    self._state = "items"
+                    self._pos = pos + 1
+                    continue
+                value, end = self._decode(buffer, pos, final)
+                if end is None:
+                    return items
+                self.fields[self._key] = value
+                self._state = "key"
+                self._pos = end
+                continue
+
+            # state == "items"
+            if char == ",":
+                self._pos = pos + 1
+            elif char == "]":
+                self._state = "done" if self._top_level_array else "key"
+                self._pos = pos + 1
+            else:
+                item, end = self._decode(buffer, pos, final)
+                if end is None:
+                    return items
+                items.append(item)
+                self._pos = end
+
+    def _decode(self, buffer: str, pos: int, final: bool) -> tuple:
+        """
+        Decodes the value starting at pos.
+
+        Args:
+            buffer (str): The buffered text.
+            pos (int): The start of the value.
+            final (bool): Whether the whole body has been fed.
+
+        Returns:
+            tuple: The value and the position after it, or (None, None) if more of the body is needed.
+        """
+        try:
+            value, end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            self._pos = pos
+            return None, None
+        # a value must be followed by a delimiter, otherwise it was cut short (e.g. a number split across chunks)
+        end_delimited = _VALUE_END.match(buffer, end) is not None
+        if not end_delimited and end < len(buffer) and final:
+            raise json.JSONDecodeError("Expecting ',' delimiter", buffer, end)
+        if not end_delimited and not final:
+            self._pos = pos
+            return None, None
+        return value, end
+
+
+class StreamedPage:
+    """
+    A page of results read from a streamed response.
+
+    Iterating yields the items as they are decoded from the body, while the body is still downloading.
+    fields holds the other members of the page (e.g. total) and is complete once iteration has finished.
+    The underlying response is released when iteration finishes, fails or close() is called.
+    """
+
+    def __init__(self, chunks, items_key: Union[str, None] = "items", close=None):
+        """
+        Initializes the StreamedPage.
+
+        Args:
+            chunks: An iterable of the body as byte chunks.
+            items_key (Union[str, None], optional): The key of the items array. Defaults to "items".
+            close (callable, optional): Called once to release the response.
+        """
+        self._chunks = chunks
+        self._decoder = StreamingItemsDecoder(items_key)
+        self._close = close
+
+    @property
+    def fields(self) -> dict:
+        """
+        The members of the page other than the items.
+        """
+        return self._decoder.fields
+
+    def __iter__(self):
+        try:
+            for chunk in self._chunks:
+                yield from self._decoder.feed(chunk)
+            yield from self._decoder.close()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """
+        Releases the underlying response, any items not yet read are discarded.
+        """
+        if self._close is not None:
+            close, self._close = self._close, None
+            close()
@@ -0,0 +1,106 @@
+import threading
+from collections import OrderedDict
+from typing import Union
+
+
+class ValidatorStore:
+    """
+    Remembers the ETag / Last-Modified validators and raw body of GET responses per URL.
+
+    Used by the ApiConsumer to send If-None-Match / If-Modified-Since automatically. When the API answers
+    304 Not Modified, the stored body is decoded again without downloading it, so every caller gets its own copy.
+    The least recently used URLs are dropped once max_entries is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initializes the ValidatorStore.
+
+        Args:
+            max_entries (int, optional): The maximum number of URLs to remember. Defaults to 1024.
+        """
+        self.max_entries = max_entries
+        self.revalidated = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def make_key(self, path: str, params=None) -> tuple:
+        """
+        Builds the key for a URL.
+
+        Args:
+            path (str): The API endpoint path.
+            params (dict or list, optional): The URL params, in any order.
+
+        Returns:
+            tuple: The key.
+        """
+        items = params.items() if isinstance(params, dict) else params or ()
+        return (path, tuple(sorted((str(k), str(v)) for k, v in items)))
+
+    def get(self, key: tuple) -> Union[tuple, None]:
+        """
+        Looks up the validators and body stored for a URL.
+
+        Args:
+            key (tuple): The key from make_key.
+
+        Returns:
+            Union[tuple, None]: The (etag, last_modified, content) entry, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: tuple, etag: str, last_modified: str, content: bytes) -> None:
+        """
+        Stores the validators and raw body for a URL.
+
+        Args:
+            key (tuple): The key from make_key.
+            etag (str): The ETag response header, or None.
+            last_modified (str): The Last-Modified response header, or None.
+            content (bytes): The raw response body.
+        """
+        with self._lock:
+            self._entries[key] = (etag, last_modified, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def conditional_headers(self, entry: tuple) -> dict:
+        """
+        Builds the conditional request headers for a stored entry.
+
+        Args:
+            entry (tuple): The (etag, last_modified, content) entry.
+
+        Returns:
+            dict: The If-None-Match and / or If-Modified-Since headers.
+        """
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def revalidate(self) -> None:
+        """
+        Counts a response answered 304 Not Modified, see revalidated.
+        """
+        with self._lock:
+            self.revalidated += 1
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,98 @@
+from api_client_base.core.async_api_consumer import AsyncApiConsumer
+
+
+class AsyncBasicTokenClient(AsyncApiConsumer):
+    def __init__(
+        self, base_path: str, api_key: str, api_header: str = "X-APIKey", **kwargs
+    ):
+        """
+        Minimal asyncio implementation of an API client using a basic token.
+        e.g. an API which only requires an API key in the headers.
+
+        Args:
+            base_path (str): The base path for the API.
+            api_key (str): The API key for the API.
+            api_header (str, optional): The header to use for the API key. Defaults to "X-APIKey".
+            kwargs: Additional arguments passed to AsyncApiConsumer (e.g. pool_config).
+        """
+
+        base_url = f"https://{base_path}"
+        headers = {api_header: api_key}
+        super().__init__(base_url, headers=headers, **kwargs)
+
+    async def get(self, path: str, **kwargs) -> dict:
+        """
+        Handle GET requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the GET request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self.common_get(path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> dict:
+        """
+        Handle POST requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the POST request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self.common_post(path, **kwargs)
+
+    async def put(self, path: str, **kwargs) -> dict:
+        """
+        Handle PUT requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the PUT request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self.common_put(path, **kwargs)
+
+    async def patch(self, path: str, **kwargs) -> dict:
+        """
+        Handle PATCH requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the PATCH request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self.common_patch(path, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> dict:
+        """
+        Handle DELETE requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the DELETE request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self.common_delete(path, **kwargs)
+
+    def update_headers(self, headers: dict) -> None:
+        """
+        Update the headers for the request.
+
+        Args:
+            headers (dict): The headers to update.
+
+        Returns:
+            None
+        """
+        self.headers.update(headers)
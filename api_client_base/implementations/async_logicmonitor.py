@@ -0,0 +1,169 @@
+import functools
+
+from api_client_base.core.async_api_consumer import AsyncApiConsumer
+from api_client_base.core.async_paginator_offset import AsyncOffsetPaginator
+from api_client_base.implementations.logicmonitor import LogicMonitorBase
+
+
+class AsyncLogicMonitorClient(LogicMonitorBase, AsyncApiConsumer, AsyncOffsetPaginator):
+    """
+    Asyncio LogicMonitor API consumer class that extends the async base API consumer and the AsyncOffsetPaginator.
+    This class handles the LogicMonitor API requests and pagination.
+    """
+
+    body_kwarg = "content"  # httpx takes raw request bodies as content
+
+    def __init__(
+        self, company, api_key: str, access_id: str, api_version: int = 3, **kwargs
+    ):
+        """
+        Initializes the async Logicmonitor API consumer with the required credentials.
+
+        Args:
+            company (str): The company name for the Logicmonitor account.
+            api_key (str): The API key for the Logicmonitor account.
+            access_id (str): The access ID for the Logicmonitor account.
+            api_version (int, optional): The API version to use. Defaults to 3.
+            kwargs: Additional arguments passed to AsyncApiConsumer (e.g. pool_config).
+        """
+
+        base_url = f"https://{company}.logicmonitor.com/santaba/rest"
+        self.api_key = api_key
+        self.access_id = access_id
+        self.api_version = api_version
+        headers = {"X-Version": str(api_version)}
+        super().__init__(base_url, headers=headers, **kwargs)
+
+    @staticmethod
+    def prepare_request(func):
+        """
+        Decorator to sign the request before awaiting the actual request method.
+        The json payload is encoded once, and the same bytes are signed and sent as the request body.
+        The Authorization header is passed with the request rather than stored on the client,
+        so concurrent requests on the same event loop never share a signature.
+
+        Args:
+            func: The original request coroutine.
+
+        Returns:
+            function: The wrapper coroutine that prepares the request before awaiting the original method.
+        """
+
+        @functools.wraps(func)
+        async def wrapper(self, path: str, **kwargs) -> dict:
+            method = func.__name__.upper()
+            payload = self._prepare_body(method, kwargs)
+
+            headers = self._sign_headers(method, path, payload)
+            kwargs["headers"] = {**kwargs.get("headers", {}), **headers}
+
+            return await func(self, path, **kwargs)
+
+        return wrapper
+
+    @prepare_request
+    async def get(
+        self, path: str, all: bool = False, max_workers: int = 1, **kwargs
+    ) -> dict:
+        """
+        Handle GET requests.
+
+        Args:
+            path (str): The API endpoint path.
+            all (bool, optional): Fetch and combine every page of results. Defaults to False.
+            max_workers (int, optional): The maximum number of pages fetched at once when all is set. Defaults to 1.
+            kwargs: Additional arguments for the GET request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        if all:
+            return await self.all(self, "GET", path, max_workers=max_workers, **kwargs)
+        return await self.common_get(path, **kwargs)
+
+    @prepare_request
+    async def post(self, path: str, **kwargs) -> dict:
+        """
+        Handle POST requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the POST request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self.common_post(path, **kwargs)
+
+    @prepare_request
+    async def put(self, path: str, **kwargs) -> dict:
+        """
+        Handle PUT requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the PUT request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self.common_put(path, **kwargs)
+
+    @prepare_request
+    async def patch(self, path: str, **kwargs) -> dict:
+        """
+        Handle PATCH requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the PATCH request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self.common_patch(path, **kwargs)
+
+    @prepare_request
+    async def delete(self, path: str, **kwargs) -> dict:
+        """
+        Handle DELETE requests.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the DELETE request.
+
+        Returns:
+            dict: The JSON response from the API.
+        """
+        return await self.common_delete(path, **kwargs)
+
+    def update_headers(self, headers: dict) -> None:
+        """
+        Update the headers for the request.
+
+        Args:
+            headers (dict): The headers to update.
+
+        Returns:
+            None
+        """
+        self.headers.update(headers)
+
+    async def count(self, path: str, **kwargs) -> int:
+        """
+        Count the total number of items in the response.
+        runs a minimal get with fields=id and size=1 to get the total count of items.
+        all other params are preserved.
+
+        Args:
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the GET request.
+
+        Returns:
+            int: The total number of items in the response.
+        """
+        params = kwargs.get("params", {})
+        params[self.size_param] = 1
+        params["fields"] = "id"
+
+        return (await self.get(path, params=params))[self.total_key]
@@ -2,7 +2,9 @@ from api_client_base.core.api_consumer import ApiConsumer
 
 
 class BasicTokenClient(ApiConsumer):
-    def __init__(self, base_path: str, api_key: str, api_header: str = "X-APIKey"):
+    def __init__(
+        self, base_path: str, api_key: str, api_header: str = "X-APIKey", **kwargs
+    ):
         """
         Minimal implementation of an API client using a basic token.
         e.g. an API which only requires an API key in the headers.
@@ -11,11 +13,12 @@ class BasicTokenClient(ApiConsumer):
             base_path (str): The base path for the API.
             api_key (str): The API key for the API.
             api_header (str, optional): The header to use for the API key. Defaults to "X-APIKey".
+            kwargs: Additional arguments passed to ApiConsumer (e.g. pool_config).
         """
 
         base_url = f"https://{base_path}"
         headers = {api_header: api_key}
-        super().__init__(base_url, headers=headers)
+        super().__init__(base_url, headers=headers, **kwargs)
 
     def get(self, path: str, **kwargs) -> dict:
         """
@@ -4,26 +4,168 @@ import base64
 import time
 import hmac
 import functools
+from typing import Union
 
 from api_client_base.core.api_consumer import ApiConsumer
 from api_client_base.core.paginator_offset import OffsetPaginator
+from api_client_base.core.paginator_keyset import KeysetPaginator
+from api_client_base.core.adaptive_throttle import AdaptiveThrottle
+from api_client_base.core.page_size_tuner import PageSizeTuner
 
 
-class LogicMonitorClient(ApiConsumer, OffsetPaginator):
+class LogicMonitorBase:
     """
-    LogicMonitor API consumer class that extends the base API consumer and the OffsetPaginator.
-    This class handles the LogicMonitor API requests and pagination.
+    Shared LogicMonitor settings and LMv1 signing helpers.
+    Used by both the LogicMonitorClient and the AsyncLogicMonitorClient.
     """
 
     size_param = "size"  # The parameter to set the size of the page
     size_value = 100  # The default size value
+    max_size_value = 1000  # The maximum page size LogicMonitor allows
     offset_param = "offset"  # The parameter to set the offset of the page
     total_key = (
         "total"  # The key in the response that contains the total number of items
     )
     items_key = "items"  # The key in the response that contains the items
+    body_kwarg = "data"  # The request argument carrying the encoded body
+
+    def _calculate_epoch(self) -> str:
+        """
+        Calculate the epoch time (required for the signature)
+
+        Returns:
+            str: The epoch time
+        """
+        return str(int(time.time() * 1000))
+
+    def _format_request_vars(
+        self, method: str, path: str, payload: Union[dict, bytes] = {}
+    ) -> tuple:
+        """
+        Format the request variables (required for the signature)
+        When the payload is already encoded (bytes) the request variables are built as bytes around it,
+        so the signature covers exactly the body that is sent.
+
+        Args:
+            method: (str): The request method
+            path: (str): The request path
+            payload: (Union[dict, bytes]): The request payload, or the encoded request body
+
+        Returns:
+            tuple: The formatted request variables (str or bytes, epoch)
+        """
+        epoch = self._calculate_epoch()
+
+        if method == "GET":
+            request_vars = f"{method}{epoch}/{path}"
+        elif isinstance(payload, bytes):
+            request_vars = (
+                f"{method}{epoch}".encode("utf-8") + payload + path.encode("utf-8")
+            )
+        else:
+            payload_str = json.dumps(payload)
+            request_vars = f"{method}{epoch}{payload_str}{path}"
 
-    def __init__(self, company, api_key: str, access_id: str, api_version: int = 3):
+        return request_vars, epoch
+
+    def _encode_payload(self, payload) -> bytes:
+        """
+        Encode a request payload to the bytes sent as the request body, using the consumer codec.
+
+        Args:
+            payload: The JSON serializable payload.
+
+        Returns:
+            bytes: The encoded body.
+        """
+        return self.codec.encode(payload)
+
+    def _prepare_body(self, method: str, kwargs: dict) -> Union[dict, bytes]:
+        """
+        Encode the json payload of a request once, replacing it with the encoded body (body_kwarg) in kwargs.
+        The same bytes are then signed and sent, rather than serializing the payload twice.
+
+        Args:
+            method (str): The request method.
+            kwargs (dict): The arguments for the request, updated in place.
+
+        Returns:
+            Union[dict, bytes]: The payload to sign, the encoded body for requests with a body.
+        """
+        if method != "GET" and "json" in kwargs:
+            kwargs[self.body_kwarg] = self._encode_payload(kwargs.pop("json"))
+        if isinstance(kwargs.get(self.body_kwarg), str):
+            kwargs[self.body_kwarg] = kwargs[self.body_kwarg].encode("utf-8")
+        return kwargs.get(self.body_kwarg, kwargs.get("json", {}))
+
+    def _sign_headers(
+        self, method: str, path: str, payload: Union[dict, bytes]
+    ) -> dict:
+        """
+        Build the Authorization header for a request.
+
+        Args:
+            method (str): The request method.
+            path (str): The request path.
+            payload (Union[dict, bytes]): The request payload, or the encoded request body.
+
+        Returns:
+            dict: The Authorization header.
+        """
+        request_vars, epoch = self._format_request_vars(method, path, payload)
+        signature = self._construct_signature(request_vars)
+        return self._construct_headers(signature, epoch)
+
+    def _construct_signature(self, request_vars: str) -> str:
+        """
+        Constructs the standard LM signature required to build the headers
+        Args:
+            request_vars: (Union[str, bytes]): the formatted request vars constructed by _format_request_vars
+
+        Returns:
+            str: string object that represents the Base64-encoded digest string.
+        """
+        if isinstance(request_vars, str):
+            request_vars = request_vars.encode("utf-8")
+        digest = hmac.new(
+            self.api_key.encode("utf-8"),
+            msg=request_vars,
+            digestmod=hashlib.sha256,
+        ).hexdigest()
+
+        signature = base64.b64encode(digest.encode("utf-8")).decode("utf-8")
+        return signature
+
+    def _construct_headers(self, signature: str, epoch: str) -> dict:
+        """
+        Constructs the standard LM headers for the request
+        Args:
+            signature: (str): the signature which should have been generated using _construct_signature
+            epoch: (str): the epoch is rturned as a tuple from _format_request_vars, this is the epoch time
+
+        Returns:
+            dict: The dictionary of headers for the request (Sepcifically the Authorization header)
+        """
+        return {"Authorization": f"LMv1 {self.access_id}:{signature}:{epoch}"}
+
+
+class LogicMonitorClient(LogicMonitorBase, ApiConsumer, OffsetPaginator):
+    """
+    LogicMonitor API consumer class that extends the base API consumer and the OffsetPaginator.
+    This class handles the LogicMonitor API requests and pagination.
+    """
+
+    keyset_key = "id"  # The key keyset pagination sorts and filters by
+
+    def __init__(
+        self,
+        company,
+        api_key: str,
+        access_id: str,
+        api_version: int = 3,
+        page_size_tuner: PageSizeTuner = None,
+        **kwargs,
+    ):
         """
         Initializes the Logicmonitor API consumer with the required credentials.
 
@@ -32,20 +174,30 @@ class LogicMonitorClient(ApiConsumer, OffsetPaginator):
             api_key (str): The API key for the Logicmonitor account.
             access_id (str): The access ID for the Logicmonitor account.
             api_version (int, optional): The API version to use. Defaults to 3.
+            page_size_tuner (PageSizeTuner, optional): Adapts the page size of paginated GETs, up to the 1000 items
+                LogicMonitor allows. Defaults to None (size_value items per page).
+            kwargs: Additional arguments passed to ApiConsumer (e.g. pool_config).
+                An AdaptiveThrottle tracking the LogicMonitor rate limit headers is used unless a throttle is given.
         """
 
         base_url = f"https://{company}.logicmonitor.com/santaba/rest"
         self.api_key = api_key
         self.access_id = access_id
         self.api_version = api_version
+        self.page_size_tuner = page_size_tuner
         headers = {"X-Version": str(api_version)}
-        super().__init__(base_url, headers=headers)
+        kwargs.setdefault("throttle", AdaptiveThrottle())
+        super().__init__(base_url, headers=headers, **kwargs)
 
     @staticmethod
     def prepare_request(func):
         """
         Decorator to prepare the request before calling the actual request method.
-        Calculates the epoch time, formats the request variables, constructs the signature, and updates the headers.
+        Encodes the json payload once, calculates the epoch time, formats the request variables over the encoded
+        body, constructs the signature and adds the Authorization header to the headers of this request only.
+        When the hooks have subscribers, the time spent encoding and signing is passed on as the sign timing.
+        The shared instance headers are never modified, so one client (and its connection pool) can be used
+        from many threads at once.
 
         Args:
             func: The original request method.
@@ -57,32 +209,64 @@ class LogicMonitorClient(ApiConsumer, OffsetPaginator):
         @functools.wraps(func)
         def wrapper(self, path: str, **kwargs) -> dict:
             method = func.__name__.upper()
-            payload = kwargs.get("json", {})
+            instrumented = bool(self.hooks)
+            if instrumented:
+                signing = time.perf_counter()
+            payload = self._prepare_body(method, kwargs)
 
             # Call the _prepare_for_request logic
-            request_vars, epoch = self._format_request_vars(method, path, payload)
-            signature = self._construct_signature(request_vars)
-            headers = self._construct_headers(signature, epoch)
-            self.update_headers(headers)
+            headers = self._sign_headers(method, path, payload)
+            kwargs["headers"] = {**kwargs.get("headers", {}), **headers}
+            if instrumented:
+                # reported as the sign timing of the request hook events
+                kwargs["timings"] = {"sign": time.perf_counter() - signing}
 
             return func(self, path, **kwargs)
 
         return wrapper
 
     @prepare_request
-    def get(self, path: str, all: bool = False, **kwargs) -> dict:
+    def get(
+        self,
+        path: str,
+        all: bool = False,
+        max_workers: int = 1,
+        iter_items: bool = False,
+        stream: bool = False,
+        keyset: bool = False,
+        **kwargs,
+    ) -> dict:
         """
         Handle GET requests.
 
         Args:
             path (str): The API endpoint path.
-            kwargs: Additional arguments for the GET request.
+            all (bool, optional): Fetch and combine every page of results. Defaults to False.
+            max_workers (int, optional): The maximum number of pages fetched at once when all is set. Defaults to 1.
+            iter_items (bool, optional): Return a generator yielding the items of every page one at a time. Defaults to False.
+            stream (bool, optional): Like iter_items, but each page is decoded while it downloads and its items are
+                yielded as soon as they are parsed. Defaults to False.
+            keyset (bool, optional): Page through all, iter_items or stream by keyset_key (sort=id, filter=id>last)
+                instead of offsets, for endpoints supporting sort and filter on it. Pages are fetched one at a time.
+                Defaults to False.
+            kwargs: Additional arguments for the GET request. With all, iter_items or stream, a checkpoint and resume
+                make the export resumable (see ApiPaginator.paginate). With all, a sink writes the items to disk
+                and the manifest is returned (see ApiPaginator.export).
 
         Returns:
             dict: The JSON response from the API.
         """
+        if keyset and (all or iter_items or stream):
+            paginator = self.keyset_paginator()
+            if all:
+                return paginator.all(self, "GET", path, **kwargs)
+            return paginator.iter_items(self, "GET", path, stream=stream, **kwargs)
+        if stream:
+            return self.iter_items(self, "GET", path, stream=True, **kwargs)
+        if iter_items:
+            return self.iter_items(self, "GET", path, **kwargs)
         return (
-            self.all(self, "GET", path, **kwargs)
+            self.all(self, "GET", path, max_workers=max_workers, **kwargs)
             if all
             else self.common_get(path, **kwargs)
         )
@@ -155,82 +339,60 @@ class LogicMonitorClient(ApiConsumer, OffsetPaginator):
         """
         self.headers.update(headers)
 
-    def count(self, path: str, **kwargs) -> int:
+    def keyset_paginator(self) -> KeysetPaginator:
         """
-        Count the total number of items in the response.
-        runs a minimal get with fields=id and size=1 to get the total count of items.
-        all other params are preserved.
-
-        Args:
-            path (str): The API endpoint path.
-            kwargs: Additional arguments for the GET request.
+        Builds a KeysetPaginator with the LogicMonitor pagination settings.
+        LogicMonitor sorts with sort=id and joins filter conditions with commas, e.g. filter=name~"prod",id>1999.
 
         Returns:
-            int: The total number of items in the response.
+            KeysetPaginator: The paginator, sorting and filtering by keyset_key.
         """
-        params = kwargs.get("params", {})
-        params[self.size_param] = 1
-        params["fields"] = "id"
-
-        return self.get(path, params=params)[self.total_key]
+        return KeysetPaginator(
+            key=self.keyset_key,
+            size_param=self.size_param,
+            size_value=self.size_value,
+            items_key=self.items_key,
+        )
 
-    def _calculate_epoch(self) -> str:
+    def rate_limit_budget(self) -> dict:
         """
-        Calculate the epoch time (required for the signature)
+        Returns the current LogicMonitor rate limit budget of every endpoint family seen so far.
 
         Returns:
-            str: The epoch time
+            dict: The limit, remaining and window per endpoint family (e.g. "GET device/devices").
         """
-        return str(int(time.time() * 1000))
+        return self.throttle.budget() if self.throttle is not None else {}
 
-    def _format_request_vars(self, method: str, path: str, payload: dict = {}) -> tuple:
+    def _sign_request(self, method: str, path: str, **kwargs) -> dict:
         """
-        Format the request variables (required for the signature)
+        Re-signs a request with a fresh epoch, used when a request is retried.
 
         Args:
-            method: (str): The request method
-            path: (str): The request path
-            payload: (dict): The request payload
+            method (str): The request method.
+            path (str): The request path, any query string is not part of the signature.
+            kwargs: The arguments for the request.
 
         Returns:
-            tuple: The formatted request variables (str, epoch)
-        """
-        epoch = self._calculate_epoch()
-
-        if method == "GET":
-            request_vars = f"{method}{epoch}/{path}"
-        else:
-            payload_str = json.dumps(payload)
-            request_vars = f"{method}{epoch}{payload_str}{path}"
-
-        return request_vars, epoch
-
-    def _construct_signature(self, request_vars: str) -> str:
+            dict: The Authorization header for the new attempt.
         """
-        Constructs the standard LM signature required to build the headers
-        Args:
-            request_vars: (str): the str formatted request vars constructed by _format_request_vars
+        payload = kwargs.get(self.body_kwarg, kwargs.get("json", {}))
+        return self._sign_headers(method, path.split("?")[0], payload)
 
-        Returns:
-            str: string object that represents the Base64-encoded digest string.
+    def count(self, path: str, **kwargs) -> int:
         """
-        digest = hmac.new(
-            self.api_key.encode("utf-8"),
-            msg=request_vars.encode("utf-8"),
-            digestmod=hashlib.sha256,
-        ).hexdigest()
-
-        signature = base64.b64encode(digest.encode("utf-8")).decode("utf-8")
-        return signature
+        Count the total number of items in the response.
+        runs a minimal get with fields=id and size=1 to get the total count of items.
+        all other params are preserved.
 
-    def _construct_headers(self, signature: str, epoch: str) -> dict:
-        """
-        Constructs the standard LM headers for the request
         Args:
-            signature: (str): the signature which should have been generated using _construct_signature
-            epoch: (str): the epoch is rturned as a tuple from _format_request_vars, this is the epoch time
+            path (str): The API endpoint path.
+            kwargs: Additional arguments for the GET request.
 
         Returns:
-            dict: The dictionary of headers for the request (Sepcifically the Authorization header)
+            int: The total number of items in the response.
         """
-        return {"Authorization": f"LMv1 {self.access_id}:{signature}:{epoch}"}
+        params = kwargs.get("params", {})
+        params[self.size_param] = 1
+        params["fields"] = "id"
+
+        return self.get(path, params=params)[self.total_key]
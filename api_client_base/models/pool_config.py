@@ -0,0 +1,20 @@
+from typing import Union
+from pydantic import BaseModel, Field
+
+
+class PoolConfig(BaseModel):
+    """
+    Connection pool configuration for API consumer.
+
+    Attributes:
+        pool_connections (int): The number of host pools to cache. Defaults to 10.
+        pool_maxsize (int): The maximum number of connections kept alive per host. Defaults to 10.
+        pool_block (bool): Whether to block when no free connection is available instead of opening a new one. Defaults to False.
+        idle_timeout (Union[float, None]): Seconds a pool may sit unused before its kept-alive connections are evicted.
+            Defaults to None (never evict).
+    """
+
+    pool_connections: int = Field(default=10, gt=0)
+    pool_maxsize: int = Field(default=10, gt=0)
+    pool_block: bool = False
+    idle_timeout: Union[float, None] = Field(default=None, gt=0)
@@ -0,0 +1,68 @@
+"""
+Compares requests/sec of a fresh connection per request (module level requests.request)
+against the pooled keep-alive session owned by ApiConsumer.
+
+Usage:
+    python -m benchmarks.bench_connection_pool --requests 2000
+"""
+
+import argparse
+import time
+import requests
+from api_client_base.core.api_consumer import ApiConsumer
+from benchmarks.standin import StandInServer
+
+
+class BenchConsumer(ApiConsumer):
+    def get(self, path: str, **kwargs):
+        return self.common_get(path, **kwargs)
+
+    def post(self, path: str, **kwargs):
+        return self.common_post(path, **kwargs)
+
+    def put(self, path: str, **kwargs):
+        return self.common_put(path, **kwargs)
+
+    def patch(self, path: str, **kwargs):
+        return self.common_patch(path, **kwargs)
+
+    def delete(self, path: str, **kwargs):
+        return self.common_delete(path, **kwargs)
+
+    def update_headers(self, headers: dict):
+        self.headers.update(headers)
+
+
+def bench_unpooled(base_url: str, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        requests.request("GET", f"{base_url}/device/devices").json()
+    return count / (time.perf_counter() - start)
+
+
+def bench_pooled(base_url: str, count: int) -> float:
+    with BenchConsumer(base_url) as consumer:
+        start = time.perf_counter()
+        for _ in range(count):
+            consumer.get("device/devices")
+        return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    with StandInServer() as server:
+        unpooled = bench_unpooled(server.base_url, args.requests)
+        pooled = bench_pooled(server.base_url, args.requests)
+
+    print(f"unpooled (requests.request): {unpooled:8.1f} req/s")
+    print(f"pooled (ApiConsumer.session): {pooled:8.1f} req/s")
+    print(f"speedup: {pooled / unpooled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
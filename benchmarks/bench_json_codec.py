@@ -0,0 +1,78 @@
+"""
+Compares the installed JSON codecs on a realistic LogicMonitor device page.
+
+Usage:
+    python -m benchmarks.bench_json_codec --items 1000 --rounds 20
+"""
+
+import argparse
+import time
+from api_client_base.core.codec import available_codecs
+
+
+def build_page(items: int) -> dict:
+    return {
+        "total": 200000,
+        "searchId": None,
+        "items": [
+            {
+                "id": i,
+                "name": f"10.0.{i // 256}.{i % 256}",
+                "displayName": f"device-{i}.example.com",
+                "deviceType": 0,
+                "hostGroupIds": "1,12,37",
+                "hostStatus": "normal",
+                "currentCollectorId": 4,
+                "preferredCollectorId": 4,
+                "description": "Linux server managed by the platform team",
+                "createdOn": 1700000000 + i,
+                "updatedOn": 1710000000 + i,
+                "disableAlerting": False,
+                "autoPropertiesAssignedOn": 1710000000,
+                "link": "",
+                "systemProperties": [
+                    {"name": f"system.prop{p}", "value": f"value {i} {p}"}
+                    for p in range(20)
+                ],
+                "customProperties": [
+                    {"name": f"custom.prop{p}", "value": f"{i * p}"} for p in range(10)
+                ],
+                "autoProperties": [
+                    {"name": f"auto.prop{p}", "value": f"auto {p}"} for p in range(10)
+                ],
+                "inheritedProperties": [],
+            }
+            for i in range(items)
+        ],
+    }
+
+
+def bench(func, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    page = build_page(args.items)
+    print(f"{'codec':<8} {'bytes':>10} {'encode ms':>10} {'decode ms':>10}")
+    for name, codec_class in available_codecs().items():
+        codec = codec_class()
+        encoded = codec.encode(page)
+        encode = bench(lambda: codec.encode(page), args.rounds)
+        decode = bench(lambda: codec.decode(encoded), args.rounds)
+        print(
+            f"{name:<8} {len(encoded):>10} {encode * 1000:>10.2f} {decode * 1000:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compares the CPU cost of preparing a signed LogicMonitor request body.
+
+    twice: json.dumps for the signature, then requests serializes json= again (the previous behaviour)
+    once:  the payload is encoded to bytes once, signed, and the same bytes are sent as data=
+
+Usage:
+    python -m benchmarks.bench_payload_signing --devices 20000 --rounds 10
+"""
+
+import argparse
+import json
+import time
+from requests.models import PreparedRequest
+from api_client_base.implementations.logicmonitor import LogicMonitorClient
+
+
+def build_payload(devices: int) -> list:
+    return [
+        {
+            "id": i,
+            "displayName": f"device-{i}",
+            "description": "x" * 64,
+            "customProperties": [
+                {"name": f"prop.{p}", "value": f"value-{i}-{p}"} for p in range(5)
+            ],
+        }
+        for i in range(devices)
+    ]
+
+
+def prepare_body(**kwargs) -> None:
+    request = PreparedRequest()
+    request.prepare_headers({})
+    request.prepare_body(files=None, **kwargs)
+
+
+def prepare_twice(client: LogicMonitorClient, payload) -> None:
+    request_vars, epoch = client._format_request_vars("PUT", "device/devices", payload)
+    client._construct_signature(request_vars)
+    prepare_body(data=None, json=payload)
+
+
+def prepare_once(client: LogicMonitorClient, payload) -> None:
+    kwargs = {"json": payload}
+    body = client._prepare_body("PUT", kwargs)
+    client._sign_headers("PUT", "device/devices", body)
+    prepare_body(data=kwargs["data"])
+
+
+def bench(func, client, payload, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(client, payload)
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--devices", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    client = LogicMonitorClient("benchmark", api_key="key", access_id="id")
+    payload = build_payload(args.devices)
+    size = len(json.dumps(payload))
+
+    twice = bench(prepare_twice, client, payload, args.rounds)
+    once = bench(prepare_once, client, payload, args.rounds)
+
+    print(f"payload: {size / 1024 / 1024:.1f} MiB")
+    print(f"serialized twice: {twice * 1000:8.1f} ms")
+    print(f"serialized once:  {once * 1000:8.1f} ms")
+    print(f"speedup: {twice / once:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Compares a transform heavy export of a paginated collection with and without prefetching pages in the background.
+Without read-ahead the wall time is the network time plus the processing time, with it close to the larger of the two.
+
+Usage:
+    python -m benchmarks.bench_prefetch --items 20000 --latency 50 --work 2
+"""
+
+import argparse
+import hashlib
+import json
+import time
+from benchmarks.suite import make_client
+from benchmarks.logicmonitor_standin import LogicMonitorStandIn
+
+
+def transform(item: dict, work: int) -> str:
+    # CPU bound stand-in for the per item processing of an export
+    data = json.dumps(item).encode("utf-8")
+    for _ in range(work):
+        data = hashlib.sha256(data).digest()
+    return data.hex()
+
+
+def export(server: LogicMonitorStandIn, args, prefetch: int) -> tuple:
+    with make_client(server) as client:
+        client.size_value = args.page_size
+        start = time.perf_counter()
+        count = 0
+        for item in client.get("device/devices", iter_items=True, prefetch=prefetch):
+            transform(item, args.work)
+            count += 1
+        return count, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=50.0, help="milliseconds")
+    parser.add_argument("--work", type=int, default=2, help="sha256 rounds per item")
+    parser.add_argument("--prefetch", type=int, default=2)
+    args = parser.parse_args()
+
+    with LogicMonitorStandIn(
+        total=args.items, max_size=args.page_size, latency=args.latency / 1000
+    ) as server:
+        print(f"{'prefetch':<9} {'items':>7} {'seconds':>8}")
+        for prefetch in (0, args.prefetch):
+            count, elapsed = export(server, args, prefetch)
+            print(f"{prefetch:<9} {count:>7} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares decoding a large LogicMonitor page as a whole against streaming its items out of the body chunk by chunk.
+Peak memory is measured above the raw body, which both modes read from.
+
+Usage:
+    python -m benchmarks.bench_streaming_decode --items 5000 --chunk-size 65536
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from api_client_base.core.stream_decoder import StreamedPage
+from benchmarks.bench_json_codec import build_page
+
+
+def chunks(body: bytes, chunk_size: int):
+    for start in range(0, len(body), chunk_size):
+        end = start + chunk_size
+        yield body[start:end]
+
+
+def whole(body: bytes, chunk_size: int) -> int:
+    page = json.loads(body)
+    return sum(1 for _ in page["items"])
+
+
+def streamed(body: bytes, chunk_size: int) -> int:
+    return sum(1 for _ in StreamedPage(chunks(body, chunk_size), items_key="items"))
+
+
+def measure(func, body: bytes, chunk_size: int) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = func(body, chunk_size)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    args = parser.parse_args()
+
+    body = json.dumps(build_page(args.items)).encode("utf-8")
+    print(f"page: {args.items} items, {len(body) / 1e6:.1f} MB")
+    print(f"{'mode':<9} {'items':>7} {'seconds':>8} {'peak MB':>8}")
+    for name, func in (("whole", whole), ("streamed", streamed)):
+        count, elapsed, peak = measure(func, body, args.chunk_size)
+        print(f"{name:<9} {count:>7} {elapsed:>8.2f} {peak / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
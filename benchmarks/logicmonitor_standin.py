@@ -0,0 +1,222 @@
+"""
+A local LogicMonitor compatible stand-in server used by the benchmark suite and the tests.
+
+Emulates the /santaba/rest API closely enough for the LogicMonitorClient:
+    - every request must carry a valid LMv1 signature, otherwise it is answered with a 401
+    - GET <resource> pages through a generated collection with offset / size, answering {"total", "searchId", "items"}
+      a filter=id>N condition (keyset pagination) starts the collection after item N, an optional offset cost
+      emulates a server getting slower the more items it has to skip
+    - GET <resource>/<id> returns a single generated item
+    - POST / PUT / PATCH / DELETE are acknowledged with the size of the body received
+    - optional per request latency, payload size (properties per item) and a rate limit announced with
+      the X-Rate-Limit-* headers, answering 429 with a Retry-After header once the budget of the window is spent
+    - gzip / deflate request bodies are decompressed before the signature is checked, responses are optionally
+      gzip encoded for clients accepting it
+"""
+
+import base64
+import hashlib
+import hmac
+import threading
+import time
+import urllib.parse
+from benchmarks.standin import StandInHandler, StandInServer
+
+BASE_PATH = "/santaba/rest"
+
+
+def lmv1_signature(
+    api_key: str, method: str, epoch: str, body: bytes, path: str
+) -> str:
+    """
+    Builds the LMv1 signature LogicMonitor expects for a request, from the uncompressed body.
+    """
+    if method == "GET":
+        request_vars = f"{method}{epoch}/{path}".encode("utf-8")
+    else:
+        request_vars = f"{method}{epoch}".encode("utf-8") + body + path.encode("utf-8")
+    digest = hmac.new(
+        api_key.encode("utf-8"), msg=request_vars, digestmod=hashlib.sha256
+    ).hexdigest()
+    return base64.b64encode(digest.encode("utf-8")).decode("utf-8")
+
+
+def make_item(index: int, properties: int) -> dict:
+    """
+    Builds the generated item at an index, shaped like a LogicMonitor device.
+    """
+    return {
+        "id": index,
+        "name": f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}",
+        "displayName": f"device-{index}.example.com",
+        "deviceType": 0,
+        "hostGroupIds": "1,12,37",
+        "hostStatus": "normal",
+        "currentCollectorId": 4,
+        "createdOn": 1700000000 + index,
+        "updatedOn": 1710000000 + index,
+        "disableAlerting": False,
+        "customProperties": [
+            {"name": f"custom.prop{p}", "value": f"value {index} {p}"}
+            for p in range(properties)
+        ],
+    }
+
+
+class LogicMonitorStandInHandler(StandInHandler):
+    # configured by LogicMonitorStandIn
+    api_key = "benchkey"
+    access_id = "benchid"
+    total = 100000
+    max_size = 1000
+    properties = 10
+    latency = 0.0
+    rate_limit = 0
+    rate_window = 60.0
+    rate_state = None
+    offset_cost = 0.0
+
+    def _check_signature(self, path: str, body: bytes) -> bool:
+        try:
+            scheme, credentials = self.headers["Authorization"].split(" ")
+            access_id, signature, epoch = credentials.split(":")
+        except (AttributeError, ValueError):
+            return False
+        expected = lmv1_signature(self.api_key, self.command, epoch, body, path)
+        return (
+            scheme == "LMv1"
+            and access_id == self.access_id
+            and hmac.compare_digest(signature, expected)
+        )
+
+    def _take_rate_token(self) -> tuple:
+        """
+        Spends one request of the current window.
+
+        Returns:
+            tuple: (allowed, remaining, seconds until the window resets)
+        """
+        state = self.rate_state
+        with state["lock"]:
+            now = time.monotonic()
+            if now - state["started"] >= self.rate_window:
+                state["started"], state["used"] = now, 0
+            reset = self.rate_window - (now - state["started"])
+            if state["used"] >= self.rate_limit:
+                return False, 0, reset
+            state["used"] += 1
+            return True, self.rate_limit - state["used"], reset
+
+    def _respond(self):
+        body = self._read_body()
+        url = urllib.parse.urlsplit(self.path)
+        prefix = len(BASE_PATH) + 1
+        path = url.path[prefix:]
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        headers = {}
+        if self.rate_limit:
+            allowed, remaining, reset = self._take_rate_token()
+            headers = {
+                "X-Rate-Limit-Limit": str(self.rate_limit),
+                "X-Rate-Limit-Remaining": str(remaining),
+                "X-Rate-Limit-Window": str(int(self.rate_window)),
+            }
+            if not allowed:
+                headers["Retry-After"] = str(max(int(reset + 0.999), 1))
+                return self._send_json(
+                    429, {"errorMessage": "Too Many Requests"}, headers
+                )
+
+        if not url.path.startswith(BASE_PATH) or not self._check_signature(path, body):
+            return self._send_json(401, {"errorMessage": "Authentication failed"})
+
+        if self.command != "GET":
+            return self._send_json(200, {"path": path, "received": len(body)}, headers)
+
+        resource = path.rstrip("/").split("/")
+        if resource[-1].isdigit():
+            item = make_item(int(resource[-1]), self.properties)
+            return self._send_json(200, item, headers)
+
+        query = urllib.parse.parse_qs(url.query)
+        offset = int(query.get("offset", ["0"])[0])
+        size = min(int(query.get("size", ["50"])[0]), self.max_size)
+        after = -1
+        for condition in query.get("filter", [""])[0].split(","):
+            if condition.startswith("id>"):
+                after = int(condition[3:])
+        if self.offset_cost:
+            time.sleep(self.offset_cost * offset / 100000)
+        start = after + 1 + offset
+        items = [
+            make_item(index, self.properties)
+            for index in range(start, min(start + size, self.total))
+        ]
+        total = max(self.total - after - 1, 0)
+        page = {"total": total, "searchId": None, "items": items}
+        return self._send_json(200, page, headers)
+
+
+class LogicMonitorStandIn(StandInServer):
+    """
+    Runs the LogicMonitor stand-in server on a background thread.
+    Use as a context manager, base_url points at the /santaba/rest root of the running server.
+    """
+
+    def __init__(
+        self,
+        total: int = 100000,
+        max_size: int = 1000,
+        properties: int = 10,
+        latency: float = 0.0,
+        rate_limit: int = 0,
+        rate_window: float = 60.0,
+        api_key: str = "benchkey",
+        access_id: str = "benchid",
+        compress: bool = False,
+        offset_cost: float = 0.0,
+    ):
+        """
+        Initializes the stand-in server.
+
+        Args:
+            total (int, optional): The number of items in every collection. Defaults to 100000.
+            max_size (int, optional): The maximum page size, larger sizes are capped. Defaults to 1000.
+            properties (int, optional): The number of custom properties per item, sets the payload size. Defaults to 10.
+            latency (float, optional): The delay before every response in seconds. Defaults to 0.
+            rate_limit (int, optional): The number of requests allowed per window, 0 disables it. Defaults to 0.
+            rate_window (float, optional): The rate limit window in seconds. Defaults to 60.
+            api_key (str, optional): The API key requests must be signed with. Defaults to "benchkey".
+            access_id (str, optional): The access ID requests must carry. Defaults to "benchid".
+            compress (bool, optional): gzip encode the responses to clients accepting it. Defaults to False.
+            offset_cost (float, optional): The delay in seconds added per 100k items skipped by the offset. Defaults to 0.
+        """
+        handler = type(
+            "ConfiguredLogicMonitorStandInHandler",
+            (LogicMonitorStandInHandler,),
+            {
+                "api_key": api_key,
+                "access_id": access_id,
+                "total": total,
+                "max_size": max_size,
+                "properties": properties,
+                "latency": latency,
+                "rate_limit": rate_limit,
+                "rate_window": rate_window,
+                "compress": compress,
+                "offset_cost": offset_cost,
+                "rate_state": {
+                    "lock": threading.Lock(),
+                    "started": time.monotonic(),
+                    "used": 0,
+                },
+            },
+        )
+        super().__init__(handler)
+        self.api_key = api_key
+        self.access_id = access_id
+        self.rate_window = rate_window
+        self.base_url = f"{self.base_url}{BASE_PATH}"
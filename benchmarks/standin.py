@@ -0,0 +1,77 @@
+"""
+A minimal local HTTP stand-in used by the benchmarks and the tests.
+Every request is answered with a small JSON document over a keep-alive (HTTP/1.1) connection.
+StandInHandler and StandInServer are the base of the other stand-ins, e.g. the LogicMonitor one.
+"""
+
+import gzip
+import json
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    compress = False  # gzip encode the responses to clients accepting it
+
+    def _read_body(self) -> bytes:
+        """
+        Reads the request body, decompressing a gzip or deflate Content-Encoding.
+        """
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+        return body
+
+    def _send_json(self, status: int, payload, headers: dict = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if self.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=1)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _respond(self):
+        self._read_body()
+        self._send_json(200, {"path": self.path, "items": []})
+
+    def do_GET(self):
+        # looked up on self, so subclasses only override _respond
+        self._respond()
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = do_GET
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer:
+    """
+    Runs the stand-in server on a background thread.
+    Use as a context manager, the base_url attribute points at the running server.
+    """
+
+    def __init__(self, handler=StandInHandler, host: str = "127.0.0.1", port: int = 0):
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://{host}:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,259 @@
+"""
+Benchmark suite running the LogicMonitorClient against the local LogicMonitor stand-in server.
+Results are written as JSON so runs of different versions can be compared with --compare.
+
+Scenarios:
+    single_get:          sequential GETs of single devices/devices/{id} resources
+    get_all:             get(all=True) over the whole collection, sequentially and with --workers pages at once
+    concurrent_clients:  --clients threads sharing one client, each making single GETs
+    large_post:          POSTs of a payload of --post-devices devices
+    deep_scan:           get(all=True) paging by offset and by keyset (id), with the latency of the first and last
+                         tenth of the pages, on a stand-in slowing down by --offset-cost per 100k items skipped
+
+Usage:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --items 20000 --latency 2 --output after.json --compare before.json
+    python -m benchmarks.suite --compression --output gzip.json --compare results.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from importlib import metadata
+from api_client_base.core.request_stats import RequestStats
+from api_client_base.implementations.logicmonitor import LogicMonitorClient
+from api_client_base.core.retry import RetryPolicy
+from api_client_base.core.compression import Compression
+from benchmarks.logicmonitor_standin import LogicMonitorStandIn, make_item
+
+SCENARIOS = ("single_get", "get_all", "concurrent_clients", "large_post", "deep_scan")
+
+
+COMPRESSION = None  # set by --compression
+
+
+def make_client(server: LogicMonitorStandIn, **kwargs) -> LogicMonitorClient:
+    # GETs answered with a 429 by a rate limited stand-in are retried after Retry-After, up to a whole window
+    client = LogicMonitorClient(
+        "bench",
+        api_key=server.api_key,
+        access_id=server.access_id,
+        retry_policy=RetryPolicy(
+            max_attempts=5, max_backoff=max(30, server.rate_window)
+        ),
+        compression=COMPRESSION,
+        **kwargs,
+    )
+    client.base_url = server.base_url
+    return client
+
+
+def summarize(stats: RequestStats, elapsed: float, count: int) -> dict:
+    """
+    Combines the wall clock throughput with the request statistics of a scenario.
+    """
+    snapshot = stats.snapshot()
+    requests = sum(endpoint["requests"] for endpoint in snapshot.values())
+    latencies = [endpoint["latency"] for endpoint in snapshot.values()]
+    slowest = max(latencies, key=lambda latency: latency["p99"], default={})
+    return {
+        "seconds": round(elapsed, 4),
+        "operations": count,
+        "operations_per_second": round(count / elapsed, 2),
+        "requests": requests,
+        "requests_per_second": round(requests / elapsed, 2),
+        "errors": sum(sum(e["errors"].values()) for e in snapshot.values()),
+        "retries": sum(endpoint["retries"] for endpoint in snapshot.values()),
+        "request_bytes": sum(e["request_bytes"] for e in snapshot.values()),
+        "response_bytes": sum(e["response_bytes"] for e in snapshot.values()),
+        "latency_p50": round(slowest.get("p50", 0.0), 6),
+        "latency_p95": round(slowest.get("p95", 0.0), 6),
+        "latency_p99": round(slowest.get("p99", 0.0), 6),
+    }
+
+
+def single_get(server: LogicMonitorStandIn, args) -> dict:
+    stats = RequestStats()
+    with make_client(server, stats=stats) as client:
+        start = time.perf_counter()
+        for i in range(args.requests):
+            client.get(f"device/devices/{i}")
+        return summarize(stats, time.perf_counter() - start, args.requests)
+
+
+def get_all(server: LogicMonitorStandIn, args) -> dict:
+    results = {}
+    for workers in sorted({1, args.workers}):
+        stats = RequestStats()
+        with make_client(server, stats=stats) as client:
+            client.size_value = args.page_size
+            start = time.perf_counter()
+            items = client.get("device/devices", all=True, max_workers=workers)
+            elapsed = time.perf_counter() - start
+        assert len(items) == args.items, f"expected {args.items}, got {len(items)}"
+        results[f"workers_{workers}"] = summarize(stats, elapsed, len(items))
+    return results
+
+
+def concurrent_clients(server: LogicMonitorStandIn, args) -> dict:
+    stats = RequestStats()
+    errors = []
+    with make_client(server, stats=stats) as client:
+
+        def run(offset: int):
+            try:
+                for i in range(args.requests // args.clients):
+                    client.get(f"device/devices/{offset + i}")
+            except Exception as err:
+                # reported in the results rather than stopping the suite
+                errors.append(repr(err))
+
+        threads = [
+            threading.Thread(target=run, args=(n * args.requests,))
+            for n in range(args.clients)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    count = args.requests // args.clients * args.clients
+    return {**summarize(stats, elapsed, count), "failures": errors}
+
+
+def large_post(server: LogicMonitorStandIn, args) -> dict:
+    payload = [make_item(i, args.properties) for i in range(args.post_devices)]
+    stats = RequestStats()
+    with make_client(server, stats=stats) as client:
+        start = time.perf_counter()
+        for _ in range(args.posts):
+            client.post("device/devices", json=payload)
+        return summarize(stats, time.perf_counter() - start, args.posts)
+
+
+def deep_scan(server: LogicMonitorStandIn, args) -> dict:
+    results = {}
+    for mode in ("offset", "keyset"):
+        stats = RequestStats()
+        with make_client(server, stats=stats) as client:
+            client.size_value = args.page_size
+            latencies = []
+            client.hooks.subscribe(
+                "after_receive", lambda event: latencies.append(event.timings["total"])
+            )
+            start = time.perf_counter()
+            items = client.get("device/devices", all=True, keyset=mode == "keyset")
+            elapsed = time.perf_counter() - start
+        assert len(items) == args.items, f"expected {args.items}, got {len(items)}"
+        tenth = max(len(latencies) // 10, 1)
+        results[mode] = {
+            **summarize(stats, elapsed, len(items)),
+            "latency_first_pages": round(sum(latencies[:tenth]) / tenth, 6),
+            "latency_last_pages": round(sum(latencies[-tenth:]) / tenth, 6),
+        }
+    return results
+
+
+def package_version() -> str:
+    try:
+        return metadata.version("api_client_base")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def compare(results: dict, baseline: dict) -> None:
+    """
+    Prints the change of every throughput and latency figure against a baseline run.
+    """
+    print(f"\ncompared to {baseline.get('label') or baseline.get('version')}:")
+
+    def walk(current: dict, previous: dict, prefix: str):
+        for key, value in current.items():
+            before = previous.get(key) if isinstance(previous, dict) else None
+            if isinstance(value, dict):
+                walk(value, before or {}, f"{prefix}{key}.")
+            elif (key.endswith("per_second") or key.startswith("latency")) and before:
+                change = (value - before) / before * 100
+                print(
+                    f"  {prefix}{key:<28} {before:>12} -> {value:>12} ({change:+.1f}%)"
+                )
+
+    walk(results["scenarios"], baseline.get("scenarios", {}), "")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--properties", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="milliseconds")
+    parser.add_argument(
+        "--offset-cost", type=float, default=0.0, help="milliseconds per 100k skipped"
+    )
+    parser.add_argument("--rate-limit", type=int, default=0)
+    parser.add_argument("--rate-window", type=float, default=60.0)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--posts", type=int, default=10)
+    parser.add_argument("--post-devices", type=int, default=5000)
+    parser.add_argument(
+        "--compression",
+        action="store_true",
+        help="gzip responses and request bodies over 1KB",
+    )
+    parser.add_argument("--label", default=None)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--compare", default=None)
+    args = parser.parse_args()
+    if args.compression:
+        global COMPRESSION
+        COMPRESSION = Compression(request_encoding="gzip")
+
+    config = {
+        key: value
+        for key, value in vars(args).items()
+        if key not in ("output", "compare", "label", "scenarios")
+    }
+    results = {
+        "label": args.label,
+        "version": package_version(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": config,
+        "scenarios": {},
+    }
+    with LogicMonitorStandIn(
+        total=args.items,
+        max_size=args.page_size,
+        properties=args.properties,
+        latency=args.latency / 1000,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        compress=args.compression,
+        offset_cost=args.offset_cost / 1000,
+    ) as server:
+        for name in args.scenarios:
+            result = globals()[name](server, args)
+            results["scenarios"][name] = result
+            print(f"{name}: {json.dumps(result)}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import json
+import pytest
+import httpx
+from api_client_base.core.async_api_consumer import AsyncApiConsumer
+
+"""
+Mock subclasses of AsyncApiConsumer and a mocked transport for testing the async consumer.
+"""
+
+
+class MockAsyncApiConsumer(AsyncApiConsumer):
+    async def get(self, path: str, **kwargs):
+        return await self.common_get(path, **kwargs)
+
+    async def post(self, path: str, **kwargs):
+        return await self.common_post(path, **kwargs)
+
+    async def put(self, path: str, **kwargs):
+        return await self.common_put(path, **kwargs)
+
+    async def patch(self, path: str, **kwargs):
+        return await self.common_patch(path, **kwargs)
+
+    async def delete(self, path: str, **kwargs):
+        return await self.common_delete(path, **kwargs)
+
+    def update_headers(self, headers: dict):
+        return super().update_headers(headers)
+
+
+def paginated_handler(request: httpx.Request) -> httpx.Response:
+    """
+    Simulates a paginated API with 1000 items, echoing the method, path and headers for non paginated requests.
+    """
+    params = request.url.params
+    if "offset" in params or "size" in params:
+        offset = int(params.get("offset", 0))
+        size = int(params.get("size", 100))
+        items = [{"id": i} for i in range(offset, min(offset + size, 1000))]
+        return httpx.Response(200, json={"total": 1000, "items": items})
+
+    body = json.loads(request.content) if request.content else None
+    return httpx.Response(
+        200,
+        json={
+            "method": request.method,
+            "path": request.url.path,
+            "headers": dict(request.headers),
+            "body": body,
+        },
+    )
+
+
+def use_transport(consumer, handler=paginated_handler):
+    """
+    Replace the consumer client with one using a mocked transport.
+    """
+    consumer.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return consumer
+
+
+@pytest.fixture
+def mock_async_api_consumer():
+    """
+    return a mock async API consumer using a mocked transport
+    """
+    return use_transport(MockAsyncApiConsumer("https://example.com"))
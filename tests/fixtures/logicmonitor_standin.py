@@ -0,0 +1,57 @@
+import pytest
+from benchmarks.standin import StandInServer
+from benchmarks.logicmonitor_standin import BASE_PATH, LogicMonitorStandInHandler
+
+"""
+A local LogicMonitor stand-in server which validates the LMv1 signature of every request.
+Requests with a signature that does not match the method, path and body actually received are answered with a 401.
+Compressed request bodies are decompressed before the signature is checked, as LogicMonitor signs the uncompressed payload.
+The server and the signature check are the ones of the benchmark stand-in, only the answers differ.
+"""
+
+API_KEY = "testkey"
+ACCESS_ID = "testid"
+
+
+class SignatureCheckingHandler(LogicMonitorStandInHandler):
+    api_key = API_KEY
+    access_id = ACCESS_ID
+
+    def _respond(self):
+        body = self._read_body()
+        path = self.path.split("?")[0][len(BASE_PATH) + 1 :]
+        status = 200 if self._check_signature(path, body) else 401
+        payload = {
+            "path": path,
+            "body": body.decode("utf-8"),
+            "received": int(self.headers.get("Content-Length", 0)),
+            "encoding": self.headers.get("Content-Encoding"),
+        }
+        if path == "items":
+            payload["items"] = [{"id": i, "name": f"item {i}"} for i in range(2000)]
+        self._send_json(status, payload)
+
+
+class CompressingHandler(SignatureCheckingHandler):
+    compress = True
+
+
+def run_standin(handler):
+    with StandInServer(handler) as server:
+        yield f"{server.base_url}{BASE_PATH}"
+
+
+@pytest.fixture
+def logicmonitor_standin():
+    """
+    run the stand-in server for the duration of a test, returning its base url
+    """
+    yield from run_standin(SignatureCheckingHandler)
+
+
+@pytest.fixture
+def compressing_logicmonitor_standin():
+    """
+    run the stand-in server gzip encoding its responses for the duration of a test, returning its base url
+    """
+    yield from run_standin(CompressingHandler)
@@ -91,6 +91,30 @@ class MockApiConsumerAll(ApiConsumer):
         return {"total": total, "items": items}
 
 
+class MockApiConsumerKeyset(MockApiConsumerAll):
+    """
+    Serves a mutable collection sorted by id, honouring offset as well as an id>N filter, recording the params requested.
+    """
+
+    def __init__(self, base_url: str, ids: list = None):
+        self.base_url = base_url
+        self.ids = list(range(1000)) if ids is None else ids
+        self.requested = []
+
+    def _make_request(self, method: str, path: str, **kwargs):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(path).query)
+        params = {**{k: v[0] for k, v in query.items()}, **kwargs.get("params", {})}
+        self.requested.append(params)
+        ids = sorted(self.ids)
+        for condition in params.get("filter", "").split(","):
+            if condition.startswith("id>"):
+                ids = [i for i in ids if i > int(condition[3:])]
+        offset = int(params.get("offset", 0))
+        size = int(params.get("size", 100))
+        items = [{"id": i, "name": f"Item {i}"} for i in ids[offset : offset + size]]
+        return {"total": len(ids), "items": items}
+
+
 @pytest.fixture
 def mock_api_consumer():
     """
@@ -105,3 +129,11 @@ def mock_api_consumer_all():
     return a mock API consumer for testing pagination (all method)
     """
     return MockApiConsumerAll
+
+
+@pytest.fixture
+def mock_api_consumer_keyset():
+    """
+    return a mock API consumer for testing keyset pagination
+    """
+    return MockApiConsumerKeyset
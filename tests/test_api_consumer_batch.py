@@ -0,0 +1,150 @@
+import asyncio
+import json
+import threading
+import time
+import pytest
+import httpx
+from unittest.mock import patch, Mock
+from requests.exceptions import HTTPError as ReqHTTPError
+from api_client_base.core.exceptions import HTTPError
+from api_client_base.implementations.logicmonitor import LogicMonitorClient
+from .fixtures.common import mock_api_consumer_using_base_helpers
+from .fixtures.async_consumer import MockAsyncApiConsumer, use_transport
+from .fixtures.logicmonitor_standin import logicmonitor_standin, API_KEY, ACCESS_ID
+
+"""
+These tests are for the batch request executor of the ApiConsumer and AsyncApiConsumer.
+"""
+
+
+def fake_request(method, url, headers=None, **kwargs):
+    """
+    answer with the requested id, slower for lower ids so requests complete out of order
+    404 for ids ending in 7
+    """
+    item = int(url.rsplit("/", 1)[-1])
+    time.sleep((10 - item % 10) / 1000)
+    response = Mock(status_code=200, headers={})
+    if item % 10 == 7:
+        response.status_code = 404
+        response.raise_for_status.side_effect = ReqHTTPError("404 Error")
+    response.content = json.dumps({"id": item, "method": method}).encode()
+    return response
+
+
+@patch("requests.Session.request", side_effect=fake_request)
+def test_batch_ordered_results(mock_request, mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer and a mix of requests
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+    entries = [("GET", f"item/{i}") for i in range(30)]
+    entries[3] = ("PATCH", "item/3", {"json": {"name": "x"}})
+
+    # WHEN - they are run as a batch
+    results = consumer.batch(entries, concurrency=8)
+
+    # THEN - the results should be in input order with the errors captured
+    assert len(results) == 30
+    for i, result in enumerate(results):
+        if i % 10 == 7:
+            assert isinstance(result, HTTPError) and result.status_code == 404
+        else:
+            assert result["id"] == i
+    assert results[3]["method"] == "PATCH"
+    assert mock_request.call_count == 30
+
+
+@patch("requests.Session.request", side_effect=fake_request)
+def test_batch_concurrency_bound(mock_request, mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer counting the requests in flight
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+    in_flight, peak, lock = [0], [0], threading.Lock()
+
+    def counting_request(*args, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        try:
+            return fake_request(*args, **kwargs)
+        finally:
+            with lock:
+                in_flight[0] -= 1
+
+    mock_request.side_effect = counting_request
+
+    # WHEN - a batch runs with a concurrency of 3
+    consumer.batch([("GET", f"item/{i}") for i in range(20)], concurrency=3)
+
+    # THEN - no more than 3 requests should have been in flight
+    assert 1 < peak[0] <= 3
+
+
+@patch("requests.Session.request", side_effect=fake_request)
+def test_batch_fail_fast(mock_request, mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer and a batch with a failing request early on
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+    entries = [("GET", f"item/{i}") for i in range(7, 100)]
+
+    # WHEN - the batch is run fail fast
+    with pytest.raises(HTTPError) as err:
+        consumer.batch(entries, concurrency=2, fail_fast=True)
+
+    # THEN - the error should be raised and the requests not yet started cancelled
+    assert err.value.status_code == 404
+    assert mock_request.call_count < len(entries)
+
+
+@patch("requests.Session.request", side_effect=fake_request)
+def test_batch_empty(mock_request, mock_api_consumer_using_base_helpers):
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+    assert consumer.batch([]) == []
+
+
+def test_logicmonitor_batch_signs_every_request(logicmonitor_standin):
+    # GIVEN - a LogicMonitor client against a signature checking stand-in
+    client = LogicMonitorClient(
+        company="testcompany", access_id=ACCESS_ID, api_key=API_KEY
+    )
+    client.base_url = logicmonitor_standin
+
+    # WHEN - many PATCH requests with different bodies are batched
+    entries = [
+        ("PATCH", f"device/devices/{i}", {"json": {"displayName": f"device-{i}"}})
+        for i in range(200)
+    ]
+    results = client.batch(entries, concurrency=16)
+
+    # THEN - every request should have been signed for its own body
+    assert [r["path"] for r in results] == [f"device/devices/{i}" for i in range(200)]
+    assert all(
+        json.loads(r["body"])["displayName"] == f"device-{i}"
+        for i, r in enumerate(results)
+    )
+    client.close()
+
+
+def async_handler(request: httpx.Request) -> httpx.Response:
+    item = int(request.url.path.rsplit("/", 1)[-1])
+    if item % 10 == 7:
+        return httpx.Response(404, json={})
+    return httpx.Response(200, json={"id": item, "method": request.method})
+
+
+def test_async_batch():
+    # GIVEN - an async consumer
+    consumer = use_transport(MockAsyncApiConsumer("https://example.com"), async_handler)
+    entries = [("GET", f"item/{i}") for i in range(30)]
+    entries[4] = ("DELETE", "item/4", {})
+
+    # WHEN - a batch is run collecting every result
+    results = asyncio.run(consumer.batch(entries, concurrency=5))
+
+    # THEN - the results should be in input order with the errors captured
+    assert results[4] == {"id": 4, "method": "DELETE"}
+    assert isinstance(results[17], HTTPError)
+    assert [r["id"] for i, r in enumerate(results) if i % 10 != 7] == [
+        i for i in range(30) if i % 10 != 7
+    ]
+
+    # THEN - fail fast should raise the error
+    with pytest.raises(HTTPError):
+        asyncio.run(consumer.batch(entries, fail_fast=True))
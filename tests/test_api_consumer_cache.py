@@ -0,0 +1,179 @@
+import json
+import pytest
+from unittest.mock import patch, Mock
+from api_client_base.core.response_cache import ResponseCache
+from .fixtures.common import mock_api_consumer_using_base_helpers
+
+"""
+These tests are for the ResponseCache and its use by the ApiConsumer Base Class.
+The responses are mocked using the unittest.mock module.
+"""
+
+
+def mock_response(body: dict):
+    response = Mock()
+    response.content = json.dumps(body).encode("utf-8")
+    return response
+
+
+@pytest.fixture
+def cached_consumer(mock_api_consumer_using_base_helpers):
+    return mock_api_consumer_using_base_helpers(
+        "https://example.com", cache=ResponseCache(ttl=60)
+    )
+
+
+def test_make_key_normalizes_params():
+    # GIVEN - a cache
+    cache = ResponseCache()
+
+    # THEN - params in any order should give the same key
+    assert cache.make_key("get", "a", {"x": 1, "y": 2}) == cache.make_key(
+        "GET", "a", [("y", "2"), ("x", "1")]
+    )
+
+    # THEN - vary headers should be part of the key, other headers should not
+    assert cache.make_key("GET", "a", headers={"X-Version": "3"}) != cache.make_key(
+        "GET", "a", headers={"X-Version": "2"}
+    )
+    assert cache.make_key(
+        "GET", "a", headers={"Authorization": "one"}
+    ) == cache.make_key("GET", "a", headers={"Authorization": "two"})
+
+
+def test_ttl_expiry():
+    # GIVEN - a cache with an entry
+    cache = ResponseCache(ttl=10)
+    with patch("time.monotonic", return_value=1000):
+        cache.set("key", b"{}")
+
+    # THEN - the entry should be returned before it expires
+    with patch("time.monotonic", return_value=1009):
+        assert cache.get("key") == b"{}"
+
+    # THEN - the entry should be dropped once expired
+    with patch("time.monotonic", return_value=1010):
+        assert cache.get("key") is None
+    assert len(cache) == 0
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_by_entries():
+    # GIVEN - a cache holding two entries
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+
+    # WHEN - the oldest entry is used and a third is added
+    cache.get("a")
+    cache.set("c", b"3")
+
+    # THEN - the least recently used entry should be evicted
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+    assert cache.evictions == 1
+
+
+def test_lru_eviction_by_bytes():
+    # GIVEN - a cache limited to 10 bytes
+    cache = ResponseCache(max_bytes=10)
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+
+    # WHEN - another entry pushes it over the limit
+    cache.set("c", b"123")
+
+    # THEN - the oldest entry should be evicted
+    assert cache.get("a") is None
+    assert cache.size == 8
+
+
+def test_invalidate_related_paths():
+    # GIVEN - a cache with entries for several paths
+    cache = ResponseCache()
+    for path in [
+        "device/devices",
+        "device/devices/1",
+        "device/devices/1/properties",
+        "device/devices/10",
+        "device/groups",
+    ]:
+        cache.set(cache.make_key("GET", path), b"{}")
+
+    # WHEN - a device is modified
+    removed = cache.invalidate("device/devices/1")
+
+    # THEN - the device, its sub resources and its collection should be removed
+    assert removed == 3
+    assert sorted(key[1] for key in cache._entries) == [
+        "device/devices/10",
+        "device/groups",
+    ]
+
+
+@patch("requests.Session.request")
+def test_get_is_cached(mock_request, cached_consumer):
+    # GIVEN - a mocked response
+    mock_request.return_value = mock_response({"key": "value"})
+
+    # WHEN - the same GET is made twice
+    first = cached_consumer.get("test/path", params={"a": 1, "b": 2})
+    second = cached_consumer.get("test/path", params={"b": 2, "a": 1})
+
+    # THEN - only one request should be sent
+    mock_request.assert_called_once()
+    assert first == second == {"key": "value"}
+    assert cached_consumer.cache.hits == 1
+    assert cached_consumer.cache.misses == 1
+
+    # THEN - hits should return a fresh object
+    second["key"] = "changed"
+    assert cached_consumer.get("test/path", params={"a": 1, "b": 2}) == {"key": "value"}
+
+
+@patch("requests.Session.request")
+def test_cache_bypass(mock_request, cached_consumer):
+    # GIVEN - a cached response
+    mock_request.return_value = mock_response({"key": "value"})
+    cached_consumer.get("test/path")
+
+    # WHEN - the cache is bypassed
+    mock_request.return_value = mock_response({"key": "new"})
+    response = cached_consumer.get("test/path", use_cache=False)
+
+    # THEN - the request should be sent and the cache refreshed
+    assert mock_request.call_count == 2
+    assert "use_cache" not in mock_request.call_args.kwargs
+    assert response == {"key": "new"}
+    assert cached_consumer.get("test/path") == {"key": "new"}
+
+
+@pytest.mark.parametrize("method", ["post", "put", "patch", "delete"])
+@patch("requests.Session.request")
+def test_mutation_invalidates(mock_request, method, cached_consumer):
+    # GIVEN - a cached response
+    mock_request.return_value = mock_response({"key": "value"})
+    cached_consumer.get("device/devices/1")
+
+    # WHEN - the resource is modified
+    getattr(cached_consumer, method)("device/devices/1")
+
+    # THEN - the next GET should be sent again
+    cached_consumer.get("device/devices/1")
+    assert mock_request.call_count == 3
+
+
+@patch("requests.Session.request")
+def test_no_cache_by_default(mock_request, mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer without a cache
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+    mock_request.return_value = mock_response({"key": "value"})
+
+    # WHEN - the same GET is made twice
+    consumer.get("test/path")
+    consumer.get("test/path")
+
+    # THEN - both requests should be sent
+    assert mock_request.call_count == 2
@@ -0,0 +1,186 @@
+import time
+import pytest
+from unittest.mock import patch, Mock
+from requests.exceptions import (
+    HTTPError as ReqHTTPError,
+    ConnectionError as ReqConnectionError,
+)
+from api_client_base.core.circuit_breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+from api_client_base.core.hooks import RequestHooks
+from api_client_base.core.retry import RetryPolicy
+from api_client_base.core.exceptions import HTTPError, ConnectionError, CircuitOpenError
+from .fixtures.common import mock_api_consumer_using_base_helpers
+
+"""
+These tests are for the circuit breaker shedding requests to failing endpoint groups.
+"""
+
+
+def error_response(status_code: int):
+    response = Mock(status_code=status_code, headers={}, content=b"{}")
+    response.raise_for_status.side_effect = ReqHTTPError(f"{status_code} Error")
+    return response
+
+
+def ok_response(*args, **kwargs):
+    return Mock(status_code=200, headers={}, content=b'{"ok": true}')
+
+
+def test_opens_after_consecutive_failures():
+    # GIVEN - a breaker opening after 3 consecutive failures
+    breaker = CircuitBreaker(failure_threshold=3, min_requests=100)
+
+    # WHEN - failures are recorded for an endpoint group
+    changes = [
+        breaker.record("device/devices/1", HTTPError(503, "Unavailable"))
+        for _ in range(3)
+    ]
+
+    # THEN - the third should open its circuit, the other groups stay closed
+    assert changes[:2] == [None, None]
+    assert (changes[2].group, changes[2].previous, changes[2].state) == (
+        "device/devices",
+        CLOSED,
+        OPEN,
+    )
+    assert breaker.state("device/devices/2") == OPEN
+    assert breaker.state("device/groups") == CLOSED
+    with pytest.raises(CircuitOpenError) as err:
+        breaker.allow("device/devices")
+    assert err.value.group == "device/devices" and err.value.retry_after > 0
+
+
+def test_opens_on_error_rate():
+    # GIVEN - a breaker opening at a 50% error rate over 10 requests
+    breaker = CircuitBreaker(
+        failure_threshold=100, error_rate=0.5, window_size=10, min_requests=10
+    )
+
+    # WHEN - every other request fails
+    for i in range(9):
+        breaker.record("device/devices", ConnectionError("down") if i % 2 else None)
+    assert breaker.state("device/devices") == CLOSED
+    change = breaker.record("device/devices", ConnectionError("down"))
+
+    # THEN - the circuit should open once the window is full
+    assert change.state == OPEN and "50%" in change.reason
+
+
+def test_client_errors_do_not_count():
+    # GIVEN - a breaker opening after 2 consecutive failures
+    breaker = CircuitBreaker(failure_threshold=2)
+
+    # WHEN - the API answers with client errors
+    for status in (400, 404, 429, 404):
+        breaker.record("device/devices", HTTPError(status, "Error"))
+
+    # THEN - the circuit should stay closed
+    assert breaker.state("device/devices") == CLOSED
+
+
+def test_half_open_probe_recovers():
+    # GIVEN - an open circuit with a short reset timeout
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record("device/devices", HTTPError(500, "Error"))
+
+    # WHEN - the reset timeout passes
+    time.sleep(0.06)
+    change = breaker.allow("device/devices")
+
+    # THEN - one probe should be let through while the others fail fast
+    assert change.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.allow("device/devices")
+
+    # THEN - a failed probe should open the circuit again, a successful one close it
+    assert breaker.record("device/devices", HTTPError(502, "Error")).state == OPEN
+    time.sleep(0.06)
+    breaker.allow("device/devices")
+    assert breaker.record("device/devices").state == CLOSED
+    assert breaker.states() == {"device/devices": CLOSED}
+
+
+@patch("requests.Session.request")
+def test_consumer_fails_fast_while_open(
+    mock_request, mock_api_consumer_using_base_helpers
+):
+    # GIVEN - a consumer with a circuit breaker and hooks recording state changes and errors
+    hooks = RequestHooks()
+    changes, errors = [], []
+    hooks.subscribe("circuit_state_change", changes.append)
+    hooks.subscribe("on_error", lambda event: errors.append(type(event.error)))
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com",
+        hooks=hooks,
+        circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=0.05),
+    )
+    mock_request.side_effect = ReqConnectionError("refused")
+
+    # WHEN - the endpoint group fails until the circuit opens
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            consumer.get("device/devices/1")
+    with pytest.raises(CircuitOpenError):
+        consumer.get("device/devices/2")
+
+    # THEN - the request after the circuit opened should not be sent, other groups still are
+    assert mock_request.call_count == 2
+    mock_request.side_effect = ok_response
+    assert consumer.get("device/groups") == {"ok": True}
+    assert errors == [ConnectionError, ConnectionError, CircuitOpenError]
+
+    # WHEN - the reset timeout passes and the API recovered
+    time.sleep(0.06)
+    assert consumer.get("device/devices/3") == {"ok": True}
+
+    # THEN - the state changes should have been passed to the hooks
+    assert [(c.group, c.previous, c.state) for c in changes] == [
+        ("device/devices", CLOSED, OPEN),
+        ("device/devices", OPEN, HALF_OPEN),
+        ("device/devices", HALF_OPEN, CLOSED),
+    ]
+
+
+@patch("time.sleep")
+@patch("requests.Session.request", return_value=error_response(503))
+def test_consumer_stops_retrying_once_open(
+    mock_request, mock_sleep, mock_api_consumer_using_base_helpers
+):
+    # GIVEN - a consumer retrying up to 10 times with a breaker opening after 3 failures
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com",
+        retry_policy=RetryPolicy(max_attempts=10),
+        circuit_breaker=CircuitBreaker(failure_threshold=3),
+    )
+
+    # WHEN - the endpoint keeps failing
+    with pytest.raises(CircuitOpenError):
+        consumer.get("device/devices")
+
+    # THEN - the retries should stop as soon as the circuit opened
+    assert mock_request.call_count == 3
+
+
+@patch("requests.Session.request", side_effect=ok_response)
+def test_consumer_releases_probe_when_hook_raises(
+    mock_request, mock_api_consumer_using_base_helpers
+):
+    # GIVEN - an open circuit with a short reset timeout and a before_send hook which fails once
+    hooks = RequestHooks()
+    hooks.subscribe("before_send", Mock(side_effect=[RuntimeError("hook"), None]))
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com", hooks=hooks, circuit_breaker=breaker
+    )
+    breaker.record("device/devices", HTTPError(500, "Error"))
+    time.sleep(0.06)
+
+    # WHEN - the probe fails in the hook before being sent
+    with pytest.raises(RuntimeError):
+        consumer.get("device/devices")
+
+    # THEN - its slot should be given back, so the next request can probe and close the circuit
+    assert breaker.state("device/devices") == HALF_OPEN
+    assert consumer.get("device/devices") == {"ok": True}
+    assert breaker.state("device/devices") == CLOSED
+    assert mock_request.call_count == 1
@@ -0,0 +1,99 @@
+import json
+import pytest
+from unittest.mock import patch, Mock
+from api_client_base.core.codec import (
+    JsonCodec,
+    OrjsonCodec,
+    available_codecs,
+    get_codec,
+)
+from api_client_base.implementations.logicmonitor import LogicMonitorClient
+from .fixtures.common import mock_api_consumer_using_base_helpers
+
+"""
+These tests are for the pluggable JSON codecs and their use by the ApiConsumer and LogicMonitorClient.
+"""
+
+document = {"total": 1, "items": [{"id": 1, "name": "café", "tags": [None, True]}]}
+
+
+@pytest.mark.parametrize("name", list(available_codecs()))
+def test_codec_round_trip(name):
+    # GIVEN - an installed codec
+    codec = get_codec(name)
+
+    # THEN - encoding should give bytes that decode back to the same document
+    encoded = codec.encode(document)
+    assert isinstance(encoded, bytes)
+    assert codec.decode(encoded) == document
+    assert json.loads(encoded) == document
+
+
+def test_get_codec():
+    # THEN - auto should pick the fastest installed codec
+    assert get_codec("json").name == "json"
+    assert get_codec("auto").name == list(available_codecs())[-1]
+
+    # THEN - unknown codecs should be rejected
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+def test_orjson_codec():
+    # GIVEN - orjson is installed
+    pytest.importorskip("orjson")
+
+    # THEN - the orjson codec should be available
+    assert isinstance(get_codec("orjson"), OrjsonCodec)
+
+
+@patch("requests.Session.request")
+def test_consumer_decodes_with_codec(
+    mock_request, mock_api_consumer_using_base_helpers
+):
+    # GIVEN - a consumer with a custom codec
+    codec = JsonCodec()
+    consumer = mock_api_consumer_using_base_helpers("https://example.com", codec=codec)
+    mock_request.return_value = Mock(content=b'{"key": "value"}')
+
+    # WHEN - a request is made
+    with patch.object(codec, "decode", wraps=codec.decode) as mock_decode:
+        response = consumer.get("test/path")
+
+    # THEN - the body should be decoded by the codec
+    mock_decode.assert_called_once_with(b'{"key": "value"}')
+    assert response == {"key": "value"}
+
+
+def test_default_codec(mock_api_consumer_using_base_helpers):
+    # THEN - the standard library codec should be used by default
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+    assert type(consumer.codec) is JsonCodec
+
+
+@patch("requests.Session.request")
+def test_logicmonitor_encodes_and_signs_with_codec(mock_request):
+    # GIVEN - a LogicMonitor client with a compact codec
+    class CompactCodec(JsonCodec):
+        def encode(self, obj) -> bytes:
+            return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    client = LogicMonitorClient(
+        company="testcompany",
+        access_id="testid",
+        api_key="testkey",
+        codec=CompactCodec(),
+    )
+    mock_request.return_value = Mock(content=b"{}")
+
+    # WHEN - a POST request is made
+    client.post("device/devices", json={"name": "device", "id": 1})
+
+    # THEN - the body should be encoded by the codec and the signature cover it
+    kwargs = mock_request.call_args.kwargs
+    assert kwargs["data"] == b'{"name":"device","id":1}'
+    epoch = kwargs["headers"]["Authorization"].split(":")[-1]
+    signature = client._construct_signature(
+        f"POST{epoch}".encode("utf-8") + kwargs["data"] + b"device/devices"
+    )
+    assert kwargs["headers"]["Authorization"] == f"LMv1 testid:{signature}:{epoch}"
@@ -14,7 +14,7 @@ def api_headers_basic():
     return {"Content-Type": "application/json", "Accept": "application/json"}
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_common_get(
     mock_request, mock_api_consumer_using_base_helpers, api_headers_basic
 ):
@@ -22,7 +22,7 @@ def test_common_get(
     api_consumer = mock_api_consumer_using_base_helpers("http://example.com")
     # GIVEN - a mock response
     mock_response = Mock()
-    mock_response.json.return_value = {"key": "value"}
+    mock_response.content = b'{"key": "value"}'
     mock_response.status_code = 200
     mock_request.return_value = mock_response
 
@@ -38,7 +38,7 @@ def test_common_get(
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_common_post(
     mock_request, mock_api_consumer_using_base_helpers, api_headers_basic
 ):
@@ -47,7 +47,7 @@ def test_common_post(
 
     # GIVEN - a mock response
     mock_response = Mock()
-    mock_response.json.return_value = {"key": "value"}
+    mock_response.content = b'{"key": "value"}'
     mock_response.status_code = 200
     mock_request.return_value = mock_response
 
@@ -66,7 +66,7 @@ def test_common_post(
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_common_put(
     mock_request, mock_api_consumer_using_base_helpers, api_headers_basic
 ):
@@ -75,7 +75,7 @@ def test_common_put(
 
     # GIVEN - a mock response
     mock_response = Mock()
-    mock_response.json.return_value = {"key": "value"}
+    mock_response.content = b'{"key": "value"}'
     mock_response.status_code = 200
     mock_request.return_value = mock_response
 
@@ -94,7 +94,7 @@ def test_common_put(
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_common_patch(
     mock_request, mock_api_consumer_using_base_helpers, api_headers_basic
 ):
@@ -103,7 +103,7 @@ def test_common_patch(
 
     # GIVEN - a mock response
     mock_response = Mock()
-    mock_response.json.return_value = {"key": "value"}
+    mock_response.content = b'{"key": "value"}'
     mock_response.status_code = 200
     mock_request.return_value = mock_response
 
@@ -122,7 +122,7 @@ def test_common_patch(
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_common_delete(
     mock_request, mock_api_consumer_using_base_helpers, api_headers_basic
 ):
@@ -131,7 +131,7 @@ def test_common_delete(
 
     # GIVEN - a mock response
     mock_response = Mock()
-    mock_response.json.return_value = {"key": "value"}
+    mock_response.content = b'{"key": "value"}'
     mock_response.status_code = 200
     mock_request.return_value = mock_response
 
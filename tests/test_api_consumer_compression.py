@@ -0,0 +1,179 @@
+import gzip
+import json
+import zlib
+import pytest
+from unittest.mock import patch, Mock
+from api_client_base.core.compression import (
+    Compression,
+    available_encodings,
+    accepted_encodings,
+)
+from api_client_base.core.retry import RetryPolicy
+from api_client_base.core.exceptions import HTTPError
+from api_client_base.implementations.logicmonitor import LogicMonitorClient
+from .fixtures.common import mock_api_consumer_using_base_helpers
+from .fixtures.logicmonitor_standin import (
+    logicmonitor_standin,
+    compressing_logicmonitor_standin,
+    API_KEY,
+    ACCESS_ID,
+)
+
+"""
+These tests are for the compression of responses and large request bodies.
+"""
+
+LARGE = [{"id": i, "displayName": f"device-{i}"} for i in range(200)]
+
+
+def ok_response(*args, **kwargs):
+    return Mock(status_code=200, headers={}, content=b"{}")
+
+
+def make_client(base_url: str, **kwargs) -> LogicMonitorClient:
+    client = LogicMonitorClient(
+        company="testcompany", access_id=ACCESS_ID, api_key=API_KEY, **kwargs
+    )
+    client.base_url = base_url
+    return client
+
+
+def test_available_encodings():
+    assert available_encodings()[:2] == ("gzip", "deflate")
+    assert "gzip" in accepted_encodings()
+    with pytest.raises(ValueError):
+        Compression(request_encoding="lzma")
+
+
+@patch("requests.Session.request", side_effect=ok_response)
+def test_accept_encoding_advertised(mock_request, mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer with compression
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com", compression=Compression()
+    )
+
+    # WHEN - a request is made
+    consumer.get("device/devices")
+
+    # THEN - every decodable encoding should be advertised
+    headers = mock_request.call_args.kwargs["headers"]
+    assert headers["Accept-Encoding"] == accepted_encodings()
+
+
+@pytest.mark.parametrize(
+    "encoding, decompress", [("gzip", gzip.decompress), ("deflate", zlib.decompress)]
+)
+@patch("requests.Session.request", side_effect=ok_response)
+def test_large_bodies_compressed(
+    mock_request, encoding, decompress, mock_api_consumer_using_base_helpers
+):
+    # GIVEN - a consumer compressing request bodies from 1KB
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com",
+        compression=Compression(request_encoding=encoding, min_size=1024),
+    )
+
+    # WHEN - a large and a small body are posted
+    consumer.post("device/devices", json=LARGE)
+    consumer.post("device/devices", json={"id": 1})
+
+    # THEN - only the large body should be compressed
+    large, small = mock_request.call_args_list
+    assert large.kwargs["headers"]["Content-Encoding"] == encoding
+    assert json.loads(decompress(large.kwargs["data"])) == LARGE
+    assert "json" not in large.kwargs
+    assert "Content-Encoding" not in small.kwargs["headers"]
+    assert small.kwargs["json"] == {"id": 1}
+
+
+@patch("requests.Session.request", side_effect=ok_response)
+def test_get_not_compressed(mock_request, mock_api_consumer_using_base_helpers):
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com",
+        compression=Compression(request_encoding="gzip", min_size=1),
+    )
+    consumer.get("device/devices", params={"size": 1000})
+    assert "Content-Encoding" not in mock_request.call_args.kwargs["headers"]
+
+
+def test_logicmonitor_signs_uncompressed_body(logicmonitor_standin):
+    # GIVEN - a LogicMonitor client compressing request bodies, against a signature checking stand-in
+    client = make_client(
+        logicmonitor_standin,
+        compression=Compression(request_encoding="gzip", min_size=256),
+    )
+
+    # WHEN - a large payload is posted
+    response = client.post("device/devices", json=LARGE)
+
+    # THEN - the body should have been sent compressed and signed over the uncompressed payload
+    assert response["encoding"] == "gzip"
+    assert response["received"] < len(json.dumps(LARGE)) / 2
+    assert json.loads(response["body"]) == LARGE
+    client.close()
+
+
+@patch("time.sleep")
+def test_logicmonitor_retry_resigns_uncompressed_body(mock_sleep):
+    # GIVEN - a LogicMonitor client compressing request bodies, whose first attempt fails
+    client = LogicMonitorClient(
+        company="testcompany",
+        access_id=ACCESS_ID,
+        api_key=API_KEY,
+        retry_policy=RetryPolicy(allowed_methods=("PUT",)),
+        compression=Compression(request_encoding="gzip", min_size=256),
+    )
+    signed = []
+    original = client._sign_headers
+
+    def record_signature(method, path, payload):
+        signed.append(payload)
+        return original(method, path, payload)
+
+    responses = iter([HTTPError(503, "Unavailable"), ok_response()])
+
+    def send(*args, **kwargs):
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    # WHEN - a large payload is put
+    with patch.object(client, "_sign_headers", record_signature), patch.object(
+        client, "_send", side_effect=send
+    ) as mock_send:
+        client.put("device/devices/1", json=LARGE)
+
+    # THEN - both attempts should be signed over the uncompressed body and sent compressed
+    assert [json.loads(payload) for payload in signed] == [LARGE, LARGE]
+    for call in mock_send.call_args_list:
+        assert json.loads(gzip.decompress(call.kwargs["data"])) == LARGE
+    client.close()
+
+
+def test_compressed_responses_streamed(compressing_logicmonitor_standin):
+    # GIVEN - a LogicMonitor client against a stand-in gzip encoding its responses
+    client = make_client(compressing_logicmonitor_standin, compression=Compression())
+    encodings = []
+    request = client.session.request
+
+    def record_encoding(*args, **kwargs):
+        response = request(*args, **kwargs)
+        encodings.append(response.headers.get("Content-Encoding"))
+        return response
+
+    # WHEN - the items are streamed while the body downloads
+    with patch.object(client.session, "request", side_effect=record_encoding):
+        page = client._stream_request(
+            "GET",
+            "items",
+            headers=client._sign_headers("GET", "items", {}),
+            chunk_size=512,
+        )
+        items = list(page)
+
+    # THEN - the gzip encoded body should be decompressed chunk by chunk
+    assert encodings == ["gzip"]
+    assert len(items) == 2000 and items[-1] == {"id": 1999, "name": "item 1999"}
+    assert page.fields["path"] == "items"
+    client.close()
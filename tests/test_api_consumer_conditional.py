@@ -0,0 +1,132 @@
+import json
+import pytest
+from unittest.mock import patch, Mock
+from api_client_base.core.exceptions import HTTPError
+from api_client_base.core.validator_store import ValidatorStore
+from .fixtures.common import mock_api_consumer_using_base_helpers
+
+"""
+These tests are for the ETag / Last-Modified conditional requests made by the ApiConsumer Base Class.
+The responses are mocked using the unittest.mock module.
+"""
+
+
+def mock_response(status_code: int = 200, body=None, headers: dict = None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = json.dumps(body).encode("utf-8") if body else b""
+    return response
+
+
+@pytest.fixture
+def conditional_consumer(mock_api_consumer_using_base_helpers):
+    return mock_api_consumer_using_base_helpers(
+        "https://example.com", validators=ValidatorStore()
+    )
+
+
+@patch("requests.Session.request")
+def test_validators_are_sent(mock_request, conditional_consumer):
+    # GIVEN - a response with validators
+    mock_request.return_value = mock_response(
+        body={"key": "value"},
+        headers={"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    )
+    conditional_consumer.get("test/path", params={"a": 1})
+
+    # WHEN - the same URL is requested again
+    conditional_consumer.get("test/path", params={"a": 1})
+
+    # THEN - the validators should be sent as conditional headers
+    headers = mock_request.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"abc"'
+    assert headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    # THEN - the instance headers should not be changed
+    assert "If-None-Match" not in conditional_consumer.headers
+
+
+@patch("requests.Session.request")
+def test_not_modified_returns_stored_body(mock_request, conditional_consumer):
+    # GIVEN - a stored response
+    mock_request.return_value = mock_response(
+        body={"key": "value"}, headers={"ETag": '"abc"'}
+    )
+    first = conditional_consumer.get("test/path")
+
+    # WHEN - the API answers 304 Not Modified
+    mock_request.return_value = mock_response(status_code=304)
+    second = conditional_consumer.get("test/path")
+
+    # THEN - the stored body should be returned, as a copy of its own
+    assert second == first == {"key": "value"}
+    assert second is not first
+    assert conditional_consumer.validators.revalidated == 1
+
+    # THEN - changing a returned body should not change the stored one
+    second["key"] = "changed"
+    assert conditional_consumer.get("test/path") == {"key": "value"}
+    assert conditional_consumer.validators.revalidated == 2
+
+
+@patch("requests.Session.request")
+def test_not_modified_without_stored_body(mock_request, conditional_consumer):
+    # GIVEN - a 304 Not Modified for a URL without a stored body
+    mock_request.return_value = mock_response(status_code=304)
+
+    # THEN - an HTTPError should be raised rather than a decode error
+    with pytest.raises(HTTPError) as err:
+        conditional_consumer.get("test/path", headers={"If-None-Match": '"abc"'})
+    assert err.value.status_code == 304
+
+
+@patch("requests.Session.request")
+def test_changed_response_replaces_stored_body(mock_request, conditional_consumer):
+    # GIVEN - a stored response
+    mock_request.return_value = mock_response(
+        body={"key": "value"}, headers={"ETag": '"abc"'}
+    )
+    conditional_consumer.get("test/path")
+
+    # WHEN - the resource has changed
+    mock_request.return_value = mock_response(
+        body={"key": "new"}, headers={"ETag": '"def"'}
+    )
+    response = conditional_consumer.get("test/path")
+
+    # THEN - the new body and validator should be stored
+    assert response == {"key": "new"}
+    conditional_consumer.get("test/path")
+    assert mock_request.call_args.kwargs["headers"]["If-None-Match"] == '"def"'
+
+
+@patch("requests.Session.request")
+def test_no_validators_no_conditional_headers(mock_request, conditional_consumer):
+    # GIVEN - responses without validators
+    mock_request.return_value = mock_response(body={"key": "value"})
+
+    # WHEN - the same URL is requested twice
+    conditional_consumer.get("test/path")
+    conditional_consumer.get("test/path")
+
+    # THEN - no conditional headers should be sent
+    headers = mock_request.call_args.kwargs["headers"]
+    assert "If-None-Match" not in headers
+    assert "If-Modified-Since" not in headers
+    assert len(conditional_consumer.validators) == 0
+
+
+def test_store_evicts_least_recently_used():
+    # GIVEN - a store limited to two URLs
+    store = ValidatorStore(max_entries=2)
+    store.set(store.make_key("a"), '"1"', None, {})
+    store.set(store.make_key("b"), '"2"', None, {})
+
+    # WHEN - the oldest URL is used and a third is added
+    store.get(store.make_key("a"))
+    store.set(store.make_key("c"), '"3"', None, {})
+
+    # THEN - the least recently used URL should be dropped
+    assert store.get(store.make_key("b")) is None
+    assert store.get(store.make_key("a")) is not None
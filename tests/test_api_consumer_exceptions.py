@@ -22,7 +22,7 @@ The make request method should handle the requests exceptions and raise the corr
 """
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_make_request_http_error(mock_request, mock_api_consumer_for_exceptions):
     # GIVEN - A mocked response with an HTTP error
     mock_response = Mock()
@@ -48,7 +48,7 @@ def test_make_request_http_error(mock_request, mock_api_consumer_for_exceptions)
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_make_request_connection_error(mock_request, mock_api_consumer_for_exceptions):
     # GIVEN - A mocked response with a connection error
     mock_request.side_effect = ReqConnectionError(
@@ -69,7 +69,7 @@ def test_make_request_connection_error(mock_request, mock_api_consumer_for_excep
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_make_request_timeout_error(mock_request, mock_api_consumer_for_exceptions):
     # GIVEN - A mocked response with a timeout error
     mock_request.side_effect = ReqTimeout(
@@ -90,7 +90,7 @@ def test_make_request_timeout_error(mock_request, mock_api_consumer_for_exceptio
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_make_request_request_exception(mock_request, mock_api_consumer_for_exceptions):
     # GIVEN - A mocked response with a generic request exception
     mock_request.side_effect = ReqRequestException("Generic request error")
@@ -109,7 +109,7 @@ def test_make_request_request_exception(mock_request, mock_api_consumer_for_exce
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_make_request_request_error(mock_request, mock_api_consumer_for_exceptions):
     # GIVEN - A mocked response with a generic request error
     mock_request.side_effect = Exception("Generic request error")
@@ -0,0 +1,160 @@
+import json
+import pytest
+from unittest.mock import patch, Mock
+from requests.exceptions import HTTPError as ReqHTTPError
+from api_client_base.core.hooks import RequestHooks, RequestEvent, path_template
+from api_client_base.core.exceptions import HTTPError
+from api_client_base.core.retry import RetryPolicy
+from api_client_base.implementations.logicmonitor import LogicMonitorClient
+from .fixtures.common import mock_api_consumer_using_base_helpers
+from .fixtures.logicmonitor_standin import logicmonitor_standin, API_KEY, ACCESS_ID
+
+"""
+These tests are for the RequestHooks instrumentation of the ApiConsumer Base Class.
+"""
+
+
+def recorder(hooks: RequestHooks) -> list:
+    """
+    subscribe to every event, recording (event name, RequestEvent) pairs
+    """
+    events = []
+    for name in RequestHooks.events:
+        hooks.subscribe(name, lambda event, name=name: events.append((name, event)))
+    return events
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("device/devices", "device/devices"),
+        ("device/devices/42", "device/devices/{id}"),
+        ("/device/devices/42/properties?size=10", "device/devices/{id}/properties"),
+        ("device/groups/1/devices/2", "device/groups/{id}/devices/{id}"),
+        ("alert/alerts/DS123", "alert/alerts/DS123"),
+    ],
+)
+def test_path_template(path, expected):
+    assert path_template(path) == expected
+
+
+def test_subscribe_and_unsubscribe():
+    # GIVEN - hooks without subscribers
+    hooks = RequestHooks()
+    assert not hooks
+
+    # WHEN - a callback is subscribed
+    callback = Mock()
+    hooks.subscribe("after_receive", callback)
+
+    # THEN - it should be called for its event only
+    assert hooks
+    event = RequestEvent("GET", "device/devices")
+    hooks.emit("after_receive", event)
+    hooks.emit("before_send", event)
+    callback.assert_called_once_with(event)
+
+    # WHEN - it is unsubscribed
+    hooks.unsubscribe("after_receive", callback)
+
+    # THEN - nothing should be subscribed
+    assert not hooks
+
+    # THEN - unknown events should be rejected
+    with pytest.raises(ValueError):
+        hooks.subscribe("after_send", callback)
+
+
+@patch("requests.Session.request")
+def test_no_subscribers_no_event(mock_request, mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer without subscribers
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+    mock_request.return_value = Mock(status_code=200, headers={}, content=b"{}")
+
+    # THEN - no event should be built
+    with patch(
+        "api_client_base.core.api_consumer.RequestEvent", side_effect=AssertionError
+    ):
+        assert consumer.get("test/path") == {}
+
+
+def test_logicmonitor_timings(logicmonitor_standin):
+    # GIVEN - a LogicMonitor client with a recorder subscribed
+    client = LogicMonitorClient(
+        company="testcompany", access_id=ACCESS_ID, api_key=API_KEY
+    )
+    client.base_url = logicmonitor_standin
+    events = recorder(client.hooks)
+
+    # WHEN - a POST request is made
+    client.post("device/devices/7/properties", json={"name": "a", "value": "b"})
+
+    # THEN - the request should be described from signing to decoding
+    assert [name for name, _ in events] == ["before_send", "after_receive"]
+    event = events[-1][1]
+    assert event.method == "POST"
+    assert event.endpoint == "device/devices/{id}/properties"
+    assert event.status == 200
+    assert event.retries == 0
+    assert event.request_bytes == len(b'{"name": "a", "value": "b"}')
+    assert event.response_bytes > 0
+    assert set(event.timings) == {
+        "sign",
+        "queue",
+        "send",
+        "first_byte",
+        "download",
+        "decode",
+        "total",
+    }
+    assert event.timings["total"] >= event.timings["send"] >= event.timings["download"]
+    client.close()
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_retry_events(mock_request, mock_sleep, mock_api_consumer_using_base_helpers):
+    # GIVEN - a retrying consumer and a server failing once
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com", retry_policy=RetryPolicy(backoff_factor=0)
+    )
+    events = recorder(consumer.hooks)
+    error = Mock(status_code=503, headers={})
+    error.raise_for_status.side_effect = ReqHTTPError("503 Error")
+    ok = Mock(status_code=200, headers={}, content=json.dumps({"a": 1}).encode())
+    mock_request.side_effect = [error, ok]
+
+    # WHEN - the request is made
+    consumer.get("test/path")
+
+    # THEN - every attempt should be reported with its retry count
+    assert [(name, event.retries) for name, event in events] == [
+        ("before_send", 0),
+        ("on_error", 0),
+        ("before_send", 1),
+        ("after_receive", 1),
+    ]
+    failed, succeeded = events[1][1], events[3][1]
+    assert isinstance(failed.error, HTTPError)
+    assert failed.status == 503 and failed.retrying
+    assert succeeded.status == 200 and succeeded.error is None
+    assert "backoff" in succeeded.timings and "decode" in succeeded.timings
+
+
+@patch("requests.Session.request")
+def test_final_error_event(mock_request, mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer and a failing server
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+    events = recorder(consumer.hooks)
+    error = Mock(status_code=404, headers={})
+    error.raise_for_status.side_effect = ReqHTTPError("404 Error")
+    mock_request.return_value = error
+
+    # WHEN - the request fails
+    with pytest.raises(HTTPError):
+        consumer.get("test/path")
+
+    # THEN - the error should be reported as not retried
+    name, event = events[-1]
+    assert name == "on_error"
+    assert event.status == 404 and not event.retrying
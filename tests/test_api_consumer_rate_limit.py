@@ -0,0 +1,175 @@
+import json
+import threading
+import pytest
+from unittest.mock import patch, Mock
+from api_client_base.core.exceptions import RateLimitError
+from api_client_base.core.paginator_offset import OffsetPaginator
+from api_client_base.core.rate_limiter import TokenBucket, RateLimiter
+from .fixtures.common import mock_api_consumer_using_base_helpers
+
+"""
+These tests are for the TokenBucket / RateLimiter and their use by the ApiConsumer Base Class.
+time.monotonic and time.sleep are patched where needed so no time is spent waiting.
+"""
+
+
+class FakeClock:
+    """
+    A clock whose sleep advances the time instantly.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch("time.monotonic", clock.monotonic), patch("time.sleep", clock.sleep):
+        yield clock
+
+
+def test_bucket_burst_then_rate(clock):
+    # GIVEN - a bucket of 5 tokens refilled at 10 per second
+    bucket = TokenBucket(rate=10, capacity=5)
+
+    # THEN - a burst of 5 should not wait
+    for _ in range(5):
+        assert bucket.acquire()
+    assert clock.slept == []
+
+    # THEN - the next token should wait for the refill
+    assert bucket.acquire()
+    assert clock.slept == [pytest.approx(0.1)]
+
+
+def test_bucket_non_blocking(clock):
+    # GIVEN - an empty bucket
+    bucket = TokenBucket(rate=1, capacity=1)
+    bucket.acquire()
+
+    # THEN - a non blocking acquire should fail without waiting
+    assert bucket.acquire(blocking=False) is False
+    assert clock.slept == []
+
+    # THEN - a token should be available once refilled
+    clock.now += 1
+    assert bucket.acquire(blocking=False) is True
+
+
+def test_bucket_timeout(clock):
+    # GIVEN - an empty bucket refilled once every 10 seconds
+    bucket = TokenBucket(rate=0.1, capacity=1)
+    bucket.acquire()
+
+    # THEN - an acquire should give up after the timeout
+    assert bucket.acquire(timeout=2) is False
+    assert sum(clock.slept) == pytest.approx(2)
+
+
+def test_bucket_invalid_rate():
+    # THEN - the rate must be positive
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_bucket_shared_across_threads():
+    # GIVEN - a bucket holding 100 tokens that barely refills
+    bucket = TokenBucket(rate=0.001, capacity=100)
+    taken = []
+
+    # WHEN - many threads take tokens without blocking
+    def worker():
+        for _ in range(50):
+            if bucket.acquire(blocking=False):
+                taken.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # THEN - exactly the available tokens should have been handed out
+    assert len(taken) == 100
+
+
+def test_bucket_selection():
+    # GIVEN - a limiter with path, method and default buckets
+    default, get, devices, properties = (TokenBucket(1) for _ in range(4))
+    limiter = RateLimiter(
+        default=default,
+        per_method={"get": get},
+        per_path_prefix={
+            "device/devices": devices,
+            "/device/devices/1/properties": properties,
+        },
+    )
+
+    # THEN - the longest path prefix, then the method, then the default should be used
+    assert limiter.get_bucket("GET", "device/devices/1/properties") is properties
+    assert limiter.get_bucket("PATCH", "device/devices/1?fields=id") is devices
+    assert limiter.get_bucket("GET", "alert/alerts") is get
+    assert limiter.get_bucket("POST", "alert/alerts") is default
+    assert RateLimiter().get_bucket("GET", "alert/alerts") is None
+
+
+def page_response(offset: int):
+    response = Mock()
+    response.content = json.dumps(
+        {"total": 300, "items": [{"id": i} for i in range(offset, offset + 100)]}
+    ).encode("utf-8")
+    return response
+
+
+@patch("requests.Session.request")
+def test_paginated_requests_are_paced(
+    mock_request, clock, mock_api_consumer_using_base_helpers
+):
+    # GIVEN - a consumer limited to 1 request per second
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com",
+        rate_limiter=RateLimiter(default=TokenBucket(rate=1, capacity=1)),
+    )
+    mock_request.side_effect = lambda method, url, **kwargs: page_response(
+        kwargs["params"].get("offset", 0)
+    )
+
+    # WHEN - all pages are fetched
+    items = OffsetPaginator(size_value=100, items_key="items").all(
+        consumer, "GET", "device/devices"
+    )
+
+    # THEN - each page after the first should wait for a token
+    assert len(items) == 300
+    assert clock.slept == [pytest.approx(1), pytest.approx(1)]
+
+
+@patch("requests.Session.request")
+def test_non_blocking_limiter_raises(
+    mock_request, mock_api_consumer_using_base_helpers
+):
+    # GIVEN - a non blocking limiter with a single token
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com",
+        rate_limiter=RateLimiter(
+            default=TokenBucket(rate=0.001, capacity=1), blocking=False
+        ),
+    )
+    mock_request.return_value = page_response(0)
+
+    # WHEN - two requests are made
+    consumer.get("device/devices")
+
+    # THEN - the second should fail without being sent
+    with pytest.raises(RateLimitError):
+        consumer.get("device/devices")
+    mock_request.assert_called_once()
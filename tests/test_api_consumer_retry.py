@@ -0,0 +1,204 @@
+import json
+import pytest
+from unittest.mock import patch, Mock
+from requests.exceptions import (
+    HTTPError as ReqHTTPError,
+    ConnectionError as ReqConnectionError,
+)
+from api_client_base.core.exceptions import HTTPError, ConnectionError, RequestError
+from api_client_base.core.retry import RetryPolicy
+from api_client_base.implementations.logicmonitor import LogicMonitorClient
+from .fixtures.common import mock_api_consumer_using_base_helpers
+
+"""
+These tests are for the RetryPolicy and the retry loop in the ApiConsumer Base Class.
+The responses are mocked using the unittest.mock module and time.sleep is patched so no time is spent waiting.
+"""
+
+
+def ok_response(body=None):
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.content = json.dumps(body or {"key": "value"}).encode("utf-8")
+    return response
+
+
+def error_response(status_code: int, headers: dict = None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.raise_for_status.side_effect = ReqHTTPError(f"{status_code} Error")
+    return response
+
+
+@pytest.fixture
+def retrying_consumer(mock_api_consumer_using_base_helpers):
+    return mock_api_consumer_using_base_helpers(
+        "https://example.com", retry_policy=RetryPolicy(max_attempts=3)
+    )
+
+
+@pytest.mark.parametrize(
+    "method, error, attempt, expected",
+    [
+        ("GET", HTTPError(503, "Unavailable"), 1, True),
+        ("GET", HTTPError(429, "Too Many Requests"), 2, True),
+        ("GET", HTTPError(503, "Unavailable"), 3, False),
+        ("GET", HTTPError(404, "Not Found"), 1, False),
+        ("GET", ConnectionError("refused"), 1, True),
+        ("GET", RequestError("bad"), 1, False),
+        ("POST", HTTPError(503, "Unavailable"), 1, False),
+        ("PATCH", ConnectionError("refused"), 1, False),
+        ("PUT", HTTPError(503, "Unavailable"), 1, True),
+    ],
+)
+def test_should_retry(method, error, attempt, expected):
+    # THEN - only allowed methods and errors should be retried within the attempt limit
+    assert RetryPolicy(max_attempts=3).should_retry(method, error, attempt) is expected
+
+
+def test_backoff_full_jitter():
+    # GIVEN - a policy
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+
+    # THEN - the delay should be drawn between 0 and the exponential backoff, capped at max_backoff
+    with patch("random.uniform", side_effect=lambda low, high: high) as mock_uniform:
+        assert [policy.get_backoff(attempt) for attempt in range(1, 6)] == [
+            1,
+            2,
+            4,
+            5,
+            5,
+        ]
+    assert all(call.args[0] == 0 for call in mock_uniform.call_args_list)
+
+
+def test_backoff_retry_after():
+    # GIVEN - a policy
+    policy = RetryPolicy()
+
+    # THEN - the Retry-After header should be used in seconds or as an HTTP date
+    assert policy.get_backoff(1, "7") == 7
+    with patch("time.time", return_value=1735689600):  # 2025-01-01 00:00:00 GMT
+        assert policy.get_backoff(1, "Wed, 01 Jan 2025 00:00:10 GMT") == 10
+
+    # THEN - an unparseable header should fall back to the backoff
+    with patch("random.uniform", return_value=0.25):
+        assert policy.get_backoff(1, "soon") == 0.25
+        assert RetryPolicy(respect_retry_after=False).get_backoff(1, "7") == 0.25
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_retry_until_success(mock_request, mock_sleep, retrying_consumer):
+    # GIVEN - a 503 and a 429 followed by a success
+    mock_request.side_effect = [
+        error_response(503),
+        error_response(429, {"Retry-After": "2"}),
+        ok_response(),
+    ]
+
+    # WHEN - a GET request is made
+    response = retrying_consumer.get("test/path")
+
+    # THEN - the request should succeed after waiting between attempts
+    assert response == {"key": "value"}
+    assert mock_request.call_count == 3
+    assert mock_sleep.call_count == 2
+    assert mock_sleep.call_args_list[1].args == (2.0,)
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_retry_after_beyond_max_backoff(mock_request, mock_sleep, retrying_consumer):
+    # GIVEN - a server asking to wait a day
+    mock_request.side_effect = [
+        error_response(429, {"Retry-After": "86400"}),
+        ok_response(),
+    ]
+
+    # THEN - the error should be raised at once rather than blocking the caller
+    with pytest.raises(HTTPError) as excinfo:
+        retrying_consumer.get("test/path")
+    assert excinfo.value.status_code == 429
+    assert mock_request.call_count == 1
+    mock_sleep.assert_not_called()
+
+    # THEN - a delay longer than max_backoff should never be returned
+    assert RetryPolicy(max_backoff=5).get_backoff(1, "86400") == 5
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_retry_gives_up(mock_request, mock_sleep, retrying_consumer):
+    # GIVEN - a server that keeps failing
+    mock_request.side_effect = [error_response(503) for _ in range(3)]
+
+    # THEN - the error should be raised after the last attempt
+    with pytest.raises(HTTPError) as excinfo:
+        retrying_consumer.get("test/path")
+    assert excinfo.value.status_code == 503
+    assert mock_request.call_count == 3
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_connection_error_retried(mock_request, mock_sleep, retrying_consumer):
+    # GIVEN - a connection error followed by a success
+    mock_request.side_effect = [ReqConnectionError("refused"), ok_response()]
+
+    # THEN - the request should be retried
+    assert retrying_consumer.get("test/path") == {"key": "value"}
+    assert mock_request.call_count == 2
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_post_not_retried(mock_request, mock_sleep, retrying_consumer):
+    # GIVEN - a failing POST
+    mock_request.side_effect = [error_response(503), ok_response()]
+
+    # THEN - the non idempotent request should not be sent again
+    with pytest.raises(HTTPError):
+        retrying_consumer.post("test/path", json={"key": "value"})
+    assert mock_request.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@patch("requests.Session.request")
+def test_no_retry_by_default(mock_request, mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer without a retry policy
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+    mock_request.side_effect = [error_response(503), ok_response()]
+
+    # THEN - the error should be raised straight away
+    with pytest.raises(HTTPError):
+        consumer.get("test/path")
+    assert mock_request.call_count == 1
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_logicmonitor_retry_is_resigned(mock_request, mock_sleep):
+    # GIVEN - a LogicMonitor client with a retry policy
+    client = LogicMonitorClient(
+        company="testcompany",
+        access_id="testid",
+        api_key="testkey",
+        retry_policy=RetryPolicy(),
+    )
+    mock_request.side_effect = [error_response(503), ok_response()]
+
+    # WHEN - a request is retried
+    with patch.object(
+        LogicMonitorClient, "_calculate_epoch", side_effect=["1000", "2000"]
+    ):
+        client.get("device/devices", params={"size": 10})
+
+    # THEN - each attempt should carry a signature for its own epoch
+    first, second = [call.kwargs["headers"] for call in mock_request.call_args_list]
+    assert first["Authorization"].endswith(":1000")
+    assert second["Authorization"].endswith(":2000")
+    signature = client._construct_signature("GET2000/device/devices")
+    assert second["Authorization"] == f"LMv1 testid:{signature}:2000"
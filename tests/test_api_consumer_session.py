@@ -0,0 +1,121 @@
+import pytest
+from unittest.mock import patch, Mock
+from pydantic import ValidationError
+from api_client_base.models.pool_config import PoolConfig
+from .fixtures.common import mock_api_consumer_using_base_helpers
+
+"""
+These tests are for the pooled session owned by the ApiConsumer Base Class.
+They test the adapter configuration, session reuse, idle eviction and the close / context manager lifecycle.
+"""
+
+
+def test_default_pool_config(mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer without a pool config
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+
+    # THEN - the default pool config should be used for both schemes
+    adapter = consumer.session.get_adapter("https://example.com")
+    assert consumer.pool_config == PoolConfig()
+    assert adapter._pool_connections == 10
+    assert adapter._pool_maxsize == 10
+    assert consumer.session.get_adapter("http://example.com") is adapter
+
+
+def test_custom_pool_config(mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer with a custom pool config
+    pool_config = PoolConfig(pool_connections=2, pool_maxsize=50, pool_block=True)
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com", pool_config=pool_config
+    )
+
+    # THEN - the adapter should be configured from the pool config
+    adapter = consumer.session.get_adapter("https://example.com")
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 50
+    assert adapter._pool_block is True
+
+
+@pytest.mark.parametrize("field", ["pool_connections", "pool_maxsize", "idle_timeout"])
+def test_invalid_pool_config(field):
+    # THEN - non positive values should be rejected
+    with pytest.raises(ValidationError):
+        PoolConfig(**{field: 0})
+
+
+@patch("requests.Session.request")
+def test_session_is_reused(mock_request, mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer and a mock response
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+    mock_response = Mock()
+    mock_response.content = b'{"key": "value"}'
+    mock_request.return_value = mock_response
+    session = consumer.session
+
+    # WHEN - multiple requests are made
+    consumer.get("test/path")
+    consumer.post("test/path", json={"key": "value"})
+
+    # THEN - the same session should have been used for every request
+    assert mock_request.call_count == 2
+    assert consumer.session is session
+
+
+@patch("requests.adapters.HTTPAdapter.close")
+def test_idle_connections_evicted(mock_close, mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer with an idle timeout
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com", pool_config=PoolConfig(idle_timeout=30)
+    )
+
+    # WHEN - the pool has been idle for less than the timeout
+    consumer._evict_idle_connections()
+
+    # THEN - the connections should be kept
+    mock_close.assert_not_called()
+
+    # WHEN - the pool has been idle for longer than the timeout
+    consumer._last_used -= 60
+    consumer._evict_idle_connections()
+
+    # THEN - the connections should be evicted
+    assert mock_close.called
+
+
+@patch("requests.adapters.HTTPAdapter.close")
+def test_idle_connections_never_evicted_by_default(
+    mock_close, mock_api_consumer_using_base_helpers
+):
+    # GIVEN - a consumer without an idle timeout that has been idle for a long time
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+    consumer._last_used -= 3600
+
+    # WHEN - idle eviction is checked
+    consumer._evict_idle_connections()
+
+    # THEN - the connections should be kept
+    mock_close.assert_not_called()
+
+
+@patch("requests.Session.close")
+def test_close(mock_close, mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+
+    # WHEN - the consumer is closed
+    consumer.close()
+
+    # THEN - the session should be closed
+    mock_close.assert_called_once()
+
+
+@patch("requests.Session.close")
+def test_context_manager(mock_close, mock_api_consumer_using_base_helpers):
+    # WHEN - the consumer is used as a context manager
+    with mock_api_consumer_using_base_helpers("https://example.com") as consumer:
+        # THEN - the consumer should be returned and still open
+        assert consumer.base_url == "https://example.com"
+        mock_close.assert_not_called()
+
+    # THEN - the session should be closed on exit
+    mock_close.assert_called_once()
@@ -0,0 +1,183 @@
+import asyncio
+import threading
+import time
+import httpx
+from unittest.mock import patch, Mock
+from api_client_base.core.single_flight import SingleFlight, AsyncSingleFlight
+from api_client_base.core.exceptions import HTTPError
+from api_client_base.implementations.logicmonitor import LogicMonitorClient
+from .fixtures.common import mock_api_consumer_using_base_helpers
+from .fixtures.async_consumer import MockAsyncApiConsumer, use_transport
+
+"""
+These tests are for the single-flight coalescing of identical concurrent GET requests.
+"""
+
+
+def run_threads(count: int, target) -> list:
+    """
+    run target in count threads released at the same moment, returning their results
+    """
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def run(i):
+        barrier.wait()
+        try:
+            results[i] = target()
+        except Exception as err:
+            results[i] = err
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def slow_response(*args, **kwargs):
+    time.sleep(0.1)
+    return Mock(status_code=200, headers={}, content=b'{"id": 1, "children": []}')
+
+
+def test_single_flight_shares_result():
+    # GIVEN - a single flight and a slow call
+    flight = SingleFlight()
+    func = Mock(side_effect=lambda: time.sleep(0.1) or "result")
+
+    # WHEN - the same key is called from many threads at once
+    results = run_threads(10, lambda: flight.do("key", func))
+
+    # THEN - the call should be made once and its result shared
+    func.assert_called_once()
+    assert sorted(shared for _, shared in results) == [False] + [True] * 9
+    assert {result for result, _ in results} == {"result"}
+    assert flight.stats() == {"calls": 10, "deduplicated": 9, "in_flight": 0}
+
+    # THEN - a later call should be made again
+    assert flight.do("key", lambda: "again") == ("again", False)
+
+
+def test_single_flight_shares_error():
+    # GIVEN - a failing slow call
+    flight = SingleFlight()
+
+    def fail():
+        time.sleep(0.1)
+        raise HTTPError(503, "Unavailable")
+
+    # WHEN - the same key is called from many threads at once
+    results = run_threads(5, lambda: flight.do("key", fail))
+
+    # THEN - every caller should see the error
+    assert all(isinstance(result, HTTPError) for result in results)
+    assert flight.stats()["in_flight"] == 0
+
+
+@patch("requests.Session.request", side_effect=slow_response)
+def test_consumer_coalesces_gets(mock_request, mock_api_consumer_using_base_helpers):
+    # GIVEN - a consumer coalescing identical GETs
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com", single_flight=SingleFlight()
+    )
+
+    # WHEN - the same resource is requested from many threads at once
+    results = run_threads(
+        8, lambda: consumer.get("device/groups", params={"a": 1, "b": 2})
+    )
+
+    # THEN - one request should be sent, and every caller get its own decoded body
+    assert mock_request.call_count == 1
+    assert all(result == {"id": 1, "children": []} for result in results)
+    assert len({id(result) for result in results}) == 8
+    assert consumer.single_flight.deduplicated == 7
+
+
+@patch("requests.Session.request", side_effect=slow_response)
+def test_consumer_does_not_coalesce_different_requests(
+    mock_request, mock_api_consumer_using_base_helpers
+):
+    # GIVEN - a consumer coalescing identical GETs
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com", single_flight=SingleFlight()
+    )
+    calls = iter(
+        [
+            lambda: consumer.get("device/groups", params={"a": 1}),
+            lambda: consumer.get("device/groups", params={"a": 2}),
+            lambda: consumer.get("device/groups", headers={"X-Version": "2"}),
+            lambda: consumer.post("device/groups", json={}),
+        ]
+    )
+    lock = threading.Lock()
+
+    def next_call():
+        with lock:
+            call = next(calls)
+        return call()
+
+    # WHEN - different requests are made at once
+    run_threads(4, next_call)
+
+    # THEN - every request should be sent
+    assert mock_request.call_count == 4
+
+
+@patch("requests.Session.request", side_effect=slow_response)
+def test_logicmonitor_ignores_signature(mock_request):
+    # GIVEN - a LogicMonitor client, whose requests are each signed with their own epoch
+    client = LogicMonitorClient(
+        company="testcompany",
+        access_id="testid",
+        api_key="testkey",
+        single_flight=SingleFlight(),
+    )
+    epochs = iter(str(1700000000000 + i) for i in range(100))
+
+    # WHEN - the same resource is requested from many threads at once
+    with patch.object(LogicMonitorClient, "_calculate_epoch", lambda _: next(epochs)):
+        run_threads(6, lambda: client.get("device/groups/1"))
+
+    # THEN - one request should be sent
+    assert mock_request.call_count == 1
+
+
+def test_async_consumer_coalesces_gets():
+    # GIVEN - an async consumer coalescing identical GETs
+    sent = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.path)
+        await asyncio.sleep(0.05)
+        if request.url.path.endswith("missing"):
+            return httpx.Response(404, json={})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    consumer = use_transport(
+        MockAsyncApiConsumer("https://example.com", single_flight=AsyncSingleFlight()),
+        handler,
+    )
+
+    async def run():
+        results = await asyncio.gather(
+            *(consumer.get("device/groups") for _ in range(20)),
+            consumer.get("device/devices"),
+        )
+        errors = await asyncio.gather(
+            *(consumer.get("missing") for _ in range(3)), return_exceptions=True
+        )
+        return results, errors
+
+    # WHEN - the same resource is requested many times at once
+    results, errors = asyncio.run(run())
+
+    # THEN - one request per resource should be sent, sharing responses and errors
+    assert sorted(sent) == ["/device/devices", "/device/groups", "/missing"]
+    assert results[:20] == [{"path": "/device/groups"}] * 20
+    assert all(isinstance(err, HTTPError) for err in errors)
+    assert consumer.single_flight.stats() == {
+        "calls": 24,
+        "deduplicated": 21,
+        "in_flight": 0,
+    }
@@ -0,0 +1,153 @@
+import pytest
+from unittest.mock import patch, Mock
+from requests.exceptions import HTTPError as ReqHTTPError
+from api_client_base.core.hooks import RequestEvent
+from api_client_base.core.request_stats import LatencyHistogram, RequestStats
+from api_client_base.core.exceptions import HTTPError, ConnectionError
+from api_client_base.core.retry import RetryPolicy
+from .fixtures.common import mock_api_consumer_using_base_helpers
+
+"""
+These tests are for the RequestStats statistics and their Prometheus rendering.
+"""
+
+
+def make_event(
+    method="GET", path="device/devices", total=0.1, error=None, status=200, **kwargs
+):
+    event = RequestEvent(method, path, timings={"total": total})
+    event.error = error
+    event.status = status if error is None else getattr(error, "status_code", None)
+    for name, value in kwargs.items():
+        setattr(event, name, value)
+    return event
+
+
+def test_histogram_quantiles():
+    # GIVEN - latencies spread evenly from 1ms to 1s
+    histogram = LatencyHistogram()
+    for i in range(1, 1001):
+        histogram.observe(i / 1000)
+
+    # THEN - the quantiles should be estimated within their bucket
+    assert histogram.count == 1000
+    assert 0.25 <= histogram.quantile(0.5) <= 0.5
+    assert 0.5 <= histogram.quantile(0.95) <= 1.0
+    assert 0.5 <= histogram.quantile(0.99) <= 1.0
+    assert LatencyHistogram().quantile(0.5) == 0.0
+
+    # THEN - latencies above the last bound should report the last bound
+    histogram.observe(120)
+    assert histogram.quantile(1.0) == 60.0
+
+
+def test_record_events():
+    # GIVEN - statistics
+    stats = RequestStats()
+
+    # WHEN - successes, a retried attempt and failures are recorded
+    stats.record(make_event(total=0.02, response_bytes=100))
+    stats.record(make_event(path="device/devices/1", total=0.2, response_bytes=50))
+    stats.record(make_event(error=HTTPError(503, "Unavailable"), retrying=True))
+    stats.record(make_event(error=HTTPError(503, "Unavailable")))
+    stats.record(make_event(error=ConnectionError("refused"), request_bytes=10))
+
+    # THEN - the snapshot should be per endpoint
+    snapshot = stats.snapshot()
+    assert set(snapshot) == {"GET device/devices", "GET device/devices/{id}"}
+    devices = snapshot["GET device/devices"]
+    assert devices["requests"] == 3
+    assert devices["retries"] == 1
+    assert devices["errors"] == {"503": 1, "ConnectionError": 1}
+    assert devices["request_bytes"] == 10
+    assert devices["response_bytes"] == 100
+    assert devices["latency"]["count"] == 3
+    assert set(devices["latency"]) == {"count", "sum", "p50", "p95", "p99"}
+    assert snapshot["GET device/devices/{id}"]["requests"] == 1
+
+
+def test_rolling_window():
+    # GIVEN - statistics with a 60 second window in 6 slots
+    stats = RequestStats(window=60, slots=6)
+
+    # WHEN - a slow request is followed by fast ones after the window has passed
+    with patch("time.monotonic", return_value=1000.0):
+        stats.record(make_event(total=5.0))
+    with patch("time.monotonic", return_value=1050.0):
+        stats.record(make_event(total=0.01))
+        assert stats.snapshot()["GET device/devices"]["latency"]["count"] == 2
+    with patch("time.monotonic", return_value=1070.0):
+        stats.record(make_event(total=0.01))
+        snapshot = stats.snapshot()["GET device/devices"]
+
+    # THEN - the quantiles should only cover the window, the counters everything
+    assert snapshot["latency"]["count"] == 2
+    assert snapshot["latency"]["p99"] <= 0.01
+    assert snapshot["requests"] == 3
+
+
+def test_render_prometheus(tmp_path):
+    # GIVEN - statistics of a couple of requests
+    stats = RequestStats(namespace="lm")
+    stats.record(make_event(total=0.02, response_bytes=100))
+    stats.record(make_event(total=2.0, response_bytes=100))
+    stats.record(make_event(path='a"b', error=HTTPError(404, "Not Found")))
+
+    # WHEN - they are rendered
+    text = stats.render_prometheus()
+
+    # THEN - every metric family should be present with escaped labels
+    labels = 'method="GET",endpoint="device/devices"'
+    assert "# TYPE lm_requests_total counter" in text
+    assert f"lm_requests_total{{{labels}}} 2" in text
+    assert f"lm_response_bytes_total{{{labels}}} 200" in text
+    assert f'lm_request_duration_seconds_bucket{{{labels},le="0.025"}} 1' in text
+    assert f'lm_request_duration_seconds_bucket{{{labels},le="2.5"}} 2' in text
+    assert f'lm_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"lm_request_duration_seconds_count{{{labels}}} 2" in text
+    assert f'lm_request_duration_quantile_seconds{{{labels},quantile="0.99"}}' in text
+    assert 'lm_errors_total{method="GET",endpoint="a\\"b",status="404"} 1' in text
+    assert text.endswith("\n")
+
+    # WHEN - they are written to a file
+    path = tmp_path / "api.prom"
+    stats.write_prometheus(str(path))
+
+    # THEN - the file should hold the same metrics
+    assert path.read_text() == stats.render_prometheus()
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_consumer_stats(mock_request, mock_sleep, mock_api_consumer_using_base_helpers):
+    # GIVEN - a retrying consumer keeping statistics
+    consumer = mock_api_consumer_using_base_helpers(
+        "https://example.com",
+        retry_policy=RetryPolicy(backoff_factor=0),
+        stats=RequestStats(),
+    )
+    error = Mock(status_code=503, headers={})
+    error.raise_for_status.side_effect = ReqHTTPError("503 Error")
+    mock_request.side_effect = [
+        error,
+        Mock(status_code=200, headers={}, content=b"{}"),
+        Mock(status_code=200, headers={}, content=b"[]"),
+    ]
+
+    # WHEN - requests are made
+    consumer.get("alert/alerts")
+    consumer.get("device/devices/5")
+
+    # THEN - the statistics should be available from the consumer
+    stats = consumer.stats()
+    assert stats["GET alert/alerts"]["requests"] == 1
+    assert stats["GET alert/alerts"]["retries"] == 1
+    assert stats["GET alert/alerts"]["response_bytes"] == 2
+    assert stats["GET device/devices/{id}"]["requests"] == 1
+
+
+def test_consumer_without_stats(mock_api_consumer_using_base_helpers):
+    # THEN - no statistics should be kept by default
+    consumer = mock_api_consumer_using_base_helpers("https://example.com")
+    assert consumer.stats() == {}
+    assert not consumer.hooks
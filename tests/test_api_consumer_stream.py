@@ -0,0 +1,217 @@
+import json
+import pytest
+from unittest.mock import patch, Mock
+from api_client_base.core.stream_decoder import StreamingItemsDecoder, StreamedPage
+from api_client_base.core.exceptions import ConnectionError, HTTPError
+from api_client_base.core.retry import RetryPolicy
+from api_client_base.core.checkpoint import Checkpoint
+from api_client_base.implementations.logicmonitor import LogicMonitorClient
+import requests
+
+"""
+These tests are for the streaming decode of paged responses.
+The items of a page should be yielded while the body is read, with the other members of the page kept as fields.
+"""
+
+page = {
+    "total": 3,
+    "searchId": None,
+    "items": [
+        {"id": 1, "name": "café", "tags": ["a", "b"]},
+        {"id": 2, "value": 12345, "nested": {"items": [1, 2]}},
+        3.5,
+    ],
+    "filtered": True,
+}
+body = json.dumps(page, indent=1).encode("utf-8")
+
+
+def chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, len(body)])
+def test_decoder_chunk_boundaries(size):
+    # GIVEN - a page body split into chunks, splitting values and multi-byte characters
+    decoder = StreamingItemsDecoder("items")
+
+    # WHEN - the chunks are fed one by one
+    items = []
+    for chunk in chunked(body, size):
+        items.extend(decoder.feed(chunk))
+    items.extend(decoder.close())
+
+    # THEN - the items and the other members should be decoded
+    assert items == page["items"]
+    assert decoder.fields == {"total": 3, "searchId": None, "filtered": True}
+    assert decoder.done
+
+
+def test_decoder_yields_items_before_the_end():
+    # GIVEN - the first part of a page only
+    decoder = StreamingItemsDecoder("items")
+    head = b'{"total": 1000, "items": [{"id": 0}, {"id": 1}, {"id": 2'
+
+    # THEN - the complete items and scalars seen so far should be available
+    assert decoder.feed(head) == [{"id": 0}, {"id": 1}]
+    assert decoder.fields == {"total": 1000}
+    assert not decoder.done
+
+
+def test_decoder_top_level_array():
+    # GIVEN - a response which is a plain array
+    decoder = StreamingItemsDecoder(None)
+
+    # THEN - its elements should be the items
+    items = decoder.feed(b'[1, {"a": 2}, ') + decoder.feed(b'"x"]') + decoder.close()
+    assert items == [1, {"a": 2}, "x"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b'{"total": 1, "items": [{"id": 1}',
+        b'{"total": 1, "items": [{"id": 1}]} extra',
+        b'{"total" 1}',
+        b'"items"',
+    ],
+)
+def test_decoder_invalid(data):
+    # GIVEN - a truncated or invalid body
+    decoder = StreamingItemsDecoder("items")
+
+    # THEN - an error should be raised by the time the body ends
+    with pytest.raises(json.JSONDecodeError):
+        decoder.feed(data)
+        decoder.close()
+
+
+def test_streamed_page_closes_response():
+    # GIVEN - a streamed page
+    close = Mock()
+    streamed = StreamedPage(chunked(body, 16), items_key="items", close=close)
+
+    # WHEN - only the first item is read and the page is closed
+    iterator = iter(streamed)
+    assert next(iterator) == page["items"][0]
+    iterator.close()
+
+    # THEN - the response should be released once
+    close.assert_called_once()
+    streamed.close()
+    close.assert_called_once()
+
+
+def make_streamed_response(payload: dict, size: int = 100):
+    response = Mock(status_code=200, headers={}, url="https://example.com")
+    response.iter_content.return_value = iter(
+        chunked(json.dumps(payload).encode("utf-8"), size)
+    )
+    return response
+
+
+@pytest.fixture
+def client():
+    return LogicMonitorClient(
+        company="testcompany", access_id="testid", api_key="testkey", throttle=None
+    )
+
+
+@patch("requests.Session.request")
+def test_logicmonitor_stream_pages(mock_request, client):
+    # GIVEN - two pages of devices
+    client.size_value = 2
+    mock_request.side_effect = [
+        make_streamed_response({"total": 3, "items": [{"id": 0}, {"id": 1}]}),
+        make_streamed_response({"total": 3, "items": [{"id": 2}]}),
+    ]
+
+    # WHEN - the items are streamed
+    items = list(client.get("device/devices", stream=True))
+
+    # THEN - every item should be yielded and the body read as a stream
+    assert items == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert mock_request.call_count == 2
+    for call in mock_request.call_args_list:
+        assert call.kwargs["stream"] is True
+        assert call.kwargs["headers"]["Authorization"].startswith("LMv1 testid:")
+    assert mock_request.call_args.args[1].endswith("device/devices?size=2&offset=2")
+
+
+@patch("requests.Session.request")
+def test_stream_connection_error(mock_request, client):
+    # GIVEN - a connection that drops while the body is read
+    response = make_streamed_response({"total": 1, "items": []})
+    response.iter_content.side_effect = requests.exceptions.ChunkedEncodingError()
+    mock_request.return_value = response
+
+    # THEN - a ConnectionError should be raised and the response released
+    with pytest.raises(ConnectionError):
+        list(client.get("device/devices", stream=True))
+    response.close.assert_called_once()
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_stream_closes_error_responses(mock_request, mock_sleep, client):
+    # GIVEN - a streamed request answered 503 once, then 404
+    client.retry_policy = RetryPolicy(max_attempts=2)
+    responses = [Mock(status_code=status, headers={}) for status in (503, 404)]
+    for response in responses:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            f"{response.status_code} Error"
+        )
+    mock_request.side_effect = responses
+
+    # THEN - the retried and the raised response should both be released
+    with pytest.raises(HTTPError):
+        list(client.get("device/devices", stream=True))
+    for response in responses:
+        response.close.assert_called_once()
+
+
+@patch("requests.Session.request")
+def test_stream_checkpoint_resume(mock_request, client, tmp_path):
+    # GIVEN - three pages of devices and a checkpoint file
+    client.size_value = 2
+    pages = {
+        0: {"total": 5, "items": [{"id": 0}, {"id": 1}]},
+        2: {"total": 5, "items": [{"id": 2}, {"id": 3}]},
+        4: {"total": 5, "items": [{"id": 4}]},
+    }
+    mock_request.side_effect = lambda method, url, **kwargs: make_streamed_response(
+        pages[int(url.split("offset=")[1]) if "offset=" in url else 0]
+    )
+    checkpoint_file = str(tmp_path / "export.json")
+
+    # WHEN - the export stops after the first item of the second page
+    items = client.get(
+        "device/devices", stream=True, checkpoint=Checkpoint(checkpoint_file)
+    )
+    delivered = [next(items) for _ in range(3)]
+    items.close()
+
+    # THEN - only the first page should be recorded
+    with open(checkpoint_file, encoding="utf-8") as f:
+        state = json.load(f)
+    assert delivered == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert (state["pages"], state["items"], state["next_params"]) == (
+        1,
+        2,
+        {"size": 2, "offset": 2},
+    )
+
+    # WHEN - the export is resumed
+    resumed = list(
+        client.get(
+            "device/devices",
+            stream=True,
+            checkpoint=Checkpoint(checkpoint_file),
+            resume=True,
+        )
+    )
+
+    # THEN - it should continue from the second page to the end
+    assert resumed == [{"id": 2}, {"id": 3}, {"id": 4}]
+    with open(checkpoint_file, encoding="utf-8") as f:
+        assert json.load(f)["complete"] is True
@@ -0,0 +1,212 @@
+import threading
+import requests
+import pytest
+from unittest.mock import patch, Mock
+from api_client_base.core.adaptive_throttle import AdaptiveThrottle
+from api_client_base.core.exceptions import (
+    HTTPError,
+    ConnectionError,
+    RateLimitError,
+)
+from api_client_base.core.rate_limiter import RateLimiter, TokenBucket
+from api_client_base.implementations.logicmonitor import LogicMonitorClient
+from benchmarks.logicmonitor_standin import LogicMonitorStandIn
+
+"""
+These tests are for the AdaptiveThrottle and its use by the LogicMonitorClient.
+time.monotonic and time.sleep are patched so no time is spent waiting.
+"""
+
+
+def rate_headers(limit, remaining, window):
+    return {
+        "X-Rate-Limit-Limit": str(limit),
+        "X-Rate-Limit-Remaining": str(remaining),
+        "X-Rate-Limit-Window": str(window),
+    }
+
+
+@pytest.fixture
+def now():
+    with patch("time.monotonic", return_value=1000.0) as mock_monotonic:
+        yield mock_monotonic
+
+
+def test_family():
+    # THEN - the method and first path segments should identify the endpoint family
+    throttle = AdaptiveThrottle()
+    assert throttle.get_family("get", "/device/devices/12/properties?size=1") == (
+        "GET device/devices"
+    )
+    assert throttle.get_family("PATCH", "alert/alerts") == "PATCH alert/alerts"
+
+
+def test_full_speed_with_budget_left(now):
+    # GIVEN - a family with more than half its budget left
+    throttle = AdaptiveThrottle()
+    throttle.observe("GET", "device/devices", rate_headers(100, 60, 60))
+
+    # THEN - requests should not be delayed
+    assert throttle.get_delay("GET", "device/devices/1") == 0
+    assert throttle.get_delay("GET", "alert/alerts") == 0
+
+
+def test_slows_down_as_budget_runs_out(now):
+    # GIVEN - a family with little budget left
+    throttle = AdaptiveThrottle()
+    throttle.observe("GET", "device/devices", rate_headers(100, 10, 60))
+
+    # THEN - the remaining requests should be spread over the rest of the window
+    assert throttle.get_delay("GET", "device/devices") == pytest.approx(6)
+    now.return_value = 1030.0
+    assert throttle.get_delay("GET", "device/devices") == pytest.approx(3)
+
+    # THEN - the delay should be capped by max_delay
+    throttle.max_delay = 1
+    assert throttle.get_delay("GET", "device/devices") == 1
+
+
+def test_exhausted_budget_waits_for_window(now):
+    # GIVEN - a family with no budget left
+    throttle = AdaptiveThrottle()
+    throttle.observe("GET", "device/devices", rate_headers(100, 0, 60))
+
+    # THEN - the request should wait for the rest of the window
+    assert throttle.get_delay("GET", "device/devices") == pytest.approx(60)
+
+    # THEN - the delay should be dropped once the window is over
+    now.return_value = 1060.0
+    assert throttle.get_delay("GET", "device/devices") == 0
+
+
+def test_reserve_spaces_out_waiting_callers(now):
+    # GIVEN - a family with little budget left
+    throttle = AdaptiveThrottle()
+    throttle.observe("GET", "device/devices", rate_headers(100, 10, 60))
+
+    # WHEN - three callers reserve a request at the same time
+    delays = [throttle.reserve("GET", "device/devices") for _ in range(3)]
+
+    # THEN - each should be scheduled an interval after the previous one, counting the requests in flight
+    assert delays == pytest.approx([6, 6 + 60 / 9, 6 + 60 / 9 + 60 / 8])
+
+    # THEN - an answered request should no longer count against the budget
+    throttle.observe("GET", "device/devices", rate_headers(100, 9, 60))
+    assert throttle.get_delay("GET", "device/devices") == pytest.approx(60 / 7)
+
+
+def test_missing_or_invalid_headers_ignored(now):
+    # GIVEN - responses without usable headers
+    throttle = AdaptiveThrottle()
+    throttle.observe("GET", "device/devices", {})
+    throttle.observe("GET", "device/devices", rate_headers("x", 1, 60))
+
+    # THEN - nothing should be tracked
+    assert throttle.budget() == {}
+
+
+def test_budget_snapshot(now):
+    # GIVEN - a tracked family
+    throttle = AdaptiveThrottle()
+    throttle.observe("GET", "device/devices", rate_headers(100, 40, 60))
+    now.return_value = 1005.0
+
+    # THEN - the budget should be exposed with its age
+    assert throttle.budget() == {
+        "GET device/devices": {
+            "limit": 100,
+            "remaining": 40,
+            "window": 60.0,
+            "age": 5.0,
+        }
+    }
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_logicmonitor_tracks_rate_limit_headers(mock_request, mock_sleep, now):
+    # GIVEN - a LogicMonitor client and responses with a nearly exhausted budget
+    client = LogicMonitorClient(
+        company="testcompany", access_id="testid", api_key="testkey"
+    )
+    response = Mock()
+    response.headers = rate_headers(100, 5, 60)
+    response.content = b'{"items": []}'
+    mock_request.return_value = response
+
+    # WHEN - two requests are made to the same family
+    client.get("device/devices")
+    client.get("device/devices/1")
+
+    # THEN - the budget should be exposed and the second request paced
+    assert client.rate_limit_budget()["GET device/devices"]["remaining"] == 5
+    mock_sleep.assert_called_once_with(pytest.approx(12))
+
+
+def test_logicmonitor_throttle_can_be_disabled():
+    # GIVEN - a LogicMonitor client created without a throttle
+    client = LogicMonitorClient(
+        company="testcompany", access_id="testid", api_key="testkey", throttle=None
+    )
+
+    # THEN - no budget should be tracked
+    assert client.throttle is None
+    assert client.rate_limit_budget() == {}
+
+
+def test_logicmonitor_threads_share_budget():
+    # GIVEN - a stand-in allowing 20 requests per second and a client shared by 8 threads
+    with LogicMonitorStandIn(total=10, rate_limit=20, rate_window=1) as server:
+        client = LogicMonitorClient(
+            company="bench", access_id=server.access_id, api_key=server.api_key
+        )
+        client.base_url = server.base_url
+        errors = []
+
+        def run(thread: int):
+            for i in range(4):
+                try:
+                    client.get(f"device/devices/{thread * 4 + i}")
+                except HTTPError as err:
+                    errors.append(err)
+
+        # WHEN - the threads make more requests than a window allows
+        threads = [threading.Thread(target=run, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.close()
+
+    # THEN - the requests should be spaced out over the windows without a single 429
+    assert [err.status_code for err in errors] == []
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_failed_sends_release_reservations(mock_request, mock_sleep, now):
+    # GIVEN - a client which saw most of the budget left
+    client = LogicMonitorClient(
+        company="testcompany", access_id="testid", api_key="testkey"
+    )
+    response = Mock()
+    response.headers = rate_headers(100, 60, 60)
+    response.content = b"{}"
+    mock_request.return_value = response
+    client.get("device/devices")
+
+    # WHEN - requests fail without a response, or are refused a token after being reserved
+    mock_request.side_effect = requests.exceptions.ConnectionError("refused")
+    for i in range(20):
+        with pytest.raises(ConnectionError):
+            client.get(f"device/devices/{i}")
+    client.rate_limiter = RateLimiter(
+        default=TokenBucket(rate=0.001, capacity=1), blocking=False
+    )
+    client.rate_limiter.acquire("GET", "device/devices")
+    with pytest.raises(RateLimitError):
+        client.get("device/devices")
+
+    # THEN - none of them should stay in flight, so later requests are not slowed down
+    assert client.throttle.in_flight("GET", "device/devices") == 0
+    assert client.throttle.get_delay("GET", "device/devices") == 0
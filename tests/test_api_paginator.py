@@ -1,6 +1,22 @@
-from .fixtures.pagination import mock_api_consumer, mock_api_consumer_all
+import gzip
+import json
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from .fixtures.pagination import (
+    mock_api_consumer,
+    mock_api_consumer_all,
+    mock_api_consumer_keyset,
+)
+from api_client_base.core.exceptions import HTTPError
 from api_client_base.core.api_consumer import ApiConsumer
 from api_client_base.core.paginator_offset import OffsetPaginator
+from api_client_base.core.paginator_keyset import KeysetPaginator
+from api_client_base.core.prefetch import Prefetcher, batched
+from api_client_base.core.page_size_tuner import PageSizeTuner
+from api_client_base.core.checkpoint import Checkpoint
+from api_client_base.core.jsonl_sink import JsonlSink, iter_jsonl
 
 """
 These tests are for the OffsetPaginator class. which is an implementation of the ApiPaginator class.
@@ -63,3 +79,682 @@ def test_offset_paginator_all(mock_api_consumer_all):
 
     # THEN - the nth item should have an id of n
     assert all_results[500]["id"] == 500
+
+
+def test_offset_paginator_all_concurrent(mock_api_consumer_all):
+    # Given - a mock API consumer
+    consumer = mock_api_consumer_all("https://test.com")
+
+    # GIVEN - a paginator with a size of 100
+    paginator = OffsetPaginator(
+        size_value=100, offset_param="offset", total_key="total", items_key="items"
+    )
+
+    # WHEN - fetching all pages with several workers
+    all_results = paginator.all(consumer, "GET", "/test", max_workers=4)
+
+    # THEN - every item should be returned in offset order
+    assert [item["id"] for item in all_results] == list(range(1000))
+
+
+def test_offset_paginator_remaining_params():
+    # GIVEN - a paginator with a size of 100
+    paginator = OffsetPaginator(size_value=100)
+
+    # WHEN - the remaining pages are built from the first response
+    remaining = paginator.get_remaining_params(
+        {"total": 350}, {"size": 100, "filter": "name:test"}
+    )
+
+    # THEN - every later offset should be known, keeping the other params
+    assert remaining == [
+        {"size": 100, "filter": "name:test", "offset": 100},
+        {"size": 100, "filter": "name:test", "offset": 200},
+        {"size": 100, "filter": "name:test", "offset": 300},
+    ]
+
+
+def test_offset_paginator_all_concurrent_stops_on_failure(mock_api_consumer_all):
+    # GIVEN - a mock API consumer where one page fails
+    class FailingConsumer(mock_api_consumer_all):
+        requested = []
+
+        def _make_request(self, method: str, path: str, **kwargs):
+            offset = kwargs["params"].get("offset", 0)
+            self.requested.append(offset)
+            time.sleep(0.01)
+            if offset == 300:
+                raise HTTPError(500, "Server Error")
+            return super()._make_request(method, path, **kwargs)
+
+    consumer = FailingConsumer("https://test.com")
+    paginator = OffsetPaginator(size_value=100, items_key="items")
+
+    # WHEN - fetching all pages with several workers
+    # THEN - the page error should be raised
+    with pytest.raises(HTTPError):
+        paginator.all(consumer, "GET", "/test", max_workers=2)
+
+    # THEN - the pages not yet started should have been cancelled
+    assert len(consumer.requested) < 10
+
+
+def test_offset_paginator_all_concurrent_fails_fast(mock_api_consumer_all):
+    # GIVEN - a mock API consumer where an early page is slow and a later one fails
+    class FailingConsumer(mock_api_consumer_all):
+        requested = []
+
+        def _make_request(self, method: str, path: str, **kwargs):
+            offset = kwargs["params"].get("offset", 0)
+            self.requested.append(offset)
+            time.sleep(0.5 if offset == 100 else 0.05)
+            if offset == 300:
+                raise HTTPError(500, "Server Error")
+            return super()._make_request(method, path, **kwargs)
+
+    consumer = FailingConsumer("https://test.com")
+    paginator = OffsetPaginator(size_value=100, items_key="items")
+
+    # WHEN - fetching all pages with several workers
+    started = time.perf_counter()
+    with pytest.raises(HTTPError):
+        paginator.all(consumer, "GET", "/test", max_workers=4)
+
+    # THEN - the error should be raised without waiting for the slow page, and the queued pages not sent
+    assert time.perf_counter() - started < 0.4
+    time.sleep(0.6)
+    assert len(consumer.requested) < 10
+
+
+def test_offset_paginator_iter_items(mock_api_consumer):
+    # Given - a mock API consumer that counts the pages requested
+    class CountingConsumer(mock_api_consumer):
+        pages = 0
+
+        def _make_request(self, method: str, path: str, **kwargs):
+            self.pages += 1
+            return super()._make_request(method, path, **kwargs)
+
+    consumer = CountingConsumer("https://test.com")
+
+    # GIVEN - a paginator with a size of 100
+    paginator = OffsetPaginator(size_value=100, items_key="items")
+
+    # WHEN - iterating through the items
+    items = paginator.iter_items(consumer, "GET", "/test")
+
+    # THEN - nothing should be requested until the first item is consumed
+    assert consumer.pages == 0
+
+    # THEN - only the first page should be requested for its items
+    first_page = [next(items) for _ in range(100)]
+    assert [item["id"] for item in first_page] == list(range(100))
+    assert consumer.pages == 1
+
+    # THEN - the remaining items should follow in order
+    assert [item["id"] for item in items] == list(range(100, 1000))
+    assert consumer.pages == 10
+
+
+def test_keyset_paginator_all(mock_api_consumer_keyset):
+    # GIVEN - a mock API consumer and a keyset paginator with a size of 100
+    consumer = mock_api_consumer_keyset("https://test.com")
+    paginator = KeysetPaginator(size_value=100, items_key="items")
+
+    # WHEN - fetching all pages, with a filter of the caller
+    all_results = paginator.all(
+        consumer, "GET", "/test", params={"filter": "name~Item"}
+    )
+
+    # THEN - every item should be returned in key order
+    assert [item["id"] for item in all_results] == list(range(1000))
+
+    # THEN - pages should be sorted by id and filtered after the last id seen, keeping the caller's filter
+    assert consumer.requested[0] == {"filter": "name~Item", "size": 100, "sort": "id"}
+    assert consumer.requested[1] == {
+        "filter": "name~Item,id>99",
+        "size": 100,
+        "sort": "id",
+    }
+    assert all("offset" not in params for params in consumer.requested)
+    # THEN - the last full page is followed by one empty page
+    assert len(consumer.requested) == 11
+
+
+def test_keyset_paginator_items_removed_during_scan(mock_api_consumer_keyset):
+    # GIVEN - a collection whose first items are deleted while it is being scanned
+    consumer = mock_api_consumer_keyset("https://test.com")
+    offset_paginator = OffsetPaginator(size_value=100, items_key="items")
+    keyset_paginator = KeysetPaginator(size_value=100, items_key="items")
+
+    def scan(paginator):
+        consumer.ids = list(range(1000))
+        seen = []
+        for page in paginator.paginate(consumer, "GET", "/test"):
+            seen.extend(item["id"] for item in page["items"])
+            # delete 10 already delivered items after every page
+            del consumer.ids[:10]
+        return seen
+
+    # WHEN - the collection is scanned by offset and by keyset
+    # THEN - the offset scan should skip items, the keyset scan should deliver every item once
+    assert len(scan(offset_paginator)) < 1000
+    assert scan(keyset_paginator) == list(range(1000))
+
+
+def test_keyset_paginator_iter_items(mock_api_consumer_keyset):
+    # GIVEN - a collection of 250 items that is not a multiple of the page size
+    consumer = mock_api_consumer_keyset("https://test.com", ids=list(range(0, 500, 2)))
+    paginator = KeysetPaginator(size_value=100, items_key="items")
+
+    # WHEN - iterating through the items
+    items = list(paginator.iter_items(consumer, "GET", "/test"))
+
+    # THEN - the short last page should end the scan
+    assert [item["id"] for item in items] == list(range(0, 500, 2))
+    assert [params.get("filter") for params in consumer.requested] == [
+        None,
+        "id>198",
+        "id>398",
+    ]
+
+
+def test_paginate_prefetch_overlaps_processing(mock_api_consumer_all):
+    # GIVEN - a consumer taking 20ms per page and a paginator fetching 2 pages ahead
+    class SlowConsumer(mock_api_consumer_all):
+        def _make_request(self, method: str, path: str, **kwargs):
+            time.sleep(0.02)
+            return super()._make_request(method, path, **kwargs)
+
+    consumer = SlowConsumer("https://test.com")
+    paginator = OffsetPaginator(size_value=100, items_key="items")
+
+    def export(prefetch: int) -> float:
+        start = time.perf_counter()
+        for _ in paginator.paginate(consumer, "GET", "/test", prefetch=prefetch):
+            # processing a page takes as long as fetching it
+            time.sleep(0.02)
+        return time.perf_counter() - start
+
+    # WHEN - the pages are processed with and without read-ahead
+    # THEN - fetching and processing should overlap, close to halving the time
+    assert export(prefetch=2) < export(prefetch=0) * 0.75
+
+
+def test_paginate_prefetch_backpressure(mock_api_consumer):
+    # GIVEN - a consumer recording the pages requested
+    class CountingConsumer(mock_api_consumer):
+        pages = 0
+
+        def _make_request(self, method: str, path: str, **kwargs):
+            self.pages += 1
+            return super()._make_request(method, path, **kwargs)
+
+    consumer = CountingConsumer("https://test.com")
+    paginator = OffsetPaginator(size_value=100, items_key="items")
+
+    threads = threading.active_count()
+
+    # WHEN - the caller takes a page, then stops reading for a while
+    pages = paginator.paginate(consumer, "GET", "/test", prefetch=2)
+    next(pages)
+    time.sleep(0.1)
+
+    # THEN - no more than the queue and the page being put should have been read ahead
+    assert consumer.pages <= 4
+
+    # WHEN - the caller stops iterating early
+    pages.close()
+    requested = consumer.pages
+    time.sleep(0.1)
+
+    # THEN - the worker should have stopped without requesting more pages
+    assert consumer.pages == requested
+    assert threading.active_count() == threads
+
+
+def test_iter_items_prefetch_passes_errors(mock_api_consumer):
+    # GIVEN - a consumer whose fourth page fails
+    class FailingConsumer(mock_api_consumer):
+        def _make_request(self, method: str, path: str, **kwargs):
+            if "offset=300" in path:
+                raise HTTPError(500, "Server Error")
+            return super()._make_request(method, path, **kwargs)
+
+    consumer = FailingConsumer("https://test.com")
+    paginator = OffsetPaginator(size_value=100, items_key="items")
+    items = []
+
+    # WHEN - the items are iterated with read-ahead
+    # THEN - the items before the failed page should be delivered, then the error raised
+    with pytest.raises(HTTPError):
+        for item in paginator.iter_items(consumer, "GET", "/test", prefetch=3):
+            items.append(item["id"])
+    assert items == list(range(300))
+
+
+def test_prefetcher_batched():
+    # GIVEN - an iterator read ahead in batches
+    batches = Prefetcher(batched(iter(range(10)), 4), depth=1)
+
+    # THEN - the batches should be delivered in order, the last one shorter
+    assert list(batches) == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    with pytest.raises(ValueError):
+        Prefetcher(iter(()), depth=0)
+
+
+def test_page_size_tuner():
+    # GIVEN - a tuner aiming for pages of 1s, between 10 and 1000 items
+    tuner = PageSizeTuner(seed=100, min_size=10, max_size=1000, target_latency=1.0)
+    key = tuner.get_key("GET", "device/devices/12/instances")
+    assert key == "GET device/devices/{id}/instances"
+    assert tuner.get_size(key) == 100
+
+    # THEN - fast pages should grow the size, within the API's maximum
+    assert tuner.observe(key, 100, 100, 0.1) == 200
+    assert tuner.observe(key, 200, 200, 0.15) == 400
+    assert tuner.observe(key, 400, 400, 0.2, limit=500) == 500
+
+    # THEN - a larger page bringing fewer items per second should settle on the best size
+    assert tuner.observe(key, 500, 500, 0.5) == 400
+    assert tuner.observe(key, 400, 400, 0.2) == 400
+
+    # THEN - a slow page should shrink the size towards the target latency
+    assert tuner.observe(key, 400, 400, 4.0) == 100
+
+    # THEN - the last (short) page should be ignored, response bytes should cap the size
+    assert tuner.observe(key, 100, 7, 0.01) == 100
+    tuner.max_bytes = 50000
+    assert tuner.observe(key, 100, 100, 0.01, response_bytes=100000) == 50
+
+
+def test_page_size_tuner_recovers_after_slow_spell():
+    # GIVEN - a tuner grown to 800 items per page, lifting its cap after 3 fast pages
+    tuner = PageSizeTuner(seed=100, target_latency=1.0, recover_after=3)
+    key = tuner.get_key("GET", "device/devices")
+    for size in (100, 200, 400):
+        tuner.observe(key, size, size, size / 1000)
+    assert tuner.get_size(key) == 800
+
+    # WHEN - one page is slow, then the latency improves again
+    assert tuner.observe(key, 800, 800, 4.0) == 200
+    sizes = [tuner.observe(key, 200, 200, 0.1) for _ in range(3)]
+
+    # THEN - the size should be held for a few pages, then grow again past the slow page's cap
+    assert sizes == [200, 200, 400]
+    assert tuner.observe(key, 400, 400, 0.2) == 800
+
+
+def test_offset_paginator_tuned_page_sizes(mock_api_consumer_all, tmp_path):
+    # GIVEN - a consumer whose pages take 0.1ms per item, and a tuner aiming for 20ms pages
+    class SizedConsumer(mock_api_consumer_all):
+        sizes = []
+
+        def _make_request(self, method: str, path: str, **kwargs):
+            size = kwargs["params"]["size"]
+            self.sizes.append(size)
+            time.sleep(size * 0.0001)
+            return super()._make_request(method, path, **kwargs)
+
+    consumer = SizedConsumer("https://test.com")
+    state_file = str(tmp_path / "page_sizes.json")
+    tuner = PageSizeTuner(seed=25, target_latency=0.02, state_file=state_file)
+    paginator = OffsetPaginator(
+        size_value=100,
+        items_key="items",
+        page_size_tuner=tuner,
+        max_size_value=300,
+    )
+
+    # WHEN - all pages are fetched
+    results = paginator.all(consumer, "GET", "/test")
+
+    # THEN - every item should be returned once while the page size adapts within the maximum
+    # (the mock consumer does not cut the last page at the total)
+    assert [item["id"] for item in results] == list(range(len(results)))
+    assert len(results) >= 1000
+    assert consumer.sizes[:3] == [25, 50, 100]
+    assert max(consumer.sizes) <= 300
+
+    # THEN - the size reached should be saved and used by the next run
+    with open(state_file, encoding="utf-8") as f:
+        saved = json.load(f)
+    assert saved["GET test"] == tuner.sizes()["GET test"] > 25
+    consumer.sizes = []
+    pages = OffsetPaginator(
+        size_value=100,
+        items_key="items",
+        page_size_tuner=PageSizeTuner(seed=25, state_file=state_file),
+    ).paginate(consumer, "GET", "/test")
+    next(pages)
+    assert consumer.sizes == [saved["GET test"]]
+
+
+def test_offset_paginator_tuner_ignores_throttle_wait(mock_api_consumer_all):
+    # GIVEN - a consumer throttled for 30ms before every request, whose pages take 0.1ms per item to serve
+    class Throttle:
+        def wait(self, method: str, path: str):
+            time.sleep(0.03)
+
+        def observe(self, method: str, path: str, headers):
+            pass
+
+    class ThrottledConsumer(mock_api_consumer_all):
+        _make_request = ApiConsumer._make_request
+        sizes = []
+
+        def __init__(self, base_url: str):
+            ApiConsumer.__init__(self, base_url, throttle=Throttle())
+
+        def _send(self, method: str, path: str, headers: dict, **kwargs):
+            size = kwargs["params"]["size"]
+            self.sizes.append(size)
+            time.sleep(size * 0.0001)
+            body = mock_api_consumer_all._make_request(self, method, path, **kwargs)
+            return Mock(status_code=200, content=json.dumps(body).encode(), headers={})
+
+    consumer = ThrottledConsumer("https://test.com")
+    tuner = PageSizeTuner(seed=25, target_latency=0.02)
+    paginator = OffsetPaginator(
+        size_value=100, items_key="items", page_size_tuner=tuner
+    )
+
+    # WHEN - the first pages are fetched
+    pages = paginator.paginate(consumer, "GET", "/test")
+    for _ in range(3):
+        next(pages)
+    pages.close()
+
+    # THEN - the pages should grow from their service time, the throttle wait should not make them look slow
+    assert consumer.sizes == [25, 50, 100]
+    assert consumer.last_response_elapsed() < 0.02
+
+
+def test_iter_items_checkpoint_resume(mock_api_consumer_keyset, tmp_path):
+    # GIVEN - an offset paginator and a checkpoint file
+    consumer = mock_api_consumer_keyset("https://test.com")
+    paginator = OffsetPaginator(size_value=100, items_key="items")
+    checkpoint_file = str(tmp_path / "export.json")
+
+    # WHEN - the export is interrupted part way through the fourth page
+    items = paginator.iter_items(
+        consumer, "GET", "/test", checkpoint=Checkpoint(checkpoint_file)
+    )
+    delivered = [next(items)["id"] for _ in range(350)]
+    items.close()
+
+    # THEN - the three pages completed should be recorded
+    with open(checkpoint_file, encoding="utf-8") as f:
+        state = json.load(f)
+    assert (state["pages"], state["items"], state["complete"]) == (3, 300, False)
+    assert state["next_params"] == {"size": 100, "offset": 300}
+
+    # WHEN - the export is resumed
+    consumer.requested = []
+    checkpoint = Checkpoint(checkpoint_file)
+    resumed = [
+        item["id"]
+        for item in paginator.iter_items(
+            consumer, "GET", "/test", checkpoint=checkpoint, resume=True
+        )
+    ]
+
+    # THEN - it should continue from the fourth page without gaps, repeating only the page interrupted
+    assert resumed == list(range(300, 1000))
+    assert sorted(set(delivered) | set(resumed)) == list(range(1000))
+    assert consumer.requested[0] == {"size": "100", "offset": "300"}
+    assert checkpoint.complete
+    assert checkpoint.state["items"] == 1000
+
+    # THEN - the fingerprint should match an uninterrupted export
+    full = Checkpoint(str(tmp_path / "full.json"))
+    list(paginator.iter_items(consumer, "GET", "/test", checkpoint=full))
+    assert checkpoint.state["fingerprint"] == full.state["fingerprint"]
+
+    # WHEN - a completed export is resumed
+    consumer.requested = []
+    again = paginator.iter_items(
+        consumer, "GET", "/test", checkpoint=Checkpoint(checkpoint_file), resume=True
+    )
+
+    # THEN - nothing should be requested or delivered
+    assert list(again) == []
+    assert consumer.requested == []
+
+
+def test_checkpoint_resume_same_params(mock_api_consumer_keyset, tmp_path):
+    # GIVEN - a consumer failing on the fourth page and the params dict of the caller
+    class FailingConsumer(mock_api_consumer_keyset):
+        fail_at = 300
+
+        def _make_request(self, method: str, path: str, **kwargs):
+            if f"offset={self.fail_at}" in path:
+                raise HTTPError(500, "Server Error")
+            return super()._make_request(method, path, **kwargs)
+
+    consumer = FailingConsumer("https://test.com")
+    paginator = OffsetPaginator(size_value=100, items_key="items")
+    checkpoint_file = str(tmp_path / "export.json")
+    params = {"filter": "name~Item"}
+
+    # WHEN - the export fails part way
+    with pytest.raises(HTTPError):
+        paginator.all(
+            consumer,
+            "GET",
+            "/test",
+            checkpoint=Checkpoint(checkpoint_file),
+            params=params,
+        )
+
+    # THEN - the params of the caller should be left as they were
+    assert params == {"filter": "name~Item"}
+
+    # WHEN - the export is resumed in the same process with the same params
+    consumer.fail_at = None
+    items = paginator.all(
+        consumer,
+        "GET",
+        "/test",
+        checkpoint=Checkpoint(checkpoint_file),
+        resume=True,
+        params=params,
+    )
+
+    # THEN - it should continue from the page that failed
+    assert [item["id"] for item in items] == list(range(300, 1000))
+
+
+def test_checkpoint_resume_other_request(mock_api_consumer_keyset, tmp_path):
+    # GIVEN - a checkpoint of an export with a filter
+    consumer = mock_api_consumer_keyset("https://test.com")
+    paginator = OffsetPaginator(size_value=100, items_key="items")
+    checkpoint_file = str(tmp_path / "export.json")
+    paginator.all(
+        consumer,
+        "GET",
+        "/test",
+        params={"filter": "id>10"},
+        checkpoint=Checkpoint(checkpoint_file),
+    )
+
+    # THEN - resuming an export with other params should be refused
+    with pytest.raises(ValueError):
+        paginator.all(
+            consumer,
+            "GET",
+            "/test",
+            params={"filter": "id>20"},
+            checkpoint=Checkpoint(checkpoint_file),
+            resume=True,
+        )
+
+    # THEN - a checkpoint should not be combined with parallel pages
+    with pytest.raises(ValueError):
+        paginator.all(
+            consumer,
+            "GET",
+            "/test",
+            max_workers=4,
+            checkpoint=Checkpoint(checkpoint_file),
+        )
+
+
+def test_paginate_checkpoint_with_prefetch(mock_api_consumer_keyset, tmp_path):
+    # GIVEN - a keyset paginator reading 3 pages ahead
+    consumer = mock_api_consumer_keyset("https://test.com")
+    paginator = KeysetPaginator(size_value=100, items_key="items")
+    checkpoint_file = str(tmp_path / "export.json")
+
+    # WHEN - the export stops while the third page is processed
+    pages = paginator.paginate(
+        consumer, "GET", "/test", prefetch=3, checkpoint=Checkpoint(checkpoint_file)
+    )
+    for _ in range(3):
+        next(pages)
+    pages.close()
+
+    # THEN - only the pages the caller finished with should be recorded, not the pages read ahead
+    assert len(consumer.requested) > 3
+    with open(checkpoint_file, encoding="utf-8") as f:
+        state = json.load(f)
+    assert state["pages"] == 2
+    assert state["next_params"]["filter"] == "id>199"
+
+    # WHEN - the export is resumed
+    items = paginator.all(
+        consumer, "GET", "/test", checkpoint=Checkpoint(checkpoint_file), resume=True
+    )
+
+    # THEN - it should continue after the last key recorded
+    assert [item["id"] for item in items] == list(range(200, 1000))
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_offset_paginator_all_sink(mock_api_consumer_keyset, tmp_path, compress):
+    # GIVEN - a sink writing 1KB blocks and starting a new file after 2KB
+    consumer = mock_api_consumer_keyset("https://test.com")
+    paginator = OffsetPaginator(size_value=100, items_key="items")
+    sink = JsonlSink(
+        str(tmp_path / "devices"),
+        rotate_bytes=2048,
+        compress=compress,
+        buffer_size=1024,
+    )
+
+    # WHEN - all pages are fetched into the sink
+    manifest = paginator.all(consumer, "GET", "/test", sink=sink)
+
+    # THEN - the manifest should count every item across the rotated files
+    assert manifest["items"] == sum(entry["items"] for entry in manifest["files"])
+    assert manifest["items"] == 1000
+    assert len(manifest["files"]) > 1
+    assert all(entry["bytes"] < 2048 + 1024 for entry in manifest["files"])
+
+    # THEN - the files should be plain (or gzip) JSON lines
+    first_file = str(tmp_path / manifest["files"][0]["path"])
+    opener = gzip.open if compress else open
+    with opener(first_file, "rb") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == manifest["files"][0]["items"]
+    assert json.loads(lines[0]) == {"id": 0, "name": "Item 0"}
+
+    # THEN - the items should be read back lazily, from the start or from any item
+    assert [item["id"] for item in sink.read()] == list(range(1000))
+    assert [item["id"] for item in iter_jsonl(sink.manifest_path, start=537)] == list(
+        range(537, 1000)
+    )
+
+
+def test_jsonl_sink_resume(tmp_path):
+    # GIVEN - a sink flushed after 100 and 200 items, then writing blocks past its manifest before a crash
+    path = str(tmp_path / "export")
+    sink = JsonlSink(path, buffer_size=512)
+    for flushed in (100, 200):
+        sink.write_many({"id": i} for i in range(flushed - 100, flushed))
+        sink.flush()
+    sink.write_many({"id": i} for i in range(200, 250))
+    sink._file.close()
+
+    # THEN - resuming inside a block should be refused
+    with pytest.raises(ValueError):
+        JsonlSink(path).resume(150 + 1)
+
+    # WHEN - a new sink resumes after 200 items and writes the rest
+    sink = JsonlSink(path, buffer_size=512)
+    sink.resume(200)
+    sink.write_many({"id": i} for i in range(200, 300))
+    manifest = sink.close()
+
+    # THEN - the items written after the manifest should be dropped, nothing repeated
+    assert manifest["items"] == 300
+    assert [item["id"] for item in sink.read()] == list(range(300))
+
+    # THEN - an unknown fsync policy should be refused
+    with pytest.raises(ValueError):
+        JsonlSink(path, fsync="sometimes")
+
+
+@pytest.mark.parametrize("truncate", [True, False])
+def test_jsonl_sink_damaged_file(tmp_path, truncate):
+    # GIVEN - a sink whose file lost its last bytes, or its final newline, after the manifest was written
+    sink = JsonlSink(str(tmp_path / "export"))
+    sink.write_many({"id": i} for i in range(100))
+    manifest = sink.close()
+    with open(tmp_path / manifest["files"][0]["path"], "r+b") as f:
+        if truncate:
+            f.truncate(manifest["files"][0]["bytes"] - 100)
+        else:
+            f.seek(-1, 2)
+            f.write(b" ")
+
+    # THEN - reading it should fail rather than loop forever or drop items silently
+    with pytest.raises(ValueError):
+        list(sink.read())
+
+
+def test_export_sink_checkpoint_resume(mock_api_consumer_keyset, tmp_path):
+    # GIVEN - a consumer failing on the fifth page, a checkpoint and a gzip sink
+    class FailingConsumer(mock_api_consumer_keyset):
+        fail_at = 400
+
+        def _make_request(self, method: str, path: str, **kwargs):
+            if f"offset={self.fail_at}" in path:
+                raise HTTPError(500, "Server Error")
+            return super()._make_request(method, path, **kwargs)
+
+    consumer = FailingConsumer("https://test.com")
+    paginator = OffsetPaginator(size_value=100, items_key="items")
+    checkpoint_file = str(tmp_path / "export.json")
+    path = str(tmp_path / "devices")
+
+    def export(resume: bool) -> dict:
+        return paginator.all(
+            consumer,
+            "GET",
+            "/test",
+            checkpoint=Checkpoint(checkpoint_file),
+            resume=resume,
+            sink=JsonlSink(path, compress=True, buffer_size=1000, fsync="flush"),
+        )
+
+    # WHEN - the export fails part way
+    with pytest.raises(HTTPError):
+        export(resume=False)
+
+    # THEN - the sink should hold the pages the checkpoint recorded
+    with open(checkpoint_file, encoding="utf-8") as f:
+        assert json.load(f)["items"] == 400
+    assert [item["id"] for item in iter_jsonl(f"{path}.manifest.json")] == list(
+        range(400)
+    )
+
+    # WHEN - the export is resumed
+    consumer.fail_at = None
+    manifest = export(resume=True)
+
+    # THEN - the files should hold every item once
+    assert manifest["items"] == 1000
+    assert [item["id"] for item in iter_jsonl(f"{path}.manifest.json")] == list(
+        range(1000)
+    )
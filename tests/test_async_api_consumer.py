@@ -0,0 +1,134 @@
+import asyncio
+import pytest
+import httpx
+from api_client_base.core.exceptions import (
+    HTTPError,
+    ConnectionError,
+    TimeoutError,
+    RequestError,
+    UnexcpectedError,
+)
+from api_client_base.models.pool_config import PoolConfig
+from .fixtures.async_consumer import (
+    MockAsyncApiConsumer,
+    mock_async_api_consumer,
+    use_transport,
+)
+
+"""
+These tests are for the AsyncApiConsumer Base Class.
+Requests are answered by an httpx.MockTransport so no network is used.
+"""
+
+
+@pytest.mark.parametrize("method", ["get", "post", "put", "patch", "delete"])
+def test_common_methods(mock_async_api_consumer, method):
+    # WHEN - a request is made with each method
+    response = asyncio.run(getattr(mock_async_api_consumer, method)("test/path"))
+
+    # THEN - the request should be sent with the method, path and default headers
+    assert response["method"] == method.upper()
+    assert response["path"] == "/test/path"
+    assert response["headers"]["content-type"] == "application/json"
+    assert response["headers"]["accept"] == "application/json"
+
+
+def test_request_headers_do_not_mutate_instance(mock_async_api_consumer):
+    # WHEN - a request is made with per request headers
+    response = asyncio.run(
+        mock_async_api_consumer.get("test/path", headers={"X-Test": "value"})
+    )
+
+    # THEN - the header should be sent but not stored on the consumer
+    assert response["headers"]["x-test"] == "value"
+    assert "X-Test" not in mock_async_api_consumer.headers
+
+
+def test_request_headers_take_precedence(mock_async_api_consumer):
+    # WHEN - a request overrides one of the instance headers
+    response = asyncio.run(
+        mock_async_api_consumer.get("test/path", headers={"Accept": "text/csv"})
+    )
+
+    # THEN - the per request header should be sent and the instance header kept
+    assert response["headers"]["accept"] == "text/csv"
+    assert mock_async_api_consumer.headers["Accept"] == "application/json"
+
+
+def test_concurrent_requests(mock_async_api_consumer):
+    # WHEN - many requests are in flight on the same event loop
+    async def run():
+        return await asyncio.gather(
+            *(mock_async_api_consumer.get(f"item/{i}") for i in range(1000))
+        )
+
+    responses = asyncio.run(run())
+
+    # THEN - every response should match its request
+    assert [r["path"] for r in responses] == [f"/item/{i}" for i in range(1000)]
+
+
+def test_pool_config_limits():
+    # GIVEN - a consumer with a blocking pool config
+    consumer = MockAsyncApiConsumer(
+        "https://example.com",
+        pool_config=PoolConfig(pool_maxsize=25, pool_block=True, idle_timeout=30),
+    )
+
+    # THEN - the client pool should be limited by the pool config
+    pool = consumer.client._transport._pool
+    assert pool._max_connections == 25
+    assert pool._max_keepalive_connections == 25
+    assert pool._keepalive_expiry == 30
+
+
+def test_context_manager():
+    # WHEN - the consumer is used as an async context manager
+    async def run():
+        async with MockAsyncApiConsumer("https://example.com") as consumer:
+            assert not consumer.client.is_closed
+        return consumer
+
+    consumer = asyncio.run(run())
+
+    # THEN - the client should be closed on exit
+    assert consumer.client.is_closed
+
+
+def raise_error(error):
+    def handler(request):
+        raise error
+
+    return handler
+
+
+@pytest.mark.parametrize(
+    "handler, exception",
+    [
+        (lambda request: httpx.Response(404), HTTPError),
+        (raise_error(httpx.ConnectError("refused")), ConnectionError),
+        (raise_error(httpx.ReadTimeout("slow")), TimeoutError),
+        (raise_error(httpx.TooManyRedirects("loop")), RequestError),
+        (raise_error(ValueError("boom")), UnexcpectedError),
+    ],
+)
+def test_exceptions(handler, exception):
+    # GIVEN - a consumer whose transport fails
+    consumer = use_transport(MockAsyncApiConsumer("https://example.com"), handler)
+
+    # THEN - the matching core exception should be raised
+    with pytest.raises(exception):
+        asyncio.run(consumer.get("test/path"))
+
+
+def test_http_error_status_code():
+    # GIVEN - a consumer whose transport returns a 503
+    consumer = use_transport(
+        MockAsyncApiConsumer("https://example.com"),
+        lambda request: httpx.Response(503),
+    )
+
+    # THEN - the status code should be kept on the exception
+    with pytest.raises(HTTPError) as excinfo:
+        asyncio.run(consumer.get("test/path"))
+    assert excinfo.value.status_code == 503
@@ -0,0 +1,198 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from api_client_base.core.checkpoint import Checkpoint
+from api_client_base.core.jsonl_sink import JsonlSink
+from api_client_base.implementations.async_logicmonitor import (
+    AsyncLogicMonitorClient,
+)
+from api_client_base.implementations.async_basic_token import AsyncBasicTokenClient
+from .fixtures.async_consumer import use_transport
+
+"""
+These test cases are for the AsyncLogicMonitorClient and AsyncBasicTokenClient classes.
+They test the initialization, the per request signing and pagination over a mocked transport.
+"""
+
+
+class TestAsyncLogicMonitorClient:
+    @pytest.fixture
+    def pylogicmonitor(self):
+        return use_transport(
+            AsyncLogicMonitorClient(
+                company="testcompany", access_id="testid", api_key="testkey"
+            )
+        )
+
+    def test_initialization(self, pylogicmonitor):
+        # THEN - The base_url and headers should be set correctly
+        assert (
+            pylogicmonitor.base_url
+            == "https://testcompany.logicmonitor.com/santaba/rest"
+        )
+        assert pylogicmonitor.headers == {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "X-Version": "3",
+        }
+
+    @patch.object(
+        AsyncLogicMonitorClient, "_calculate_epoch", return_value="1625254875000"
+    )
+    def test_request_is_signed(self, mock_epoch, pylogicmonitor):
+        # WHEN - a POST request is made
+        response = asyncio.run(
+            pylogicmonitor.post("device/devices", json={"key": "value"})
+        )
+
+        # THEN - the signature should be sent with the request
+        request_vars, epoch = pylogicmonitor._format_request_vars(
+            "POST", "device/devices", {"key": "value"}
+        )
+        signature = pylogicmonitor._construct_signature(request_vars)
+        assert (
+            response["headers"]["authorization"]
+            == f"LMv1 testid:{signature}:1625254875000"
+        )
+        assert response["body"] == {"key": "value"}
+
+        # THEN - the signature should not be stored on the client
+        assert "Authorization" not in pylogicmonitor.headers
+
+    def test_get_all(self, pylogicmonitor):
+        # WHEN - all pages are requested
+        items = asyncio.run(pylogicmonitor.get("device/devices", all=True))
+
+        # THEN - every item should be returned in order
+        assert [item["id"] for item in items] == list(range(1000))
+
+    def test_count(self, pylogicmonitor):
+        # WHEN - the items are counted
+        count = asyncio.run(pylogicmonitor.count("device/devices"))
+
+        # THEN - the total should be returned
+        assert count == 1000
+
+
+class TestAsyncBasicTokenClient:
+    @pytest.mark.parametrize("method", ["get", "post", "put", "patch", "delete"])
+    def test_methods_send_token(self, method):
+        # GIVEN - an AsyncBasicTokenClient
+        client = use_transport(
+            AsyncBasicTokenClient(base_path="example.com/api/v1", api_key="mYApiK3Y12")
+        )
+
+        # WHEN - a request is made
+        response = asyncio.run(getattr(client, method)("test/path"))
+
+        # THEN - the token header should be sent
+        assert response["method"] == method.upper()
+        assert response["path"] == "/api/v1/test/path"
+        assert response["headers"]["x-apikey"] == "mYApiK3Y12"
+
+
+def test_async_get_all_concurrent():
+    # GIVEN - an async LogicMonitor client
+    client = use_transport(
+        AsyncLogicMonitorClient(
+            company="testcompany", access_id="testid", api_key="testkey"
+        )
+    )
+
+    # WHEN - all pages are requested concurrently
+    items = asyncio.run(client.get("device/devices", all=True, max_workers=4))
+
+    # THEN - every item should be returned in offset order
+    assert [item["id"] for item in items] == list(range(1000))
+
+
+@pytest.fixture
+def async_client():
+    return use_transport(
+        AsyncLogicMonitorClient(
+            company="testcompany", access_id="testid", api_key="testkey"
+        )
+    )
+
+
+def test_async_paginate_and_iter_items(async_client):
+    # WHEN - the pages and the items are iterated with async for
+    async def run():
+        pages = [
+            page
+            async for page in async_client.paginate(
+                async_client, "GET", "device/devices", params={"size": 250}
+            )
+        ]
+        items = [
+            item
+            async for item in async_client.iter_items(
+                async_client, "GET", "device/devices"
+            )
+        ]
+        return pages, items
+
+    pages, items = asyncio.run(run())
+
+    # THEN - every page and item should be returned in order
+    assert len(pages) == 1000 // async_client.size_value
+    assert [item["id"] for item in items] == list(range(1000))
+
+
+def test_async_checkpoint_resume(async_client, tmp_path):
+    # GIVEN - an export stopped while its second page was processed
+    checkpoint_file = str(tmp_path / "devices.json")
+
+    async def first_pages():
+        pages = async_client.paginate(
+            async_client,
+            "GET",
+            "device/devices",
+            checkpoint=Checkpoint(checkpoint_file),
+        )
+        async for page in pages:
+            if page["items"][0]["id"] == async_client.size_value:
+                break
+        await pages.aclose()
+
+    asyncio.run(first_pages())
+
+    # WHEN - the export is resumed
+    items = asyncio.run(
+        async_client.get(
+            "device/devices",
+            all=True,
+            checkpoint=Checkpoint(checkpoint_file),
+            resume=True,
+        )
+    )
+
+    # THEN - only the items after the first page recorded should be returned
+    assert [item["id"] for item in items] == list(range(async_client.size_value, 1000))
+
+
+def test_async_export_sink(async_client, tmp_path):
+    # WHEN - all pages are written to a sink
+    sink = JsonlSink(str(tmp_path / "devices"))
+    manifest = asyncio.run(async_client.get("device/devices", all=True, sink=sink))
+
+    # THEN - every item should be on disk
+    assert manifest["items"] == 1000
+    assert [item["id"] for item in sink.read()] == list(range(1000))
+
+
+@pytest.mark.parametrize("argument", [{"prefetch": 2}, {"stream": True}])
+def test_async_paging_rejects_unsupported(async_client, argument):
+    # THEN - thread or stream based arguments should be refused rather than ignored
+    async def run():
+        return [
+            item
+            async for item in async_client.iter_items(
+                async_client, "GET", "device/devices", **argument
+            )
+        ]
+
+    with pytest.raises(TypeError):
+        asyncio.run(run())
+    with pytest.raises(TypeError):
+        asyncio.run(async_client.get("device/devices", all=True, **argument))
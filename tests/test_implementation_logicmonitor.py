@@ -1,7 +1,7 @@
 import pytest
 import json
 import hashlib
-from unittest.mock import patch
+from unittest.mock import patch, ANY
 import time
 from api_client_base.implementations.logicmonitor import LogicMonitorClient
 
@@ -210,13 +210,16 @@ class TestLogicMonitorClient:
         # Check that _construct_headers was called with the correct signature and epoch
         mock_construct_headers.assert_called_once_with("signature", "1625254875000")
 
-        # Check that update_headers was called with the correct headers
-        mock_update_headers.assert_called_once_with(
-            {"Authorization": "LMv1 testid:signature:1625254875000"}
-        )
+        # Check that the shared headers were not modified
+        mock_update_headers.assert_not_called()
+        assert "Authorization" not in pylogicmonitor.headers
 
-        # Check that the decorated method (common_get) was called with the correct arguments
-        mock_common_get.assert_called_once_with(path, **kwargs)
+        # Check that the decorated method (common_get) was called with the signature as a per request header
+        mock_common_get.assert_called_once_with(
+            path,
+            json={},
+            headers={"Authorization": "LMv1 testid:signature:1625254875000"},
+        )
 
     # test abstracted methods
     @patch.object(LogicMonitorClient, "common_post")
@@ -231,7 +234,9 @@ class TestLogicMonitorClient:
         response = pylogicmonitor.post("/test-path", json={"key": "value"})
 
         # THEN: Ensure the common_post method is called with the correct arguments
-        mock_common_post.assert_called_once_with("/test-path", json={"key": "value"})
+        mock_common_post.assert_called_once_with(
+            "/test-path", data=b'{"key": "value"}', headers={"Authorization": ANY}
+        )
         # AND: Check that the response is what we mocked
         assert response == {"status": "success"}
 
@@ -247,7 +252,9 @@ class TestLogicMonitorClient:
         response = pylogicmonitor.put("/test-path", json={"key": "value"})
 
         # THEN: Ensure the common_put method is called with the correct arguments
-        mock_common_put.assert_called_once_with("/test-path", json={"key": "value"})
+        mock_common_put.assert_called_once_with(
+            "/test-path", data=b'{"key": "value"}', headers={"Authorization": ANY}
+        )
         # AND: Check that the response is what we mocked
         assert response == {"status": "success"}
 
@@ -263,7 +270,9 @@ class TestLogicMonitorClient:
         response = pylogicmonitor.patch("/test-path", json={"key": "value"})
 
         # THEN: Ensure the common_patch method is called with the correct arguments
-        mock_common_patch.assert_called_once_with("/test-path", json={"key": "value"})
+        mock_common_patch.assert_called_once_with(
+            "/test-path", data=b'{"key": "value"}', headers={"Authorization": ANY}
+        )
         # AND: Check that the response is what we mocked
         assert response == {"status": "success"}
 
@@ -279,7 +288,9 @@ class TestLogicMonitorClient:
         response = pylogicmonitor.delete("/test-path")
 
         # THEN: Ensure the common_delete method is called with the correct arguments
-        mock_common_delete.assert_called_once_with("/test-path")
+        mock_common_delete.assert_called_once_with(
+            "/test-path", headers={"Authorization": ANY}
+        )
         # AND: Check that the response is what we mocked
         assert response == {"status": "success"}
 
@@ -295,7 +306,9 @@ class TestLogicMonitorClient:
         response = pylogicmonitor.get("/test-path")
 
         # THEN: Ensure the common_get method is called with the correct arguments
-        mock_common_get.assert_called_once_with("/test-path")
+        mock_common_get.assert_called_once_with(
+            "/test-path", headers={"Authorization": ANY}
+        )
         # AND: Check that the response is what we mocked
         assert response == {"status": "success"}
 
@@ -358,3 +371,115 @@ class TestLogicMonitorClient:
         )
         # AND: Check that the count is what we mocked
         assert count == 10
+
+    @patch.object(LogicMonitorClient, "all")
+    def test_get_all_passes_max_workers(self, mock_all, pylogicmonitor):
+        # GIVEN - a mocked all method
+        mock_all.return_value = [{"id": 1}]
+
+        # WHEN - all pages are requested with several workers
+        response = pylogicmonitor.get(
+            "device/devices", all=True, max_workers=8, params={"filter": "x"}
+        )
+
+        # THEN - all should be called with the worker count
+        mock_all.assert_called_once_with(
+            pylogicmonitor,
+            "GET",
+            "device/devices",
+            max_workers=8,
+            params={"filter": "x"},
+            headers={"Authorization": ANY},
+        )
+        assert response == [{"id": 1}]
+
+    @patch.object(LogicMonitorClient, "_make_request")
+    def test_get_all_keyset(self, mock_make_request, pylogicmonitor):
+        # GIVEN - a collection of 150 devices served 100 per page
+        def make_request(method, path, params, **kwargs):
+            after = (
+                int(params["filter"].split("id>")[1])
+                if "id>" in params.get("filter", "")
+                else -1
+            )
+            ids = range(after + 1, min(after + 1 + params["size"], 150))
+            return {"total": 150, "items": [{"id": i} for i in ids]}
+
+        mock_make_request.side_effect = make_request
+
+        # WHEN - all pages are requested by keyset
+        response = pylogicmonitor.get(
+            "device/devices", all=True, keyset=True, params={"filter": "x"}
+        )
+
+        # THEN - the pages should be sorted and filtered by id
+        assert [item["id"] for item in response] == list(range(150))
+        assert mock_make_request.call_args_list[1].kwargs["params"] == {
+            "filter": "x,id>99",
+            "size": 100,
+            "sort": "id",
+        }
+        assert mock_make_request.call_args.kwargs["headers"] == {"Authorization": ANY}
+
+    @patch.object(LogicMonitorClient, "iter_items")
+    def test_get_iter_items(self, mock_iter_items, pylogicmonitor):
+        # GIVEN - a mocked item generator
+        mock_iter_items.return_value = iter([{"id": 1}, {"id": 2}])
+
+        # WHEN - the items are requested one at a time
+        response = pylogicmonitor.get(
+            "device/devices", iter_items=True, params={"filter": "x"}
+        )
+
+        # THEN - iter_items should be called for a GET
+        mock_iter_items.assert_called_once_with(
+            pylogicmonitor,
+            "GET",
+            "device/devices",
+            params={"filter": "x"},
+            headers={"Authorization": ANY},
+        )
+        assert list(response) == [{"id": 1}, {"id": 2}]
+
+    @patch.object(
+        LogicMonitorClient, "_calculate_epoch", return_value="1625254875000"
+    )  # Mock epoch value
+    def test_format_request_vars_encoded_body(self, mock_epoch, pylogicmonitor):
+        # GIVEN - an already encoded body
+        body = b'{"name": "caf\xc3\xa9"}'
+
+        # WHEN - the request variables are formatted
+        request_vars, epoch = pylogicmonitor._format_request_vars(
+            "PATCH", "device/devices/1", body
+        )
+
+        # THEN - the body bytes should be used as is
+        assert request_vars == b"PATCH1625254875000" + body + b"device/devices/1"
+        assert epoch == "1625254875000"
+
+    @patch("requests.Session.request")
+    def test_body_is_encoded_once_and_signed_as_sent(
+        self, mock_request, pylogicmonitor
+    ):
+        # GIVEN - a large payload
+        payload = {"items": [{"id": i, "name": f"device {i}"} for i in range(1000)]}
+
+        # WHEN - a PUT request is made
+        mock_request.return_value.content = b"{}"
+        with patch("json.dumps", wraps=json.dumps) as mock_dumps:
+            pylogicmonitor.put("device/devices/1", json=payload)
+
+        # THEN - the payload should have been serialized exactly once
+        mock_dumps.assert_called_once()
+
+        # THEN - the encoded body should be sent instead of json
+        kwargs = mock_request.call_args.kwargs
+        assert "json" not in kwargs
+        assert json.loads(kwargs["data"]) == payload
+
+        # THEN - the signature should cover the exact bytes sent
+        epoch = kwargs["headers"]["Authorization"].split(":")[-1]
+        signature = pylogicmonitor._construct_signature(
+            f"PUT{epoch}".encode("utf-8") + kwargs["data"] + b"device/devices/1"
+        )
+        assert kwargs["headers"]["Authorization"] == f"LMv1 testid:{signature}:{epoch}"
@@ -0,0 +1,36 @@
+from concurrent.futures import ThreadPoolExecutor
+from api_client_base.implementations.logicmonitor import LogicMonitorClient
+from api_client_base.models.pool_config import PoolConfig
+from .fixtures.logicmonitor_standin import logicmonitor_standin, API_KEY, ACCESS_ID
+
+"""
+Concurrency stress test for the LogicMonitorClient.
+One client is shared by a thread pool, and a local stand-in server checks the signature of every request.
+"""
+
+
+def test_shared_client_signatures_are_per_request(logicmonitor_standin):
+    # GIVEN - one client pointed at the stand-in, shared by a thread pool
+    client = LogicMonitorClient(
+        company="testcompany",
+        access_id=ACCESS_ID,
+        api_key=API_KEY,
+        pool_config=PoolConfig(pool_maxsize=16),
+    )
+    client.base_url = logicmonitor_standin
+
+    def call(i: int):
+        # mix methods, paths and bodies so any shared signature would be rejected
+        if i % 2:
+            return client.get(f"device/devices/{i}")
+        return client.patch(f"device/devices/{i}", json={"displayName": f"d{i}"})
+
+    # WHEN - many requests are made at once
+    with client, ThreadPoolExecutor(max_workers=16) as executor:
+        responses = list(executor.map(call, range(400)))
+
+    # THEN - every signature should have matched its own request
+    assert [r["path"] for r in responses] == [f"device/devices/{i}" for i in range(400)]
+
+    # THEN - the shared headers should never have held a signature
+    assert "Authorization" not in client.headers